@@ -1,23 +1,49 @@
 import os
 import sys
+import atexit
+import logging
+import logging.handlers
+import queue
+import orjson
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from flask import Flask, send_from_directory
 from flask_cors import CORS
+from flask_compress import Compress
 from src.models.user import db
+from src.json_provider import OrjsonProvider
 from src.models.requirement import Requirement, TestCase, TraceabilityLink
+from src.models.alm_config import AlmConfig
 from src.routes.user import user_bp
 from src.routes.requirements import requirements_bp
 
+# Log records are queued and written by a background thread, so request and
+# AI worker threads never block on stderr
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 app.config['SECRET_KEY'] = 'asdf#FGSgvasgf$5$WGT'
+app.json = OrjsonProvider(app)
 
 # Enable CORS for all routes
 CORS(app, origins="*")
 
+# Compress JSON responses over 1 KB (brotli when the client accepts it).
+# Streamed responses (e.g. the compliance report) are left alone, since
+# compressing them would buffer the whole body first
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_STREAMS'] = False
+Compress(app)
+
 from src.routes.integrations import integrations_bp
-from src.routes.compliance import compliance_bp
+from src.routes.compliance import compliance_bp, compliance_engine
 
 app.register_blueprint(user_bp, url_prefix='/api')
 app.register_blueprint(requirements_bp, url_prefix='/api')
@@ -27,10 +53,18 @@ app.register_blueprint(compliance_bp, url_prefix='/api')
 # uncomment if you need to use database
 app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# (De)serialize native JSON columns with orjson
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'json_serializer': lambda obj: orjson.dumps(obj).decode(),
+    'json_deserializer': orjson.loads
+}
 db.init_app(app)
 with app.app_context():
     db.create_all()
 
+# Start the compliance report workers now, not inside the first large report request
+compliance_engine.start_report_workers()
+
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
 def serve(path):
@@ -0,0 +1,54 @@
+import os
+from datetime import datetime
+from cryptography.fernet import Fernet
+from src.models.user import db
+
+
+def _fernet():
+    """
+    Cipher for stored ALM credentials, keyed by ALM_CONFIG_ENCRYPTION_KEY (a
+    Fernet key). Credentials are neither stored nor read without it.
+    """
+    key = os.environ.get('ALM_CONFIG_ENCRYPTION_KEY')
+    if not key:
+        raise RuntimeError('ALM_CONFIG_ENCRYPTION_KEY is not set; ALM credentials cannot be stored or read')
+    return Fernet(key)
+
+
+class AlmConfig(db.Model):
+    __tablename__ = 'alm_configs'
+
+    id = db.Column(db.String(150), primary_key=True)  # config_id, e.g. "jira_PROJ"
+    platform = db.Column(db.String(50), nullable=False)
+    base_url = db.Column(db.String(500), nullable=False)
+    username = db.Column(db.String(200), nullable=False)
+    password_encrypted = db.Column(db.Text, nullable=False)
+    project_key = db.Column(db.String(100))
+    enabled = db.Column(db.Boolean, nullable=False, default=True)
+    connection_status = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def set_password(self, password):
+        self.password_encrypted = _fernet().encrypt(password.encode()).decode()
+
+    def get_password(self):
+        return _fernet().decrypt(self.password_encrypted.encode()).decode()
+
+    def to_dict(self):
+        """Configuration without credentials."""
+        return {
+            'platform': self.platform,
+            'base_url': self.base_url,
+            'username': self.username,
+            'project_key': self.project_key,
+            'enabled': self.enabled,
+            'connection_status': self.connection_status
+        }
+
+
+# Partial index: listing enabled configurations touches only enabled rows
+db.Index(
+    'ix_alm_configs_enabled', AlmConfig.id,
+    postgresql_where=AlmConfig.enabled, sqlite_where=AlmConfig.enabled
+)
@@ -1,8 +1,12 @@
-from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import type_coerce
+from sqlalchemy.dialects.postgresql import JSONB, array
 from datetime import datetime
-import json
+from functools import cached_property
+from src.models.user import db
 
-db = SQLAlchemy()
+# Native JSON column: JSONB on PostgreSQL, JSON (stored as TEXT) elsewhere.
+# The driver hands back decoded lists/dicts, so no manual json.loads per row.
+JSONColumn = db.JSON().with_variant(JSONB(), 'postgresql')
 
 class Requirement(db.Model):
     __tablename__ = 'requirements'
@@ -14,7 +18,7 @@ class Requirement(db.Model):
     type = db.Column(db.String(50), nullable=False)  # functional, non-functional, regulatory
     priority = db.Column(db.String(20), nullable=False)  # high, medium, low
     source_document = db.Column(db.String(200))
-    regulatory_standards = db.Column(db.Text)  # JSON string of applicable standards
+    regulatory_standards = db.Column(JSONColumn)  # List of applicable standards
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -30,16 +34,32 @@ class Requirement(db.Model):
             'type': self.type,
             'priority': self.priority,
             'source_document': self.source_document,
-            'regulatory_standards': json.loads(self.regulatory_standards) if self.regulatory_standards else [],
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'regulatory_standards': self.regulatory_standards or [],
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
     
+    @cached_property
+    def as_dict(self):
+        """to_dict() memoized on the instance; use to_dict() after modifying the row."""
+        return self.to_dict()
+    
     def set_regulatory_standards(self, standards_list):
-        self.regulatory_standards = json.dumps(standards_list)
+        self.regulatory_standards = standards_list
     
     def get_regulatory_standards(self):
-        return json.loads(self.regulatory_standards) if self.regulatory_standards else []
+        return self.regulatory_standards or []
+    
+    @classmethod
+    def regulatory_standards_match_any(cls, standards_list):
+        """SQL clause matching requirements tagged with any of the given standards (PostgreSQL jsonb ?|)."""
+        return type_coerce(cls.regulatory_standards, JSONB).has_any(array(standards_list))
+
+
+# GIN index so jsonb containment/key lookups on standards avoid a sequential scan
+db.Index(
+    'ix_req_standards_gin', Requirement.regulatory_standards, postgresql_using='gin'
+).ddl_if(dialect='postgresql')
 
 
 class TestCase(db.Model):
@@ -50,12 +70,12 @@ class TestCase(db.Model):
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=False)
     preconditions = db.Column(db.Text)
-    test_steps = db.Column(db.Text, nullable=False)  # JSON string of test steps
+    test_steps = db.Column(JSONColumn, nullable=False)  # List of test steps
     expected_results = db.Column(db.Text, nullable=False)
     postconditions = db.Column(db.Text)
     priority = db.Column(db.String(20), nullable=False)
-    test_data = db.Column(db.Text)  # JSON string of test data
-    compliance_tags = db.Column(db.Text)  # JSON string of compliance tags
+    test_data = db.Column(JSONColumn)  # Dict of test data
+    compliance_tags = db.Column(JSONColumn)  # List of compliance tags
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -69,38 +89,48 @@ class TestCase(db.Model):
             'title': self.title,
             'description': self.description,
             'preconditions': self.preconditions,
-            'test_steps': json.loads(self.test_steps) if self.test_steps else [],
+            'test_steps': self.test_steps or [],
             'expected_results': self.expected_results,
             'postconditions': self.postconditions,
             'priority': self.priority,
-            'test_data': json.loads(self.test_data) if self.test_data else {},
-            'compliance_tags': json.loads(self.compliance_tags) if self.compliance_tags else [],
+            'test_data': self.test_data or {},
+            'compliance_tags': self.compliance_tags or [],
             'requirement_id': self.requirement_id,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
     
+    @cached_property
+    def as_dict(self):
+        """to_dict() memoized on the instance; use to_dict() after modifying the row."""
+        return self.to_dict()
+    
     def set_test_steps(self, steps_list):
-        self.test_steps = json.dumps(steps_list)
+        self.test_steps = steps_list
     
     def get_test_steps(self):
-        return json.loads(self.test_steps) if self.test_steps else []
+        return self.test_steps or []
     
     def set_test_data(self, data_dict):
-        self.test_data = json.dumps(data_dict)
+        self.test_data = data_dict
     
     def get_test_data(self):
-        return json.loads(self.test_data) if self.test_data else {}
+        return self.test_data or {}
     
     def set_compliance_tags(self, tags_list):
-        self.compliance_tags = json.dumps(tags_list)
+        self.compliance_tags = tags_list
     
     def get_compliance_tags(self):
-        return json.loads(self.compliance_tags) if self.compliance_tags else []
+        return self.compliance_tags or []
 
 
 class TraceabilityLink(db.Model):
     __tablename__ = 'traceability_links'
+    __table_args__ = (
+        db.Index('ix_tl_src', 'source_type', 'source_id'),
+        db.Index('ix_tl_tgt', 'target_type', 'target_id'),
+        db.UniqueConstraint('source_type', 'source_id', 'target_type', 'target_id', 'link_type', name='uq_tl_edge'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     source_type = db.Column(db.String(50), nullable=False)  # requirement, test_case, defect
@@ -118,6 +148,6 @@ class TraceabilityLink(db.Model):
             'target_type': self.target_type,
             'target_id': self.target_id,
             'link_type': self.link_type,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
 
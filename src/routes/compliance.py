@@ -1,468 +1,566 @@
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app, stream_with_context
+from werkzeug.exceptions import HTTPException
+from sqlalchemy import and_, func, insert, lambda_stmt, literal, or_, select, union_all
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import load_only, selectinload
 from src.models.requirement import db, Requirement, TestCase, TraceabilityLink
-from src.services.compliance_engine import ComplianceEngine
-import json
+from src.json_provider import OrjsonProvider
+from src.services.compliance_engine import ComplianceEngine, ComplianceLevel, REPORT_LIST_SECTIONS
+from functools import lru_cache
+import hashlib
+import logging
+import orjson
 
 compliance_bp = Blueprint('compliance', __name__)
+logger = logging.getLogger(__name__)
 
 # Initialize compliance engine
 compliance_engine = ComplianceEngine()
 
+@compliance_bp.errorhandler(HTTPException)
+def handle_http_error(e):
+    """Return HTTP errors (e.g. get_or_404) as JSON with their own status code."""
+    return jsonify({'error': e.description}), e.code
+
+@compliance_bp.errorhandler(SQLAlchemyError)
+def handle_database_error(e):
+    """Roll back the session and report database errors."""
+    db.session.rollback()
+    return jsonify({'error': f'Database error: {str(e)}'}), 500
+
+@compliance_bp.errorhandler(Exception)
+def handle_unexpected_error(e):
+    """Report any other error raised by a compliance/traceability view."""
+    db.session.rollback()
+    return jsonify({'error': f'Error processing request: {str(e)}'}), 500
+
+# Columns read by the compliance engine when building a report
+REPORT_REQUIREMENT_COLUMNS = (
+    Requirement.id, Requirement.requirement_id, Requirement.title, Requirement.description,
+    Requirement.type, Requirement.priority, Requirement.regulatory_standards
+)
+REPORT_TEST_CASE_COLUMNS = (
+    TestCase.id, TestCase.test_case_id, TestCase.title, TestCase.description,
+    TestCase.preconditions, TestCase.test_steps, TestCase.expected_results,
+    TestCase.postconditions, TestCase.priority, TestCase.requirement_id
+)
+
+@lru_cache(maxsize=1)
+def _compliance_standards_payload():
+    """Serialize the (static) standards catalogue once, with its ETag."""
+    standards = compliance_engine.get_compliance_standards()
+    payload = orjson.dumps({
+        'standards': standards,
+        'total_standards': len(standards)
+    })
+    return payload, hashlib.sha1(payload).hexdigest()
+
 @compliance_bp.route('/compliance/standards', methods=['GET'])
 def get_compliance_standards():
     """Get information about supported compliance standards."""
-    try:
-        standards = compliance_engine.get_compliance_standards()
-        return jsonify({
-            'standards': standards,
-            'total_standards': len(standards)
-        }), 200
-    except Exception as e:
-        return jsonify({'error': f'Error fetching compliance standards: {str(e)}'}), 500
+    payload, etag = _compliance_standards_payload()
+    response = current_app.response_class(payload, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
 
 @compliance_bp.route('/compliance/assess-requirement/<int:req_id>', methods=['POST'])
 def assess_requirement_compliance(req_id):
     """Assess compliance of a specific requirement."""
-    try:
-        requirement = Requirement.query.get_or_404(req_id)
-        
-        # Assess compliance
-        compliance_results = compliance_engine.assess_requirement_compliance(requirement.to_dict())
-        
-        # Convert results to JSON-serializable format
-        results_data = []
-        for result in compliance_results:
-            results_data.append({
-                'rule_id': result.rule_id,
-                'standard': result.standard,
-                'compliance_level': result.compliance_level.value,
-                'score': result.score,
-                'findings': result.findings,
-                'recommendations': result.recommendations,
-                'evidence': result.evidence,
-                'risk_assessment': result.risk_assessment.value
-            })
-        
-        return jsonify({
-            'requirement_id': requirement.requirement_id,
-            'compliance_results': results_data,
-            'total_assessments': len(results_data)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({'error': f'Error assessing requirement compliance: {str(e)}'}), 500
+    requirement = Requirement.query.get_or_404(req_id)
+    
+    # Assess compliance
+    compliance_results = compliance_engine.assess_requirement_compliance(requirement.to_dict())
+    
+    return jsonify({
+        'requirement_id': requirement.requirement_id,
+        # ComplianceResult dataclasses (and their enums) serialize natively via orjson
+        'compliance_results': compliance_results,
+        'total_assessments': len(compliance_results)
+    }), 200
 
 @compliance_bp.route('/compliance/assess-test-case/<int:tc_id>', methods=['POST'])
 def assess_test_case_compliance(tc_id):
     """Assess compliance of a specific test case."""
+    test_case = TestCase.query.get_or_404(tc_id)
+    
+    # Get related requirement
+    requirement = None
+    if test_case.requirement_id:
+        requirement = db.session.get(Requirement, test_case.requirement_id)
+    
+    # Assess compliance
+    compliance_results = compliance_engine.assess_test_case_compliance(
+        test_case.to_dict(), 
+        requirement.to_dict() if requirement else None
+    )
+    
+    return jsonify({
+        'test_case_id': test_case.test_case_id,
+        # ComplianceResult dataclasses (and their enums) serialize natively via orjson
+        'compliance_results': compliance_results,
+        'total_assessments': len(compliance_results),
+        'related_requirement': requirement.requirement_id if requirement else None
+    }), 200
+
+def _stream_report_json(sections):
+    """
+    Encode report sections as one JSON object, one chunk per section or list
+    entry. Sections are assessed lazily after the 200 status has been sent,
+    so a failure part-way is logged and reported as a closing "error" member,
+    keeping the body valid JSON.
+    """
+    option = OrjsonProvider.option
+    yield b'{'
+    index = 0
+    # Where a failure leaves the output: inside a list, or after a section name
+    in_list = awaiting_value = False
     try:
-        test_case = TestCase.query.get_or_404(tc_id)
-        
-        # Get related requirement
-        requirement = None
-        if test_case.requirement_id:
-            requirement = Requirement.query.get(test_case.requirement_id)
-        
-        # Assess compliance
-        compliance_results = compliance_engine.assess_test_case_compliance(
-            test_case.to_dict(), 
-            requirement.to_dict() if requirement else None
-        )
-        
-        # Convert results to JSON-serializable format
-        results_data = []
-        for result in compliance_results:
-            results_data.append({
-                'rule_id': result.rule_id,
-                'standard': result.standard,
-                'compliance_level': result.compliance_level.value,
-                'score': result.score,
-                'findings': result.findings,
-                'recommendations': result.recommendations,
-                'evidence': result.evidence,
-                'risk_assessment': result.risk_assessment.value
-            })
-        
-        return jsonify({
-            'test_case_id': test_case.test_case_id,
-            'compliance_results': results_data,
-            'total_assessments': len(results_data),
-            'related_requirement': requirement.requirement_id if requirement else None
-        }), 200
-        
+        for section, value in sections:
+            yield (b',' if index else b'') + orjson.dumps(section) + b':'
+            index += 1
+            awaiting_value = True
+            if section in REPORT_LIST_SECTIONS:
+                yield b'['
+                in_list = True
+                for entry_index, entry in enumerate(value):
+                    yield (b',' if entry_index else b'') + orjson.dumps(entry, option=option)
+                in_list = False
+                yield b']'
+            else:
+                yield orjson.dumps(value, option=option)
+            awaiting_value = False
     except Exception as e:
-        return jsonify({'error': f'Error assessing test case compliance: {str(e)}'}), 500
+        logger.exception("Error streaming compliance report")
+        db.session.rollback()
+        if in_list:
+            yield b']'
+        elif awaiting_value:
+            yield b'null'
+        yield (b',' if index else b'') + orjson.dumps('error') + b':' + orjson.dumps(f'Error generating report: {str(e)}')
+    yield b'}'
 
 @compliance_bp.route('/compliance/generate-report', methods=['POST'])
 def generate_compliance_report():
     """Generate a comprehensive compliance report for all requirements and test cases."""
-    try:
-        # Get filter parameters
-        data = request.get_json() or {}
-        requirement_ids = data.get('requirement_ids', [])
-        test_case_ids = data.get('test_case_ids', [])
-        standards_filter = data.get('standards', [])
-        
-        # Get requirements
-        if requirement_ids:
-            requirements = Requirement.query.filter(Requirement.id.in_(requirement_ids)).all()
-        else:
-            requirements = Requirement.query.all()
-        
-        # Get test cases
-        if test_case_ids:
-            test_cases = TestCase.query.filter(TestCase.id.in_(test_case_ids)).all()
-        else:
-            test_cases = TestCase.query.all()
-        
-        # Convert to dictionaries
-        req_dicts = [req.to_dict() for req in requirements]
-        tc_dicts = [tc.to_dict() for tc in test_cases]
-        
-        # Generate compliance report
-        report = compliance_engine.generate_compliance_report(req_dicts, tc_dicts)
-        
-        # Filter by standards if specified
-        if standards_filter:
-            # Filter requirement compliance results
-            filtered_req_compliance = []
-            for req_comp in report['requirement_compliance']:
-                filtered_results = [
-                    result for result in req_comp['compliance_results']
-                    if result['standard'] in standards_filter
-                ]
-                if filtered_results:
-                    req_comp['compliance_results'] = filtered_results
-                    filtered_req_compliance.append(req_comp)
-            report['requirement_compliance'] = filtered_req_compliance
-            
-            # Filter test case compliance results
-            filtered_tc_compliance = []
-            for tc_comp in report['test_case_compliance']:
-                filtered_results = [
-                    result for result in tc_comp['compliance_results']
-                    if result['standard'] in standards_filter
-                ]
-                if filtered_results:
-                    tc_comp['compliance_results'] = filtered_results
-                    filtered_tc_compliance.append(tc_comp)
-            report['test_case_compliance'] = filtered_tc_compliance
-            
-            # Filter overall compliance
-            filtered_overall = {
-                standard: compliance for standard, compliance in report['overall_compliance'].items()
-                if standard in standards_filter
-            }
-            report['overall_compliance'] = filtered_overall
-        
-        return jsonify(report), 200
-        
-    except Exception as e:
-        return jsonify({'error': f'Error generating compliance report: {str(e)}'}), 500
+    # Get filter parameters
+    data = request.get_json() or {}
+    requirement_ids = data.get('requirement_ids', [])
+    test_case_ids = data.get('test_case_ids', [])
+    standards_filter = data.get('standards', [])
+    
+    # Fetch only the columns the compliance engine reads, as plain row mappings
+    # (no ORM instance hydration or to_dict() per row)
+    req_stmt = select(*REPORT_REQUIREMENT_COLUMNS)
+    if requirement_ids:
+        req_stmt = req_stmt.where(Requirement.id.in_(requirement_ids))
+    req_dicts = [dict(row) for row in db.session.execute(req_stmt).mappings()]
+    
+    tc_stmt = select(*REPORT_TEST_CASE_COLUMNS)
+    if test_case_ids:
+        tc_stmt = tc_stmt.where(TestCase.id.in_(test_case_ids))
+    tc_dicts = [dict(row) for row in db.session.execute(tc_stmt).mappings()]
+    
+    # Stream the compliance report, assessing only the requested standards
+    sections = compliance_engine.iter_compliance_report(req_dicts, tc_dicts, standards_filter)
+    return current_app.response_class(
+        stream_with_context(_stream_report_json(sections)),
+        mimetype='application/json'
+    ), 200
 
 @compliance_bp.route('/traceability/matrix', methods=['GET'])
 def get_traceability_matrix():
     """Get the complete traceability matrix."""
-    try:
-        # Get all requirements and test cases
-        requirements = Requirement.query.all()
-        test_cases = TestCase.query.all()
-        traceability_links = TraceabilityLink.query.all()
-        
-        # Build traceability matrix
-        matrix = {
-            'requirements': [],
-            'test_cases': [],
-            'links': [],
-            'coverage_analysis': {}
-        }
-        
-        # Add requirements
-        for req in requirements:
-            matrix['requirements'].append({
-                'id': req.id,
-                'requirement_id': req.requirement_id,
-                'title': req.title,
-                'type': req.type,
-                'priority': req.priority,
-                'regulatory_standards': req.get_regulatory_standards()
-            })
-        
-        # Add test cases
-        for tc in test_cases:
-            matrix['test_cases'].append({
-                'id': tc.id,
-                'test_case_id': tc.test_case_id,
-                'title': tc.title,
-                'priority': tc.priority,
-                'requirement_id': tc.requirement_id,
-                'compliance_tags': tc.get_compliance_tags()
-            })
-        
-        # Add traceability links
-        for link in traceability_links:
-            matrix['links'].append({
-                'id': link.id,
-                'source_type': link.source_type,
-                'source_id': link.source_id,
-                'target_type': link.target_type,
-                'target_id': link.target_id,
-                'link_type': link.link_type,
-                'created_at': link.created_at.isoformat()
-            })
-        
-        # Calculate coverage analysis
-        req_with_tests = set()
-        tests_with_reqs = set()
-        
-        for link in traceability_links:
-            if link.source_type == 'requirement' and link.target_type == 'test_case':
-                req_with_tests.add(link.source_id)
-                tests_with_reqs.add(link.target_id)
-            elif link.source_type == 'test_case' and link.target_type == 'requirement':
-                tests_with_reqs.add(link.source_id)
-                req_with_tests.add(link.target_id)
-        
-        total_requirements = len(requirements)
-        total_test_cases = len(test_cases)
-        
-        matrix['coverage_analysis'] = {
-            'total_requirements': total_requirements,
-            'requirements_with_tests': len(req_with_tests),
-            'requirements_coverage_percentage': (len(req_with_tests) / total_requirements * 100) if total_requirements > 0 else 0,
-            'total_test_cases': total_test_cases,
-            'test_cases_with_requirements': len(tests_with_reqs),
-            'test_cases_coverage_percentage': (len(tests_with_reqs) / total_test_cases * 100) if total_test_cases > 0 else 0,
-            'orphaned_requirements': total_requirements - len(req_with_tests),
-            'orphaned_test_cases': total_test_cases - len(tests_with_reqs)
-        }
-        
-        return jsonify(matrix), 200
-        
-    except Exception as e:
-        return jsonify({'error': f'Error generating traceability matrix: {str(e)}'}), 500
+    # Get all requirements and test cases, loading only the columns the matrix needs
+    requirements = Requirement.query.options(load_only(
+        Requirement.id, Requirement.requirement_id, Requirement.title,
+        Requirement.type, Requirement.priority, Requirement.regulatory_standards
+    )).all()
+    test_cases = TestCase.query.options(load_only(
+        TestCase.id, TestCase.test_case_id, TestCase.title,
+        TestCase.priority, TestCase.requirement_id, TestCase.compliance_tags
+    )).all()
+    traceability_links = TraceabilityLink.query.all()
+    
+    # Build traceability matrix
+    matrix = {
+        'requirements': [],
+        'test_cases': [],
+        'links': [],
+        'coverage_analysis': {}
+    }
+    
+    # Add requirements
+    for req in requirements:
+        matrix['requirements'].append({
+            'id': req.id,
+            'requirement_id': req.requirement_id,
+            'title': req.title,
+            'type': req.type,
+            'priority': req.priority,
+            'regulatory_standards': req.get_regulatory_standards()
+        })
+    
+    # Add test cases
+    for tc in test_cases:
+        matrix['test_cases'].append({
+            'id': tc.id,
+            'test_case_id': tc.test_case_id,
+            'title': tc.title,
+            'priority': tc.priority,
+            'requirement_id': tc.requirement_id,
+            'compliance_tags': tc.get_compliance_tags()
+        })
+    
+    # Add traceability links, collecting coverage in the same pass
+    req_with_tests = set()
+    tests_with_reqs = set()
+    
+    for link in traceability_links:
+        matrix['links'].append({
+            'id': link.id,
+            'source_type': link.source_type,
+            'source_id': link.source_id,
+            'target_type': link.target_type,
+            'target_id': link.target_id,
+            'link_type': link.link_type,
+            'created_at': link.created_at
+        })
+        
+        if link.source_type == 'requirement' and link.target_type == 'test_case':
+            req_with_tests.add(link.source_id)
+            tests_with_reqs.add(link.target_id)
+        elif link.source_type == 'test_case' and link.target_type == 'requirement':
+            tests_with_reqs.add(link.source_id)
+            req_with_tests.add(link.target_id)
+    
+    total_requirements = len(requirements)
+    total_test_cases = len(test_cases)
+    
+    matrix['coverage_analysis'] = {
+        'total_requirements': total_requirements,
+        'requirements_with_tests': len(req_with_tests),
+        'requirements_coverage_percentage': (len(req_with_tests) / total_requirements * 100) if total_requirements > 0 else 0,
+        'total_test_cases': total_test_cases,
+        'test_cases_with_requirements': len(tests_with_reqs),
+        'test_cases_coverage_percentage': (len(tests_with_reqs) / total_test_cases * 100) if total_test_cases > 0 else 0,
+        'orphaned_requirements': total_requirements - len(req_with_tests),
+        'orphaned_test_cases': total_test_cases - len(tests_with_reqs)
+    }
+    
+    return jsonify(matrix), 200
+
+LINK_REQUIRED_FIELDS = ['source_type', 'source_id', 'target_type', 'target_id', 'link_type']
+# Largest links list accepted by POST /traceability/create-links, and the rows
+# per INSERT, keeping each statement well under database bind-parameter limits
+MAX_LINKS_PER_REQUEST = 1000
+LINK_INSERT_CHUNK_SIZE = 100
+
+def _link_validation_error(link):
+    """
+    Check that a link is an object with every required field, integer ids and
+    string types/link type. Returns an error message, or None if it is valid.
+    """
+    if not isinstance(link, dict):
+        return 'link must be an object'
+    for field in LINK_REQUIRED_FIELDS:
+        if field not in link:
+            return f'missing required field: {field}'
+    for field in ('source_id', 'target_id'):
+        # bool is an int subclass, but never a valid id
+        if not isinstance(link[field], int) or isinstance(link[field], bool):
+            return f'{field} must be an integer'
+    for field in ('source_type', 'target_type', 'link_type'):
+        if not isinstance(link[field], str):
+            return f'{field} must be a string'
+    return None
+
+# Item types that traceability links are validated against
+LINKABLE_MODELS = {'requirement': Requirement, 'test_case': TestCase}
+LINKABLE_ITEM_LABELS = {'requirement': 'requirement', 'test_case': 'test case'}
+
+def _find_missing_link_endpoints(data):
+    """
+    Check that the source and target of a link exist, in one UNION ALL query.
+    Returns the (role, item_type) pairs that were not found, source first.
+    Endpoint types other than requirement/test_case are not validated.
+    """
+    checks = []
+    for role in ('source', 'target'):
+        model = LINKABLE_MODELS.get(data[f'{role}_type'])
+        if model is not None:
+            checks.append((role, data[f'{role}_type'], select(literal(role)).where(model.id == data[f'{role}_id'])))
+    
+    if not checks:
+        return []
+    
+    found = set(db.session.execute(union_all(*[stmt for _, _, stmt in checks])).scalars())
+    return [(role, item_type) for role, item_type, _ in checks if role not in found]
 
 @compliance_bp.route('/traceability/create-link', methods=['POST'])
 def create_traceability_link():
     """Create a new traceability link."""
+    data = request.get_json()
+    
+    error = _link_validation_error(data)
+    if error:
+        return jsonify({'error': error.capitalize()}), 400
+    
+    # Validate source and target exist
+    missing = _find_missing_link_endpoints(data)
+    if missing:
+        role, item_type = missing[0]
+        return jsonify({'error': f'{role.capitalize()} {LINKABLE_ITEM_LABELS[item_type]} not found'}), 404
+    
+    # Create new traceability link (duplicates are rejected by the uq_tl_edge constraint)
+    new_link = TraceabilityLink(
+        source_type=data['source_type'],
+        source_id=data['source_id'],
+        target_type=data['target_type'],
+        target_id=data['target_id'],
+        link_type=data['link_type']
+    )
+    
+    db.session.add(new_link)
     try:
-        data = request.get_json()
-        
-        required_fields = ['source_type', 'source_id', 'target_type', 'target_id', 'link_type']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({'error': f'Missing required field: {field}'}), 400
-        
-        # Validate source and target exist
-        if data['source_type'] == 'requirement':
-            source = Requirement.query.get(data['source_id'])
-            if not source:
-                return jsonify({'error': 'Source requirement not found'}), 404
-        elif data['source_type'] == 'test_case':
-            source = TestCase.query.get(data['source_id'])
-            if not source:
-                return jsonify({'error': 'Source test case not found'}), 404
-        
-        if data['target_type'] == 'requirement':
-            target = Requirement.query.get(data['target_id'])
-            if not target:
-                return jsonify({'error': 'Target requirement not found'}), 404
-        elif data['target_type'] == 'test_case':
-            target = TestCase.query.get(data['target_id'])
-            if not target:
-                return jsonify({'error': 'Target test case not found'}), 404
-        
-        # Check if link already exists
-        existing_link = TraceabilityLink.query.filter_by(
-            source_type=data['source_type'],
-            source_id=data['source_id'],
-            target_type=data['target_type'],
-            target_id=data['target_id'],
-            link_type=data['link_type']
-        ).first()
-        
-        if existing_link:
-            return jsonify({'error': 'Traceability link already exists'}), 409
-        
-        # Create new traceability link
-        new_link = TraceabilityLink(
-            source_type=data['source_type'],
-            source_id=data['source_id'],
-            target_type=data['target_type'],
-            target_id=data['target_id'],
-            link_type=data['link_type']
-        )
-        
-        db.session.add(new_link)
         db.session.commit()
-        
-        return jsonify({
-            'message': 'Traceability link created successfully',
-            'link': new_link.to_dict()
-        }), 201
-        
-    except Exception as e:
+    except IntegrityError:
         db.session.rollback()
-        return jsonify({'error': f'Error creating traceability link: {str(e)}'}), 500
+        return jsonify({'error': 'Traceability link already exists'}), 409
+    
+    return jsonify({
+        'message': 'Traceability link created successfully',
+        'link': new_link.to_dict()
+    }), 201
+
+def _insert_links_ignoring_duplicates():
+    """INSERT into traceability_links with ON CONFLICT DO NOTHING for the current dialect."""
+    dialect_name = db.engine.dialect.name
+    if dialect_name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        # No portable upsert; duplicates surface as IntegrityError
+        return insert(TraceabilityLink)
+    return dialect_insert(TraceabilityLink).on_conflict_do_nothing(index_elements=LINK_REQUIRED_FIELDS)
+
+@compliance_bp.route('/traceability/create-links', methods=['POST'])
+def create_traceability_links():
+    """Create many traceability links in one transaction, skipping ones that already exist."""
+    data = request.get_json() or {}
+    links = data.get('links')
+    if not links or not isinstance(links, list):
+        return jsonify({'error': 'Missing required field: links'}), 400
+    if len(links) > MAX_LINKS_PER_REQUEST:
+        return jsonify({'error': f'Too many links: {len(links)}, at most {MAX_LINKS_PER_REQUEST} per request'}), 413
+    
+    for index, link in enumerate(links):
+        error = _link_validation_error(link)
+        if error:
+            return jsonify({'error': f'Link {index}: {error}'}), 400
+    
+    # Validate every referenced requirement/test case with one IN query per table
+    referenced_ids = {item_type: set() for item_type in LINKABLE_MODELS}
+    for link in links:
+        for role in ('source', 'target'):
+            if link[f'{role}_type'] in referenced_ids:
+                referenced_ids[link[f'{role}_type']].add(link[f'{role}_id'])
+    
+    for item_type, ids in referenced_ids.items():
+        if not ids:
+            continue
+        model = LINKABLE_MODELS[item_type]
+        existing_ids = set(db.session.execute(select(model.id).where(model.id.in_(ids))).scalars())
+        missing_ids = ids - existing_ids
+        if missing_ids:
+            return jsonify({
+                'error': f'{LINKABLE_ITEM_LABELS[item_type].capitalize()} not found',
+                'missing_ids': sorted(missing_ids)
+            }), 404
+    
+    # Multi-row INSERTs of LINK_INSERT_CHUNK_SIZE rows in one transaction;
+    # existing edges are skipped via uq_tl_edge
+    rows = [{field: link[field] for field in LINK_REQUIRED_FIELDS} for link in links]
+    insert_links = _insert_links_ignoring_duplicates()
+    created_count = 0
+    for start in range(0, len(rows), LINK_INSERT_CHUNK_SIZE):
+        result = db.session.execute(insert_links.values(rows[start:start + LINK_INSERT_CHUNK_SIZE]))
+        created_count += result.rowcount
+    db.session.commit()
+    
+    return jsonify({
+        'message': 'Traceability links created successfully',
+        'requested_count': len(rows),
+        'created_count': created_count
+    }), 201
 
 @compliance_bp.route('/traceability/links/<int:link_id>', methods=['DELETE'])
 def delete_traceability_link(link_id):
     """Delete a traceability link."""
-    try:
-        link = TraceabilityLink.query.get_or_404(link_id)
-        
-        db.session.delete(link)
-        db.session.commit()
-        
-        return jsonify({
-            'message': 'Traceability link deleted successfully'
-        }), 200
-        
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': f'Error deleting traceability link: {str(e)}'}), 500
+    link = TraceabilityLink.query.get_or_404(link_id)
+    
+    db.session.delete(link)
+    db.session.commit()
+    
+    return jsonify({
+        'message': 'Traceability link deleted successfully'
+    }), 200
+
+def _get_links_for_item(item_type, item_id):
+    """
+    Get all links where the given item is the source or the target.
+    Built with lambda_stmt so SQLAlchemy caches the compiled SQL and only
+    binds item_type/item_id per call.
+    """
+    stmt = lambda_stmt(lambda: select(TraceabilityLink))
+    stmt += lambda s: s.where(or_(
+        and_(TraceabilityLink.source_type == item_type, TraceabilityLink.source_id == item_id),
+        and_(TraceabilityLink.target_type == item_type, TraceabilityLink.target_id == item_id)
+    ))
+    return db.session.execute(stmt).scalars().all()
 
 @compliance_bp.route('/traceability/requirement/<int:req_id>/links', methods=['GET'])
 def get_requirement_traceability_links(req_id):
     """Get all traceability links for a specific requirement."""
-    try:
-        requirement = Requirement.query.get_or_404(req_id)
-        
-        # Get links where this requirement is source or target
-        links = TraceabilityLink.query.filter(
-            ((TraceabilityLink.source_type == 'requirement') & (TraceabilityLink.source_id == req_id)) |
-            ((TraceabilityLink.target_type == 'requirement') & (TraceabilityLink.target_id == req_id))
-        ).all()
-        
-        # Get related test cases
-        related_test_cases = []
-        for link in links:
-            if link.source_type == 'test_case' and link.target_type == 'requirement' and link.target_id == req_id:
-                tc = TestCase.query.get(link.source_id)
-                if tc:
-                    related_test_cases.append(tc.to_dict())
-            elif link.target_type == 'test_case' and link.source_type == 'requirement' and link.source_id == req_id:
-                tc = TestCase.query.get(link.target_id)
-                if tc:
-                    related_test_cases.append(tc.to_dict())
-        
-        return jsonify({
-            'requirement': requirement.to_dict(),
-            'traceability_links': [link.to_dict() for link in links],
-            'related_test_cases': related_test_cases,
-            'total_links': len(links)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({'error': f'Error fetching requirement traceability: {str(e)}'}), 500
+    requirement = Requirement.query.get_or_404(req_id)
+    
+    # Get links where this requirement is source or target
+    links = _get_links_for_item('requirement', req_id)
+    
+    # Get related test cases
+    related_tc_ids = []
+    for link in links:
+        if link.source_type == 'test_case' and link.target_type == 'requirement' and link.target_id == req_id:
+            related_tc_ids.append(link.source_id)
+        elif link.target_type == 'test_case' and link.source_type == 'requirement' and link.source_id == req_id:
+            related_tc_ids.append(link.target_id)
+    
+    # Fetch all related test cases in a single IN query
+    test_cases_by_id = {}
+    if related_tc_ids:
+        test_cases_by_id = {
+            tc.id: tc for tc in TestCase.query.filter(TestCase.id.in_(set(related_tc_ids))).all()
+        }
+    related_test_cases = [
+        test_cases_by_id[tc_id].as_dict for tc_id in related_tc_ids if tc_id in test_cases_by_id
+    ]
+    
+    return jsonify({
+        'requirement': requirement.to_dict(),
+        'traceability_links': [link.to_dict() for link in links],
+        'related_test_cases': related_test_cases,
+        'total_links': len(links)
+    }), 200
 
 @compliance_bp.route('/traceability/test-case/<int:tc_id>/links', methods=['GET'])
 def get_test_case_traceability_links(tc_id):
     """Get all traceability links for a specific test case."""
-    try:
-        test_case = TestCase.query.get_or_404(tc_id)
-        
-        # Get links where this test case is source or target
-        links = TraceabilityLink.query.filter(
-            ((TraceabilityLink.source_type == 'test_case') & (TraceabilityLink.source_id == tc_id)) |
-            ((TraceabilityLink.target_type == 'test_case') & (TraceabilityLink.target_id == tc_id))
-        ).all()
-        
-        # Get related requirements
-        related_requirements = []
-        for link in links:
-            if link.source_type == 'requirement' and link.target_type == 'test_case' and link.target_id == tc_id:
-                req = Requirement.query.get(link.source_id)
-                if req:
-                    related_requirements.append(req.to_dict())
-            elif link.target_type == 'requirement' and link.source_type == 'test_case' and link.source_id == tc_id:
-                req = Requirement.query.get(link.target_id)
-                if req:
-                    related_requirements.append(req.to_dict())
-        
-        return jsonify({
-            'test_case': test_case.to_dict(),
-            'traceability_links': [link.to_dict() for link in links],
-            'related_requirements': related_requirements,
-            'total_links': len(links)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({'error': f'Error fetching test case traceability: {str(e)}'}), 500
+    test_case = TestCase.query.get_or_404(tc_id)
+    
+    # Get links where this test case is source or target
+    links = _get_links_for_item('test_case', tc_id)
+    
+    # Get related requirements
+    related_req_ids = []
+    for link in links:
+        if link.source_type == 'requirement' and link.target_type == 'test_case' and link.target_id == tc_id:
+            related_req_ids.append(link.source_id)
+        elif link.target_type == 'requirement' and link.source_type == 'test_case' and link.source_id == tc_id:
+            related_req_ids.append(link.target_id)
+    
+    # Fetch all related requirements in a single IN query
+    requirements_by_id = {}
+    if related_req_ids:
+        requirements_by_id = {
+            req.id: req for req in Requirement.query.filter(Requirement.id.in_(set(related_req_ids))).all()
+        }
+    related_requirements = [
+        requirements_by_id[req_id].as_dict for req_id in related_req_ids if req_id in requirements_by_id
+    ]
+    
+    return jsonify({
+        'test_case': test_case.to_dict(),
+        'traceability_links': [link.to_dict() for link in links],
+        'related_requirements': related_requirements,
+        'total_links': len(links)
+    }), 200
 
 @compliance_bp.route('/compliance/validate-coverage', methods=['POST'])
 def validate_test_coverage():
     """Validate test coverage for compliance requirements."""
-    try:
-        data = request.get_json() or {}
-        standard = data.get('standard')
-        
-        # Get all requirements and test cases
-        requirements = Requirement.query.all()
-        test_cases = TestCase.query.all()
-        
-        coverage_report = {
-            'standard': standard,
-            'total_requirements': len(requirements),
-            'total_test_cases': len(test_cases),
-            'coverage_gaps': [],
-            'recommendations': []
-        }
+    data = request.get_json() or {}
+    standard = data.get('standard')
+    
+    # Get requirements with their test cases eager-loaded in one extra query
+    requirements_query = Requirement.query.options(selectinload(Requirement.test_cases))
+    if standard and db.engine.dialect.name == 'postgresql':
+        # Let the GIN index on regulatory_standards do the filtering
+        requirements_query = requirements_query.filter(Requirement.regulatory_standards_match_any([standard]))
+    requirements = requirements_query.all()
+    total_requirements = db.session.query(func.count(Requirement.id)).scalar()
+    total_test_cases = db.session.query(func.count(TestCase.id)).scalar()
+    
+    coverage_report = {
+        'standard': standard,
+        'total_requirements': total_requirements,
+        'total_test_cases': total_test_cases,
+        'coverage_gaps': [],
+        'recommendations': []
+    }
+    
+    # Analyze coverage for each requirement
+    for req in requirements:
+        req_dict = req.to_dict()
+        
+        # Check if requirement is relevant to the standard
+        if standard and standard not in req.get_regulatory_standards():
+            continue
+        
+        # Test cases for this requirement (pre-loaded via selectinload)
+        related_test_cases = req.test_cases
+        
+        if not related_test_cases:
+            coverage_report['coverage_gaps'].append({
+                'requirement_id': req.requirement_id,
+                'title': req.title,
+                'issue': 'No test cases found',
+                'recommendation': 'Create test cases to verify this requirement'
+            })
+            continue
         
-        # Analyze coverage for each requirement
-        for req in requirements:
-            req_dict = req.to_dict()
-            
-            # Check if requirement is relevant to the standard
-            if standard and standard not in req.get_regulatory_standards():
-                continue
+        # Assess compliance of test cases
+        for tc in related_test_cases:
+            compliance_results = compliance_engine.assess_test_case_compliance(tc.to_dict(), req_dict)
             
-            # Get test cases for this requirement
-            related_test_cases = TestCase.query.filter_by(requirement_id=req.id).all()
-            
-            if not related_test_cases:
-                coverage_report['coverage_gaps'].append({
-                    'requirement_id': req.requirement_id,
-                    'title': req.title,
-                    'issue': 'No test cases found',
-                    'recommendation': 'Create test cases to verify this requirement'
-                })
-                continue
-            
-            # Assess compliance of test cases
-            for tc in related_test_cases:
-                compliance_results = compliance_engine.assess_test_case_compliance(tc.to_dict(), req_dict)
+            # Check for compliance gaps
+            for result in compliance_results:
+                if standard and result.standard != standard:
+                    continue
                 
-                # Check for compliance gaps
-                for result in compliance_results:
-                    if standard and result.standard != standard:
-                        continue
-                    
-                    if result.compliance_level.value in ['non_compliant', 'partially_compliant']:
-                        coverage_report['coverage_gaps'].append({
-                            'requirement_id': req.requirement_id,
-                            'test_case_id': tc.test_case_id,
-                            'standard': result.standard,
-                            'compliance_level': result.compliance_level.value,
-                            'issue': ', '.join(result.findings),
-                            'recommendation': ', '.join(result.recommendations)
-                        })
-        
-        # Generate overall recommendations
-        if coverage_report['coverage_gaps']:
-            coverage_report['recommendations'] = [
-                'Review and enhance test cases for requirements with compliance gaps',
-                'Ensure all regulatory requirements have adequate test coverage',
-                'Consider adding specific compliance verification steps to test cases'
-            ]
-        else:
-            coverage_report['recommendations'] = [
-                'Test coverage appears adequate for compliance requirements',
-                'Continue monitoring and updating test cases as requirements evolve'
-            ]
-        
-        return jsonify(coverage_report), 200
-        
-    except Exception as e:
-        return jsonify({'error': f'Error validating test coverage: {str(e)}'}), 500
+                if result.compliance_level in (ComplianceLevel.NON_COMPLIANT, ComplianceLevel.PARTIALLY_COMPLIANT):
+                    coverage_report['coverage_gaps'].append({
+                        'requirement_id': req.requirement_id,
+                        'test_case_id': tc.test_case_id,
+                        'standard': result.standard,
+                        'compliance_level': result.compliance_level,
+                        'issue': ', '.join(result.findings),
+                        'recommendation': ', '.join(result.recommendations)
+                    })
+    
+    # Generate overall recommendations
+    if coverage_report['coverage_gaps']:
+        coverage_report['recommendations'] = [
+            'Review and enhance test cases for requirements with compliance gaps',
+            'Ensure all regulatory requirements have adequate test coverage',
+            'Consider adding specific compliance verification steps to test cases'
+        ]
+    else:
+        coverage_report['recommendations'] = [
+            'Test coverage appears adequate for compliance requirements',
+            'Continue monitoring and updating test cases as requirements evolve'
+        ]
+    
+    return jsonify(coverage_report), 200
 
@@ -1,12 +1,185 @@
 from flask import Blueprint, request, jsonify, current_app
-from src.services.alm_integrations import ALMIntegrationFactory
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from src.services.alm_integrations import ALMIntegrationFactory, HTTP_POOL_MAXSIZE
+from sqlalchemy import update
 from src.models.requirement import db, Requirement, TestCase
-import json
+from src.models.alm_config import AlmConfig
+import threading
+import time
+from datetime import datetime
 
 integrations_bp = Blueprint('integrations', __name__)
 
-# Store ALM configurations (in production, this should be in a secure database)
-alm_configurations = {}
+def _get_config(config_id):
+    """Return the stored AlmConfig for config_id, or None."""
+    return db.session.get(AlmConfig, config_id)
+
+def _update_config(config_id, **changes):
+    """
+    Apply changes to a stored configuration with a single UPDATE ... RETURNING
+    and commit; returns False if config_id is unknown.
+    """
+    updated = db.session.execute(
+        update(AlmConfig)
+        .where(AlmConfig.id == config_id)
+        .values(**changes, updated_at=datetime.utcnow())
+        .returning(AlmConfig.id)
+    ).first()
+    db.session.commit()
+    return updated is not None
+
+# Concurrent ALM requests during bulk export; kept within the integration's
+# HTTP connection pool so every worker reuses a keep-alive connection
+EXPORT_MAX_WORKERS = min(16, HTTP_POOL_MAXSIZE)
+EXPORT_YIELD_PER = 500
+EXPORT_MAX_IN_FLIGHT = EXPORT_MAX_WORKERS * 4
+
+# Integration instances (and their authenticated HTTP sessions) reused across
+# requests, keyed by config_id:
+# {config_id: (integration, fingerprint, created_at, last_used)}
+# The fingerprint is read from the stored row on every checkout, so a config
+# changed through any worker process retires this process's stale instance.
+INTEGRATION_MAX_AGE = 3600  # seconds
+INTEGRATION_IDLE_TIMEOUT = 300  # seconds
+_integration_pool = {}
+_integration_pool_lock = threading.Lock()
+
+def _config_fingerprint(config):
+    """Stored connection settings an integration instance was built from."""
+    return (config.platform, config.base_url, config.username,
+            config.password_encrypted, config.project_key)
+
+def _get_integration(config):
+    """
+    Return the pooled integration for an AlmConfig, rebuilding it once stale
+    or once the stored connection settings no longer match the ones it was
+    built from.
+    """
+    fingerprint = _config_fingerprint(config)
+    now = time.monotonic()
+    with _integration_pool_lock:
+        entry = _integration_pool.get(config.id)
+        if entry:
+            integration, built_from, created_at, last_used = entry
+            if (built_from == fingerprint and now - created_at < INTEGRATION_MAX_AGE
+                    and now - last_used < INTEGRATION_IDLE_TIMEOUT):
+                _integration_pool[config.id] = (integration, built_from, created_at, now)
+                return integration
+            del _integration_pool[config.id]
+    if entry:
+        entry[0].session.close()
+    
+    # Decrypt and build outside the lock so other configs are not held up
+    integration = ALMIntegrationFactory.create_integration(
+        platform=config.platform,
+        base_url=config.base_url,
+        username=config.username,
+        password=config.get_password(),
+        project_key=config.project_key
+    )
+    with _integration_pool_lock:
+        replaced = _integration_pool.get(config.id)
+        _integration_pool[config.id] = (integration, fingerprint, now, now)
+    if replaced:
+        replaced[0].session.close()
+    return integration
+
+def _discard_integration(config_id):
+    """Drop the pooled integration for config_id, e.g. after its config changed."""
+    with _integration_pool_lock:
+        entry = _integration_pool.pop(config_id, None)
+    if entry:
+        entry[0].session.close()
+
+# Connection tests for newly configured integrations run off the request thread
+_probe_executor = ThreadPoolExecutor(max_workers=4)
+
+def _probe_connection(app, config_id):
+    """Test the connection for config_id and record the outcome on the config."""
+    with app.app_context():
+        try:
+            config = _get_config(config_id)
+            if config is None:
+                raise KeyError(f'ALM configuration not found: {config_id}')
+            result = _get_integration(config).ping()
+            connection_status = f"connection_failed: {result['error']}" if 'error' in result else 'success'
+        except Exception as e:
+            connection_status = f'connection_failed: {str(e)}'
+        _update_config(config_id, connection_status=connection_status)
+
+def _export_concurrently(executor, create, items, label):
+    """
+    Submit one ALM create call per (item_id, payload) pair and collect results.
+    At most EXPORT_MAX_IN_FLIGHT calls are outstanding, so rows keep streaming
+    from the database while earlier calls drain. Returns (exported_count, errors).
+    """
+    exported = 0
+    errors = []
+    
+    def collect(item_id, future):
+        nonlocal exported
+        try:
+            result = future.result()
+            if 'error' not in result:
+                exported += 1
+            else:
+                errors.append(f"{label} {item_id}: {result['error']}")
+        except Exception as e:
+            errors.append(f"{label} {item_id}: {str(e)}")
+    
+    pending = deque()
+    for item_id, payload in items:
+        pending.append((item_id, executor.submit(create, payload)))
+        if len(pending) >= EXPORT_MAX_IN_FLIGHT:
+            collect(*pending.popleft())
+    while pending:
+        collect(*pending.popleft())
+    return exported, errors
+
+# Columns an ALM sync overwrites on rows that already exist locally
+REQUIREMENT_SYNC_COLUMNS = ('title', 'description', 'priority', 'source_document', 'regulatory_standards')
+TEST_CASE_SYNC_COLUMNS = ('title', 'description', 'priority', 'compliance_tags')
+
+def _upsert_rows(model, key, rows, update_columns):
+    """
+    Insert rows, updating update_columns where a row with the same unique key
+    already exists, using the dialect's INSERT ... ON CONFLICT DO UPDATE.
+    """
+    if not rows:
+        return
+    
+    dialect_name = db.engine.dialect.name
+    if dialect_name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        # No portable upsert: look up existing keys, then bulk insert/update
+        key_column = getattr(model, key)
+        existing_ids = dict(
+            db.session.query(key_column, model.id)
+            .filter(key_column.in_([row[key] for row in rows]))
+            .all()
+        )
+        db.session.bulk_insert_mappings(model, [row for row in rows if row[key] not in existing_ids])
+        db.session.bulk_update_mappings(model, [
+            {'id': existing_ids[row[key]], **{column: row[column] for column in update_columns if column in row}}
+            for row in rows if row[key] in existing_ids
+        ])
+        return
+    
+    # Optional columns (e.g. tags) must not be nulled out on rows that lack them,
+    # so rows are upserted in one statement per distinct set of columns
+    rows_by_columns = {}
+    for row in rows:
+        rows_by_columns.setdefault(tuple(sorted(row)), []).append(row)
+    
+    for columns, column_rows in rows_by_columns.items():
+        stmt = dialect_insert(model)
+        set_ = {column: stmt.excluded[column] for column in update_columns if column in columns}
+        set_['updated_at'] = datetime.utcnow()
+        db.session.execute(stmt.on_conflict_do_update(index_elements=[key], set_=set_), column_rows)
 
 @integrations_bp.route('/alm/configure', methods=['POST'])
 def configure_alm_integration():
@@ -23,33 +196,24 @@ def configure_alm_integration():
         if platform not in ['jira', 'azure_devops', 'azuredevops', 'azure', 'polarion']:
             return jsonify({'error': f'Unsupported platform: {platform}'}), 400
         
-        # Store configuration (in production, encrypt sensitive data)
+        # Store configuration; the password is encrypted at rest
         config_id = f"{platform}_{data.get('project_key', 'default')}"
-        alm_configurations[config_id] = {
-            'platform': platform,
-            'base_url': data['base_url'],
-            'username': data['username'],
-            'password': data['password'],  # Should be encrypted in production
-            'project_key': data.get('project_key'),
-            'enabled': True
-        }
+        config = _get_config(config_id) or AlmConfig(id=config_id)
+        config.platform = platform
+        config.base_url = data['base_url']
+        config.username = data['username']
+        config.set_password(data['password'])
+        config.project_key = data.get('project_key')
+        config.enabled = True
+        config.connection_status = 'pending'
+        db.session.add(config)
+        db.session.commit()
+        _discard_integration(config_id)
         
-        # Test the connection
-        try:
-            integration = ALMIntegrationFactory.create_integration(
-                platform=platform,
-                base_url=data['base_url'],
-                username=data['username'],
-                password=data['password'],
-                project_key=data.get('project_key')
-            )
-            
-            # Try to get requirements to test connection
-            test_requirements = integration.get_requirements()
-            connection_status = 'success'
-            
-        except Exception as e:
-            connection_status = f'connection_failed: {str(e)}'
+        # Test the connection in the background; the result is reported by
+        # GET /alm/<config_id>/test-connection and /alm/configurations
+        _probe_executor.submit(_probe_connection, current_app._get_current_object(), config_id)
+        connection_status = 'pending'
         
         return jsonify({
             'message': 'ALM integration configured successfully',
@@ -59,22 +223,19 @@ def configure_alm_integration():
         }), 200
         
     except Exception as e:
+        db.session.rollback()
         return jsonify({'error': f'Error configuring ALM integration: {str(e)}'}), 500
 
 @integrations_bp.route('/alm/configurations', methods=['GET'])
 def get_alm_configurations():
     """Get all configured ALM integrations."""
     try:
-        # Return configurations without sensitive data
-        safe_configs = {}
-        for config_id, config in alm_configurations.items():
-            safe_configs[config_id] = {
-                'platform': config['platform'],
-                'base_url': config['base_url'],
-                'username': config['username'],
-                'project_key': config.get('project_key'),
-                'enabled': config.get('enabled', True)
-            }
+        # Return configurations without sensitive data; ?enabled=true lists
+        # only enabled ones, served by the partial index
+        query = AlmConfig.query
+        if request.args.get('enabled', 'false').lower() == 'true':
+            query = query.filter(AlmConfig.enabled)
+        safe_configs = {config.id: config.to_dict() for config in query.order_by(AlmConfig.id)}
         
         return jsonify({
             'configurations': safe_configs,
@@ -88,60 +249,42 @@ def get_alm_configurations():
 def sync_requirements_from_alm(config_id):
     """Sync requirements from ALM platform to local database."""
     try:
-        if config_id not in alm_configurations:
+        config = _get_config(config_id)
+        if config is None:
             return jsonify({'error': 'ALM configuration not found'}), 404
         
-        config = alm_configurations[config_id]
-        
-        # Create ALM integration instance
-        integration = ALMIntegrationFactory.create_integration(
-            platform=config['platform'],
-            base_url=config['base_url'],
-            username=config['username'],
-            password=config['password'],
-            project_key=config.get('project_key')
-        )
+        # Reuse the pooled ALM integration instance
+        integration = _get_integration(config)
         
         # Get requirements from ALM platform
         alm_requirements = integration.get_requirements()
         
-        # Sync to local database
-        synced_count = 0
-        for alm_req in alm_requirements:
-            # Check if requirement already exists
-            existing_req = Requirement.query.filter_by(requirement_id=alm_req['id']).first()
-            
-            if existing_req:
-                # Update existing requirement
-                existing_req.title = alm_req['title']
-                existing_req.description = alm_req['description']
-                existing_req.priority = alm_req.get('priority', 'medium')
-                existing_req.source_document = f"ALM_{config['platform']}"
-                if 'tags' in alm_req:
-                    existing_req.set_regulatory_standards(alm_req['tags'])
-            else:
-                # Create new requirement
-                new_req = Requirement(
-                    requirement_id=alm_req['id'],
-                    title=alm_req['title'],
-                    description=alm_req['description'],
-                    type='functional',  # Default type
-                    priority=alm_req.get('priority', 'medium'),
-                    source_document=f"ALM_{config['platform']}"
-                )
-                if 'tags' in alm_req:
-                    new_req.set_regulatory_standards(alm_req['tags'])
-                
-                db.session.add(new_req)
-            
-            synced_count += 1
+        # Sync to local database with a single INSERT ... ON CONFLICT DO UPDATE
+        source_document = f"ALM_{config.platform}"
+        alm_by_id = {alm_req.id: alm_req for alm_req in alm_requirements}
+        rows = []
+        for alm_id, alm_req in alm_by_id.items():
+            row = {
+                'requirement_id': alm_id,
+                'title': alm_req.title,
+                'description': alm_req.description,
+                'type': 'functional',  # Default type, only used for new rows
+                'priority': alm_req.priority or 'medium',
+                'source_document': source_document
+            }
+            if alm_req.tags is not None:
+                row['regulatory_standards'] = alm_req.tags
+            rows.append(row)
+        
+        _upsert_rows(Requirement, 'requirement_id', rows, REQUIREMENT_SYNC_COLUMNS)
+        synced_count = len(alm_requirements)
         
         db.session.commit()
         
         return jsonify({
-            'message': f'Successfully synced {synced_count} requirements from {config["platform"]}',
+            'message': f'Successfully synced {synced_count} requirements from {config.platform}',
             'synced_count': synced_count,
-            'platform': config['platform']
+            'platform': config.platform
         }), 200
         
     except Exception as e:
@@ -152,64 +295,47 @@ def sync_requirements_from_alm(config_id):
 def sync_test_cases_from_alm(config_id):
     """Sync test cases from ALM platform to local database."""
     try:
-        if config_id not in alm_configurations:
+        config = _get_config(config_id)
+        if config is None:
             return jsonify({'error': 'ALM configuration not found'}), 404
         
-        config = alm_configurations[config_id]
-        
-        # Create ALM integration instance
-        integration = ALMIntegrationFactory.create_integration(
-            platform=config['platform'],
-            base_url=config['base_url'],
-            username=config['username'],
-            password=config['password'],
-            project_key=config.get('project_key')
-        )
+        # Reuse the pooled ALM integration instance
+        integration = _get_integration(config)
         
         # Get test cases from ALM platform
         alm_test_cases = integration.get_test_cases()
         
-        # Sync to local database
-        synced_count = 0
-        for alm_tc in alm_test_cases:
-            # Check if test case already exists
-            existing_tc = TestCase.query.filter_by(test_case_id=alm_tc['id']).first()
-            
-            if existing_tc:
-                # Update existing test case
-                existing_tc.title = alm_tc['title']
-                existing_tc.description = alm_tc['description']
-                existing_tc.priority = alm_tc.get('priority', 'medium')
-                if 'tags' in alm_tc:
-                    existing_tc.set_compliance_tags(alm_tc['tags'])
-            else:
-                # Create new test case (need to find or create a requirement to link to)
-                # For now, create without requirement link
-                new_tc = TestCase(
-                    test_case_id=alm_tc['id'],
-                    title=alm_tc['title'],
-                    description=alm_tc['description'],
-                    preconditions='',
-                    expected_results='',
-                    postconditions='',
-                    priority=alm_tc.get('priority', 'medium'),
-                    requirement_id=1  # Placeholder - should be properly linked
-                )
-                new_tc.set_test_steps([])
-                new_tc.set_test_data({})
-                if 'tags' in alm_tc:
-                    new_tc.set_compliance_tags(alm_tc['tags'])
-                
-                db.session.add(new_tc)
-            
-            synced_count += 1
+        # Sync to local database with a single INSERT ... ON CONFLICT DO UPDATE
+        alm_by_id = {alm_tc.id: alm_tc for alm_tc in alm_test_cases}
+        rows = []
+        for alm_id, alm_tc in alm_by_id.items():
+            # New test cases need a requirement to link to;
+            # for now, create them without a real requirement link
+            row = {
+                'test_case_id': alm_id,
+                'title': alm_tc.title,
+                'description': alm_tc.description,
+                'preconditions': '',
+                'expected_results': '',
+                'postconditions': '',
+                'priority': alm_tc.priority or 'medium',
+                'test_steps': [],
+                'test_data': {},
+                'requirement_id': 1  # Placeholder - should be properly linked
+            }
+            if alm_tc.tags is not None:
+                row['compliance_tags'] = alm_tc.tags
+            rows.append(row)
+        
+        _upsert_rows(TestCase, 'test_case_id', rows, TEST_CASE_SYNC_COLUMNS)
+        synced_count = len(alm_test_cases)
         
         db.session.commit()
         
         return jsonify({
-            'message': f'Successfully synced {synced_count} test cases from {config["platform"]}',
+            'message': f'Successfully synced {synced_count} test cases from {config.platform}',
             'synced_count': synced_count,
-            'platform': config['platform']
+            'platform': config.platform
         }), 200
         
     except Exception as e:
@@ -220,20 +346,14 @@ def sync_test_cases_from_alm(config_id):
 def export_requirement_to_alm(config_id, req_id):
     """Export a requirement from local database to ALM platform."""
     try:
-        if config_id not in alm_configurations:
+        config = _get_config(config_id)
+        if config is None:
             return jsonify({'error': 'ALM configuration not found'}), 404
         
         requirement = Requirement.query.get_or_404(req_id)
-        config = alm_configurations[config_id]
-        
-        # Create ALM integration instance
-        integration = ALMIntegrationFactory.create_integration(
-            platform=config['platform'],
-            base_url=config['base_url'],
-            username=config['username'],
-            password=config['password'],
-            project_key=config.get('project_key')
-        )
+        
+        # Reuse the pooled ALM integration instance
+        integration = _get_integration(config)
         
         # Export requirement to ALM platform
         result = integration.create_requirement(requirement.to_dict())
@@ -242,7 +362,7 @@ def export_requirement_to_alm(config_id, req_id):
             return jsonify({'error': result['error']}), 500
         
         return jsonify({
-            'message': f'Successfully exported requirement to {config["platform"]}',
+            'message': f'Successfully exported requirement to {config.platform}',
             'alm_result': result,
             'requirement_id': requirement.requirement_id
         }), 200
@@ -254,20 +374,14 @@ def export_requirement_to_alm(config_id, req_id):
 def export_test_case_to_alm(config_id, tc_id):
     """Export a test case from local database to ALM platform."""
     try:
-        if config_id not in alm_configurations:
+        config = _get_config(config_id)
+        if config is None:
             return jsonify({'error': 'ALM configuration not found'}), 404
         
         test_case = TestCase.query.get_or_404(tc_id)
-        config = alm_configurations[config_id]
-        
-        # Create ALM integration instance
-        integration = ALMIntegrationFactory.create_integration(
-            platform=config['platform'],
-            base_url=config['base_url'],
-            username=config['username'],
-            password=config['password'],
-            project_key=config.get('project_key')
-        )
+        
+        # Reuse the pooled ALM integration instance
+        integration = _get_integration(config)
         
         # Export test case to ALM platform
         result = integration.create_test_case(test_case.to_dict())
@@ -276,7 +390,7 @@ def export_test_case_to_alm(config_id, tc_id):
             return jsonify({'error': result['error']}), 500
         
         return jsonify({
-            'message': f'Successfully exported test case to {config["platform"]}',
+            'message': f'Successfully exported test case to {config.platform}',
             'alm_result': result,
             'test_case_id': test_case.test_case_id
         }), 200
@@ -288,108 +402,98 @@ def export_test_case_to_alm(config_id, tc_id):
 def export_all_to_alm(config_id):
     """Export all requirements and test cases to ALM platform."""
     try:
-        if config_id not in alm_configurations:
+        config = _get_config(config_id)
+        if config is None:
             return jsonify({'error': 'ALM configuration not found'}), 404
         
-        config = alm_configurations[config_id]
-        
-        # Create ALM integration instance
-        integration = ALMIntegrationFactory.create_integration(
-            platform=config['platform'],
-            base_url=config['base_url'],
-            username=config['username'],
-            password=config['password'],
-            project_key=config.get('project_key')
-        )
-        
-        # Export all requirements
-        requirements = Requirement.query.all()
-        exported_requirements = 0
-        requirement_errors = []
-        
-        for req in requirements:
-            try:
-                result = integration.create_requirement(req.to_dict())
-                if 'error' not in result:
-                    exported_requirements += 1
-                else:
-                    requirement_errors.append(f"REQ {req.requirement_id}: {result['error']}")
-            except Exception as e:
-                requirement_errors.append(f"REQ {req.requirement_id}: {str(e)}")
-        
-        # Export all test cases
-        test_cases = TestCase.query.all()
-        exported_test_cases = 0
-        test_case_errors = []
-        
-        for tc in test_cases:
-            try:
-                result = integration.create_test_case(tc.to_dict())
-                if 'error' not in result:
-                    exported_test_cases += 1
-                else:
-                    test_case_errors.append(f"TC {tc.test_case_id}: {result['error']}")
-            except Exception as e:
-                test_case_errors.append(f"TC {tc.test_case_id}: {str(e)}")
+        # Reuse the pooled ALM integration instance
+        integration = _get_integration(config)
+        
+        # Export all requirements and test cases, keeping up to
+        # EXPORT_MAX_WORKERS ALM requests in flight while rows stream from the DB
+        with ThreadPoolExecutor(max_workers=EXPORT_MAX_WORKERS) as executor:
+            exported_requirements, requirement_errors = _export_concurrently(
+                executor,
+                integration.create_requirement,
+                ((req.requirement_id, req.to_dict()) for req in Requirement.query.yield_per(EXPORT_YIELD_PER)),
+                'REQ'
+            )
+            exported_test_cases, test_case_errors = _export_concurrently(
+                executor,
+                integration.create_test_case,
+                ((tc.test_case_id, tc.to_dict()) for tc in TestCase.query.yield_per(EXPORT_YIELD_PER)),
+                'TC'
+            )
         
         return jsonify({
-            'message': f'Export completed to {config["platform"]}',
+            'message': f'Export completed to {config.platform}',
             'exported_requirements': exported_requirements,
             'exported_test_cases': exported_test_cases,
             'requirement_errors': requirement_errors,
             'test_case_errors': test_case_errors,
-            'platform': config['platform']
+            'platform': config.platform
         }), 200
         
     except Exception as e:
         return jsonify({'error': f'Error during bulk export: {str(e)}'}), 500
 
+@integrations_bp.route('/alm/<config_id>/test-connection', methods=['GET'])
+def get_alm_connection_status(config_id):
+    """Get the result of the last connection test for an ALM configuration."""
+    config = _get_config(config_id)
+    if config is None:
+        return jsonify({'error': 'ALM configuration not found'}), 404
+    
+    return jsonify({
+        'config_id': config_id,
+        'connection_status': config.connection_status,
+        'platform': config.platform
+    }), 200
+
 @integrations_bp.route('/alm/<config_id>/test-connection', methods=['POST'])
 def test_alm_connection(config_id):
     """Test connection to ALM platform."""
     try:
-        if config_id not in alm_configurations:
+        config = _get_config(config_id)
+        if config is None:
             return jsonify({'error': 'ALM configuration not found'}), 404
         
-        config = alm_configurations[config_id]
+        # Reuse the pooled ALM integration instance
+        integration = _get_integration(config)
         
-        # Create ALM integration instance
-        integration = ALMIntegrationFactory.create_integration(
-            platform=config['platform'],
-            base_url=config['base_url'],
-            username=config['username'],
-            password=config['password'],
-            project_key=config.get('project_key')
-        )
+        # Test connection with a single lightweight authenticated request
+        result = integration.ping()
+        if 'error' in result:
+            raise ConnectionError(result['error'])
         
-        # Test connection by trying to get requirements
-        requirements = integration.get_requirements()
-        test_cases = integration.get_test_cases()
+        _update_config(config_id, connection_status='success')
         
-        return jsonify({
+        response = {
             'status': 'success',
-            'message': f'Successfully connected to {config["platform"]}',
-            'requirements_count': len(requirements),
-            'test_cases_count': len(test_cases),
-            'platform': config['platform']
-        }), 200
+            'message': f'Successfully connected to {config.platform}',
+            'platform': config.platform
+        }
+        # Item counts cost extra ALM queries, so they are opt-in
+        if request.args.get('include_counts', 'false').lower() == 'true':
+            response.update(integration.get_item_counts())
+        
+        return jsonify(response), 200
         
     except Exception as e:
+        _update_config(config_id, connection_status=f'connection_failed: {str(e)}')
         return jsonify({
             'status': 'failed',
             'error': f'Connection test failed: {str(e)}',
-            'platform': config.get('platform', 'unknown')
+            'platform': config.platform if config else 'unknown'
         }), 500
 
 @integrations_bp.route('/alm/<config_id>/disable', methods=['POST'])
 def disable_alm_integration(config_id):
     """Disable ALM integration."""
     try:
-        if config_id not in alm_configurations:
+        if not _update_config(config_id, enabled=False):
             return jsonify({'error': 'ALM configuration not found'}), 404
         
-        alm_configurations[config_id]['enabled'] = False
-        
         return jsonify({
             'message': f'ALM integration {config_id} disabled successfully'
         }), 200
@@ -401,11 +505,9 @@ def disable_alm_integration(config_id):
 def enable_alm_integration(config_id):
     """Enable ALM integration."""
     try:
-        if config_id not in alm_configurations:
+        if not _update_config(config_id, enabled=True):
             return jsonify({'error': 'ALM configuration not found'}), 404
         
-        alm_configurations[config_id]['enabled'] = True
-        
         return jsonify({
             'message': f'ALM integration {config_id} enabled successfully'
         }), 200
@@ -1,5 +1,8 @@
 from flask import Blueprint, request, jsonify, current_app
 from werkzeug.utils import secure_filename
+from sqlalchemy import and_, bindparam, func, insert, not_, select, union_all
+from functools import lru_cache
+from itertools import product
 import os
 import tempfile
 from src.models.requirement import db, Requirement, TestCase, TraceabilityLink
@@ -8,9 +11,185 @@ from src.services.document_parser import DocumentParser
 
 requirements_bp = Blueprint('requirements', __name__)
 
-# Initialize services
-ai_processor = AIProcessor()
-document_parser = DocumentParser()
+# Services are created on first use, so workers that never serve these
+# endpoints skip the OpenAI client setup
+@lru_cache(maxsize=None)
+def get_ai_processor():
+    return AIProcessor()
+
+@lru_cache(maxsize=None)
+def get_document_parser():
+    return DocumentParser()
+
+# JSON columns that to_dict() reports as an empty list/dict instead of null
+REQUIREMENT_JSON_DEFAULTS = {'regulatory_standards': list}
+TEST_CASE_JSON_DEFAULTS = {'test_steps': list, 'test_data': dict, 'compliance_tags': list}
+
+# Filterable list endpoints: (query arg, column) pairs
+REQUIREMENT_FILTERS = (
+    ('type', Requirement.type),
+    ('priority', Requirement.priority),
+    ('source_document', Requirement.source_document)
+)
+TEST_CASE_FILTERS = (
+    ('priority', TestCase.priority),
+    ('requirement_id', TestCase.requirement_id)
+)
+
+# Pagination for list endpoints: ?after_id=<last id seen>&limit=<n>, with
+# ?offset=<n> also accepted (applied after the after_id cursor)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+def _filtered_selects(table, filters):
+    """
+    Prebuild one SELECT per combination of filters, keyed by a tuple of
+    booleans, with bindparam() placeholders so each combination always hits
+    SQLAlchemy's compiled statement cache. Every statement is keyset
+    paginated on id through the after_id/offset/limit parameters.
+    """
+    statements = {}
+    for present in product((False, True), repeat=len(filters)):
+        stmt = select(table).where(table.c.id > bindparam('after_id'))
+        for (name, column), used in zip(filters, present):
+            if used:
+                stmt = stmt.where(column == bindparam(name))
+        statements[present] = (
+            stmt.order_by(table.c.id).offset(bindparam('offset')).limit(bindparam('limit'))
+        )
+    return statements
+
+def _filtered_counts(table, filters):
+    """COUNT(*) counterparts of _filtered_selects(), over the whole filtered set."""
+    statements = {}
+    for present in product((False, True), repeat=len(filters)):
+        stmt = select(func.count()).select_from(table)
+        for (name, column), used in zip(filters, present):
+            if used:
+                stmt = stmt.where(column == bindparam(name))
+        statements[present] = stmt
+    return statements
+
+REQUIREMENT_SELECTS = _filtered_selects(Requirement.__table__, REQUIREMENT_FILTERS)
+TEST_CASE_SELECTS = _filtered_selects(TestCase.__table__, TEST_CASE_FILTERS)
+REQUIREMENT_COUNTS = _filtered_counts(Requirement.__table__, REQUIREMENT_FILTERS)
+TEST_CASE_COUNTS = _filtered_counts(TestCase.__table__, TEST_CASE_FILTERS)
+
+def _int_arg(name, default, minimum):
+    """Read an integer query parameter, raising ValueError if it is malformed or below minimum."""
+    raw = request.args.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer')
+    if value < minimum:
+        raise ValueError(f'{name} must be at least {minimum}')
+    return value
+
+def _page_params():
+    """
+    Read the after_id/offset/limit pagination parameters, capping the page
+    size. Raises ValueError for malformed or out-of-range values.
+    """
+    return {
+        'after_id': _int_arg('after_id', 0, 0),
+        'offset': _int_arg('offset', 0, 0),
+        'limit': min(_int_arg('limit', DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE)
+    }
+
+def _next_after_id(rows, page):
+    """Cursor for the next page, or None when this page was the last one."""
+    return rows[-1]['id'] if len(rows) == page['limit'] else None
+
+def _filter_params(filters, args):
+    """Bind parameters for the filters present in args, and the statement key they select."""
+    params = {name: args.get(name) for name, _ in filters if args.get(name)}
+    return params, tuple(name in params for name, _ in filters)
+
+def _execute_filtered(statements, filters, args, page):
+    """Pick the prebuilt statement for the filters present in args and run it for one page."""
+    params, present = _filter_params(filters, args)
+    return db.session.execute(statements[present], {**params, **page})
+
+def _count_filtered(statements, filters, args):
+    """Count every row matching the filters present in args, across all pages."""
+    params, present = _filter_params(filters, args)
+    return db.session.execute(statements[present], params).scalar_one()
+
+def _rows_to_dicts(result, json_defaults):
+    """
+    Turn a Core result into to_dict()-shaped dicts without building ORM instances.
+    """
+    rows = []
+    for row in result.mappings():
+        row = dict(row)
+        for key, factory in json_defaults.items():
+            if row[key] is None:
+                row[key] = factory()
+        rows.append(row)
+    return rows
+
+def _next_test_case_numbers(requirement_ids):
+    """
+    First free sequence number for new test cases of each requirement, so
+    repeated generation runs keep their stored test case IDs distinct.
+    """
+    counts = dict(db.session.execute(
+        select(TestCase.requirement_id, func.count())
+        .where(TestCase.requirement_id.in_(requirement_ids))
+        .group_by(TestCase.requirement_id)
+    ).all())
+    return {requirement_id: counts.get(requirement_id, 0) + 1 for requirement_id in requirement_ids}
+
+def _test_case_rows(requirement_id, requirement_label, test_cases_data, first_number=1):
+    """
+    Build insert rows for AI-generated test cases of one requirement. The
+    stored test_case_id is always derived from the requirement (the model
+    numbers every requirement's cases from TC-001, and the column is unique).
+    """
+    return [
+        {
+            'test_case_id': f'TC-{requirement_label}-{number:03d}',
+            'title': tc_data.get('title', 'Untitled Test Case'),
+            'description': tc_data.get('description', ''),
+            'preconditions': tc_data.get('preconditions', ''),
+            'expected_results': tc_data.get('expected_results', ''),
+            'postconditions': tc_data.get('postconditions', ''),
+            'priority': tc_data.get('priority', 'medium'),
+            'requirement_id': requirement_id,
+            'test_steps': tc_data.get('test_steps', []),
+            'test_data': tc_data.get('test_data', {}),
+            'compliance_tags': tc_data.get('compliance_tags', [])
+        }
+        for number, tc_data in enumerate(test_cases_data, start=first_number)
+    ]
+
+def _save_generated_test_cases(rows):
+    """
+    Insert test case rows with INSERT ... RETURNING and link each one to its
+    requirement in a single executemany. Returns the saved test cases as dicts.
+    """
+    if not rows:
+        return []
+    
+    test_cases = db.session.scalars(
+        insert(TestCase).returning(TestCase, sort_by_parameter_order=True),
+        rows
+    ).all()
+    
+    db.session.execute(insert(TraceabilityLink), [
+        {
+            'source_type': 'requirement',
+            'source_id': test_case.requirement_id,
+            'target_type': 'test_case',
+            'target_id': test_case.id,
+            'link_type': 'covers'
+        }
+        for test_case in test_cases
+    ])
+    return [test_case.to_dict() for test_case in test_cases]
 
 @requirements_bp.route('/upload', methods=['POST'])
 def upload_requirements_document():
@@ -23,40 +202,43 @@ def upload_requirements_document():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        if not document_parser.is_supported_format(file.filename):
+        if not get_document_parser().is_supported_format(file.filename):
             return jsonify({
-                'error': f'Unsupported file format. Supported formats: {document_parser.get_supported_formats()}'
+                'error': f'Unsupported file format. Supported formats: {get_document_parser().get_supported_formats()}'
             }), 400
         
-        # Parse the document
-        file_content = file.read()
-        parsed_result = document_parser.parse_document(file.filename, file_content)
+        # Parse the document straight from the upload stream
+        parsed_result = get_document_parser().parse_stream(file.filename, file.stream)
         
         if 'error' in parsed_result:
             return jsonify({'error': parsed_result['error']}), 400
         
         # Extract requirements using AI
-        requirements_data = ai_processor.extract_requirements_from_text(
+        requirements_data = get_ai_processor().extract_requirements_from_text(
             parsed_result['content'], 
             source_document=file.filename
         )
         
-        # Save requirements to database
+        # Save requirements to database in one INSERT ... RETURNING round trip
+        rows = [
+            {
+                'requirement_id': req_data.get('requirement_id', f'REQ-{i:03d}'),
+                'title': req_data.get('title', 'Untitled Requirement'),
+                'description': req_data.get('description', ''),
+                'type': req_data.get('type', 'functional'),
+                'priority': req_data.get('priority', 'medium'),
+                'source_document': file.filename,
+                'regulatory_standards': req_data.get('regulatory_standards', [])
+            }
+            for i, req_data in enumerate(requirements_data, start=1)
+        ]
         saved_requirements = []
-        for req_data in requirements_data:
-            requirement = Requirement(
-                requirement_id=req_data.get('requirement_id', f'REQ-{len(saved_requirements)+1:03d}'),
-                title=req_data.get('title', 'Untitled Requirement'),
-                description=req_data.get('description', ''),
-                type=req_data.get('type', 'functional'),
-                priority=req_data.get('priority', 'medium'),
-                source_document=file.filename
-            )
-            requirement.set_regulatory_standards(req_data.get('regulatory_standards', []))
-            
-            db.session.add(requirement)
-            db.session.flush()  # Get the ID
-            saved_requirements.append(requirement.to_dict())
+        if rows:
+            requirements = db.session.scalars(
+                insert(Requirement).returning(Requirement, sort_by_parameter_order=True),
+                rows
+            ).all()
+            saved_requirements = [requirement.to_dict() for requirement in requirements]
         
         db.session.commit()
         
@@ -72,28 +254,24 @@ def upload_requirements_document():
 
 @requirements_bp.route('/requirements', methods=['GET'])
 def get_requirements():
-    """Get all requirements with optional filtering."""
+    """Get requirements with optional filtering, one keyset page at a time."""
     try:
-        # Query parameters
-        req_type = request.args.get('type')
-        priority = request.args.get('priority')
-        source_document = request.args.get('source_document')
-        
-        # Build query
-        query = Requirement.query
-        
-        if req_type:
-            query = query.filter(Requirement.type == req_type)
-        if priority:
-            query = query.filter(Requirement.priority == priority)
-        if source_document:
-            query = query.filter(Requirement.source_document == source_document)
-        
-        requirements = query.all()
+        page = _page_params()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    try:
+        # Filter on type, priority and source_document query parameters over
+        # plain columns; rows are serialized without ORM hydration
+        requirements = _rows_to_dicts(
+            _execute_filtered(REQUIREMENT_SELECTS, REQUIREMENT_FILTERS, request.args, page),
+            REQUIREMENT_JSON_DEFAULTS
+        )
         
         return jsonify({
-            'requirements': [req.to_dict() for req in requirements],
-            'total': len(requirements)
+            'requirements': requirements,
+            'total': _count_filtered(REQUIREMENT_COUNTS, REQUIREMENT_FILTERS, request.args),
+            'next_after_id': _next_after_id(requirements, page)
         }), 200
         
     except Exception as e:
@@ -115,40 +293,13 @@ def generate_test_cases(req_id):
         requirement = Requirement.query.get_or_404(req_id)
         
         # Generate test cases using AI
-        test_cases_data = ai_processor.generate_test_cases(requirement.to_dict())
-        
-        # Save test cases to database
-        saved_test_cases = []
-        for tc_data in test_cases_data:
-            test_case = TestCase(
-                test_case_id=tc_data.get('test_case_id', f'TC-{req_id}-{len(saved_test_cases)+1:03d}'),
-                title=tc_data.get('title', 'Untitled Test Case'),
-                description=tc_data.get('description', ''),
-                preconditions=tc_data.get('preconditions', ''),
-                expected_results=tc_data.get('expected_results', ''),
-                postconditions=tc_data.get('postconditions', ''),
-                priority=tc_data.get('priority', 'medium'),
-                requirement_id=requirement.id
-            )
-            
-            test_case.set_test_steps(tc_data.get('test_steps', []))
-            test_case.set_test_data(tc_data.get('test_data', {}))
-            test_case.set_compliance_tags(tc_data.get('compliance_tags', []))
-            
-            db.session.add(test_case)
-            db.session.flush()
-            
-            # Create traceability link
-            traceability_link = TraceabilityLink(
-                source_type='requirement',
-                source_id=requirement.id,
-                target_type='test_case',
-                target_id=test_case.id,
-                link_type='covers'
-            )
-            db.session.add(traceability_link)
-            
-            saved_test_cases.append(test_case.to_dict())
+        test_cases_data = get_ai_processor().generate_test_cases(requirement.to_dict())
+        
+        # Save test cases to database in one INSERT ... RETURNING round trip
+        first_number = _next_test_case_numbers([requirement.id])[requirement.id]
+        saved_test_cases = _save_generated_test_cases(
+            _test_case_rows(requirement.id, requirement.requirement_id, test_cases_data, first_number)
+        )
         
         db.session.commit()
         
@@ -161,17 +312,121 @@ def generate_test_cases(req_id):
         db.session.rollback()
         return jsonify({'error': f'Error generating test cases: {str(e)}'}), 500
 
+@requirements_bp.route('/requirements/generate-tests-bulk', methods=['POST'])
+def generate_test_cases_bulk():
+    """
+    Generate test cases for several requirements with batched AI calls.
+    With use_batch_api the work is queued on the OpenAI Batch API instead and
+    the results are collected later from GET /requirements/generate-tests-bulk/<batch_id>.
+    """
+    try:
+        data = request.get_json() or {}
+        req_ids = data.get('req_ids')
+        if not req_ids or not isinstance(req_ids, list):
+            return jsonify({'error': 'req_ids must be a non-empty list'}), 400
+        
+        requirements = Requirement.query.filter(Requirement.id.in_(req_ids)).all()
+        found_ids = {requirement.id for requirement in requirements}
+        missing_ids = [req_id for req_id in req_ids if req_id not in found_ids]
+        if missing_ids:
+            return jsonify({'error': f'Requirements not found: {missing_ids}'}), 404
+        
+        if data.get('use_batch_api'):
+            batch_id = get_ai_processor().submit_test_case_batch(
+                [requirement.to_dict() for requirement in requirements], key='id'
+            )
+            return jsonify({
+                'message': f'Queued test case generation for {len(requirements)} requirements',
+                'batch_id': batch_id
+            }), 202
+        
+        # Generate test cases for all requirements in as few AI calls as possible
+        test_cases_by_requirement = get_ai_processor().generate_test_cases_batch(
+            [requirement.to_dict() for requirement in requirements]
+        )
+        
+        # Save all test cases and their traceability links in one round trip each
+        first_numbers = _next_test_case_numbers(list(found_ids))
+        rows = []
+        for requirement in requirements:
+            rows.extend(_test_case_rows(
+                requirement.id,
+                requirement.requirement_id,
+                test_cases_by_requirement.get(requirement.requirement_id, []),
+                first_numbers[requirement.id]
+            ))
+        saved_test_cases = _save_generated_test_cases(rows)
+        
+        db.session.commit()
+        
+        return jsonify({
+            'message': f'Successfully generated {len(saved_test_cases)} test cases for {len(requirements)} requirements',
+            'test_cases': saved_test_cases
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Error generating test cases: {str(e)}'}), 500
+
+@requirements_bp.route('/requirements/generate-tests-bulk/<batch_id>', methods=['GET'])
+def collect_bulk_test_cases(batch_id):
+    """Store the test cases of a finished Batch API job; 202 while it is still running."""
+    try:
+        ai_processor = get_ai_processor()
+        test_cases_by_requirement = ai_processor.poll_test_case_batch(batch_id)
+        if test_cases_by_requirement is None:
+            return jsonify({'message': 'Batch is still running', 'batch_id': batch_id}), 202
+        
+        # Requirements deleted since the batch was submitted are skipped
+        requirement_labels = dict(db.session.execute(
+            select(Requirement.id, Requirement.requirement_id)
+            .where(Requirement.id.in_([int(key) for key in test_cases_by_requirement]))
+        ).all())
+        requirement_ids = set(requirement_labels)
+        first_numbers = _next_test_case_numbers(list(requirement_ids))
+        rows = []
+        for key, test_cases_data in test_cases_by_requirement.items():
+            if int(key) in requirement_ids:
+                rows.extend(_test_case_rows(
+                    int(key), requirement_labels[int(key)], test_cases_data, first_numbers[int(key)]
+                ))
+        saved_test_cases = _save_generated_test_cases(rows)
+        
+        db.session.commit()
+        # Results are collected exactly once: later polls see the files gone
+        ai_processor.discard_test_case_batch(batch_id)
+        
+        return jsonify({
+            'message': f'Successfully generated {len(saved_test_cases)} test cases for {len(requirement_ids)} requirements',
+            'test_cases': saved_test_cases
+        }), 200
+        
+    except LookupError as e:
+        return jsonify({'error': str(e)}), 410
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'Error collecting test cases: {str(e)}'}), 500
+
 @requirements_bp.route('/requirements/<int:req_id>/test-cases', methods=['GET'])
 def get_requirement_test_cases(req_id):
-    """Get all test cases for a specific requirement."""
+    """Get test cases for a specific requirement, one keyset page at a time."""
+    try:
+        page = _page_params()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         requirement = Requirement.query.get_or_404(req_id)
-        test_cases = TestCase.query.filter_by(requirement_id=req_id).all()
+        test_cases = _rows_to_dicts(
+            _execute_filtered(TEST_CASE_SELECTS, TEST_CASE_FILTERS, {'requirement_id': req_id}, page),
+            TEST_CASE_JSON_DEFAULTS
+        )
         
         return jsonify({
             'requirement': requirement.to_dict(),
-            'test_cases': [tc.to_dict() for tc in test_cases],
-            'total_test_cases': len(test_cases)
+            'test_cases': test_cases,
+            'total_test_cases': _count_filtered(TEST_CASE_COUNTS, TEST_CASE_FILTERS, {'requirement_id': req_id}),
+            'next_after_id': _next_after_id(test_cases, page)
         }), 200
         
     except Exception as e:
@@ -179,23 +434,23 @@ def get_requirement_test_cases(req_id):
 
 @requirements_bp.route('/test-cases', methods=['GET'])
 def get_all_test_cases():
-    """Get all test cases with optional filtering."""
+    """Get test cases with optional filtering, one keyset page at a time."""
     try:
-        priority = request.args.get('priority')
-        requirement_id = request.args.get('requirement_id')
-        
-        query = TestCase.query
-        
-        if priority:
-            query = query.filter(TestCase.priority == priority)
-        if requirement_id:
-            query = query.filter(TestCase.requirement_id == requirement_id)
-        
-        test_cases = query.all()
+        page = _page_params()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    try:
+        # Filter on priority and requirement_id query parameters
+        test_cases = _rows_to_dicts(
+            _execute_filtered(TEST_CASE_SELECTS, TEST_CASE_FILTERS, request.args, page),
+            TEST_CASE_JSON_DEFAULTS
+        )
         
         return jsonify({
-            'test_cases': [tc.to_dict() for tc in test_cases],
-            'total': len(test_cases)
+            'test_cases': test_cases,
+            'total': _count_filtered(TEST_CASE_COUNTS, TEST_CASE_FILTERS, request.args),
+            'next_after_id': _next_after_id(test_cases, page)
         }), 200
         
     except Exception as e:
@@ -217,7 +472,7 @@ def analyze_requirement_compliance(req_id):
         requirement = Requirement.query.get_or_404(req_id)
         
         # Analyze compliance using AI
-        compliance_analysis = ai_processor.analyze_requirement_compliance(requirement.description)
+        compliance_analysis = get_ai_processor().analyze_requirement_compliance(requirement.description)
         
         return jsonify({
             'requirement_id': requirement.requirement_id,
@@ -233,10 +488,16 @@ def get_requirement_traceability(req_id):
     try:
         requirement = Requirement.query.get_or_404(req_id)
         
-        # Get all traceability links for this requirement
-        links = TraceabilityLink.query.filter(
-            (TraceabilityLink.source_id == req_id) | 
-            (TraceabilityLink.target_id == req_id)
+        # Get all traceability links for this requirement. Each UNION ALL branch
+        # is served by its own (type, id) index instead of a scan for the OR.
+        is_source = and_(TraceabilityLink.source_type == 'requirement', TraceabilityLink.source_id == req_id)
+        is_target = and_(TraceabilityLink.target_type == 'requirement', TraceabilityLink.target_id == req_id)
+        links_stmt = union_all(
+            select(TraceabilityLink).where(is_source),
+            select(TraceabilityLink).where(is_target, not_(is_source))
+        )
+        links = db.session.scalars(
+            select(TraceabilityLink).from_statement(links_stmt)
         ).all()
         
         return jsonify({
@@ -259,7 +520,7 @@ def analyze_test_coverage(req_id):
         
         # Analyze coverage using AI
         test_cases_data = [tc.to_dict() for tc in test_cases]
-        coverage_analysis = ai_processor.validate_test_case_coverage(
+        coverage_analysis = get_ai_processor().validate_test_case_coverage(
             requirement.to_dict(), 
             test_cases_data
         )
@@ -279,6 +540,6 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'service': 'AI Test Case Generator',
-        'supported_formats': document_parser.get_supported_formats()
+        'supported_formats': get_document_parser().get_supported_formats()
     }), 200
 
@@ -1,299 +1,899 @@
 import os
-import json
-import re
-from typing import List, Dict, Any, Tuple
-from openai import OpenAI
+import hashlib
+import logging
+import asyncio
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple, Callable, Iterator, AsyncIterator, Optional
+import httpx
+import ijson
+import orjson
+import tiktoken
+from diskcache import Cache
+from openai import OpenAI, AsyncOpenAI, APIError, NotFoundError
+from src.services.ai_prompts import SYSTEM_PROMPTS, RESPONSE_FORMATS, RESULT_KEYS, FAST_TASKS
+from src.services.semantic_cache import SemanticCache
+
+logger = logging.getLogger(__name__)
+
+HEALTHCARE_STANDARDS = (
+    "FDA 21 CFR Part 820",
+    "IEC 62304",
+    "ISO 13485",
+    "ISO 9001",
+    "ISO 27001",
+    "HIPAA",
+    "GDPR"
+)
+
+# Upper bound on in-flight async completions per event loop
+OPENAI_MAX_CONCURRENCY = int(os.environ.get('OPENAI_MAX_CONCURRENCY', '8'))
+# Connection pool shared by all OpenAI calls of the process
+OPENAI_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+OPENAI_HTTP_TIMEOUT = 60.0
+# Retries of 408/409/429/5xx responses, timeouts and connection errors, with
+# exponential backoff and jitter that honours Retry-After
+OPENAI_MAX_RETRIES = int(os.environ.get('OPENAI_MAX_RETRIES', '4'))
+# Account-level rate limits; 0 disables the corresponding throttle
+OPENAI_REQUESTS_PER_MINUTE = int(os.environ.get('OPENAI_REQUESTS_PER_MINUTE', '0'))
+OPENAI_TOKENS_PER_MINUTE = int(os.environ.get('OPENAI_TOKENS_PER_MINUTE', '0'))
+
+# Requirements per batched call, and the estimated requirement payload allowed per call
+DEFAULT_BATCH_SIZE = 15
+BATCH_PROMPT_TOKEN_BUDGET = 6000
+BATCH_REQUIREMENT_FIELDS = ('requirement_id', 'title', 'description', 'type', 'priority', 'regulatory_standards')
+
+# Token accounting: every model in use has a 128k context and the o200k_base tokenizer;
+# prompts longer than the context minus the task's completion cap are rejected before the call
+TOKEN_ENCODING = 'o200k_base'
+# Characters per token assumed when the tokenizer cannot be loaded; deliberately
+# low, so estimates err on the side of more tokens
+FALLBACK_CHARS_PER_TOKEN = 3
+MODEL_CONTEXT_TOKENS = int(os.environ.get('OPENAI_CONTEXT_TOKENS', '128000'))
+# Largest max_completion_tokens the models accept
+MODEL_MAX_COMPLETION_TOKENS = int(os.environ.get('OPENAI_MAX_COMPLETION_TOKENS', '16384'))
+# Requirement extraction reads long documents in overlapping windows of this many tokens
+EXTRACTION_WINDOW_TOKENS = 12000
+EXTRACTION_WINDOW_OVERLAP = 200
+# Completion tokens per requirement of the batched tasks, the cap of their single-requirement task
+BATCH_ITEM_COMPLETION_TOKENS = {
+    'analyze_compliance_batch': 600,
+    'generate_test_cases_batch': 3000,
+    'identify_entities_batch': 800,
+}
+# Output cap per task (max_completion_tokens); it is also what each call reserves
+# against the TPM limit. An extraction may restate its whole window, and a batch
+# needs room for every requirement in it; batches are cut down to what their cap
+# holds. A response that still hits its cap raises CompletionTruncatedError
+MAX_COMPLETION_TOKENS = {
+    'extract_requirements': min(EXTRACTION_WINDOW_TOKENS, MODEL_MAX_COMPLETION_TOKENS),
+    'analyze_compliance': 600,
+    'generate_test_cases': 3000,
+    'generate_functional_test_cases': 1500,
+    'generate_regulatory_test_cases': 1500,
+    'validate_coverage': 500,
+    'identify_entities': 800,
+    **{
+        task: min(tokens * DEFAULT_BATCH_SIZE, MODEL_MAX_COMPLETION_TOKENS)
+        for task, tokens in BATCH_ITEM_COMPLETION_TOKENS.items()
+    },
+}
+
+# Batch API states in which results are not available yet
+BATCH_PENDING_STATUSES = ('validating', 'in_progress', 'finalizing', 'cancelling')
+
+# On-disk cache of model responses, keyed by the full request; TTL in seconds per task
+RESPONSE_CACHE_DIR = os.environ.get('OPENAI_RESPONSE_CACHE_DIR', '.ai_cache')
+RESPONSE_CACHE_TTLS = {
+    'extract_requirements': 86400,
+    'analyze_compliance': 1800,
+    'analyze_compliance_batch': 1800,
+    'generate_test_cases': 1800,
+    'generate_functional_test_cases': 1800,
+    'generate_regulatory_test_cases': 1800,
+    'generate_test_cases_batch': 1800,
+    'validate_coverage': 1800,
+    'identify_entities': 86400,
+    'identify_entities_batch': 86400,
+}
+# Tasks whose answers are reused for near-duplicate inputs (rephrased entity text): on an
+# exact-cache miss the input is embedded and matched by cosine similarity. Compliance
+# analysis is excluded, since near-identical text can differ in a negation, a number
+# or a standard's name, all of which change the verdict; it is cached by exact key only
+SEMANTIC_CACHE_TASKS = {'identify_entities'}
+EMBEDDING_MODEL = os.environ.get('OPENAI_EMBEDDING_MODEL', 'text-embedding-3-small')
+SEMANTIC_CACHE_THRESHOLD = float(os.environ.get('OPENAI_SEMANTIC_CACHE_THRESHOLD', '0.97'))
+
+_client = None
+_client_lock = threading.Lock()
+# Runs the second half of a split sync generation alongside the streamed first half
+_generation_executor = ThreadPoolExecutor(max_workers=OPENAI_MAX_CONCURRENCY)
+# AsyncOpenAI clients and semaphores are bound to the loop they are first used on
+_async_clients = weakref.WeakKeyDictionary()
+
+def _get_client() -> OpenAI:
+    """Process-wide OpenAI client, created on first use so every caller shares one warm connection pool."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(max_retries=OPENAI_MAX_RETRIES, http_client=httpx.Client(
+                    http2=True, limits=OPENAI_HTTP_LIMITS, timeout=OPENAI_HTTP_TIMEOUT
+                ))
+    return _client
+
+def _get_async_client() -> Tuple[AsyncOpenAI, asyncio.Semaphore]:
+    """The AsyncOpenAI client and concurrency semaphore of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        state = _async_clients.get(loop)
+        if state is None:
+            state = (
+                AsyncOpenAI(max_retries=OPENAI_MAX_RETRIES, http_client=httpx.AsyncClient(
+                    http2=True, limits=OPENAI_HTTP_LIMITS, timeout=OPENAI_HTTP_TIMEOUT
+                )),
+                asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+            )
+            _async_clients[loop] = state
+    return state
+
+class PromptTooLongError(ValueError):
+    """A request would not fit in the model's context window."""
+
+class CompletionTruncatedError(ValueError):
+    """A response was cut off at max_completion_tokens, so its JSON is incomplete."""
+
+class _LengthEstimateEncoding:
+    """
+    Stand-in for the tokenizer when its BPE file cannot be loaded: every
+    FALLBACK_CHARS_PER_TOKEN characters count as one token.
+    """
+    
+    def encode(self, text: str) -> List[str]:
+        return [text[start:start + FALLBACK_CHARS_PER_TOKEN] for start in range(0, len(text), FALLBACK_CHARS_PER_TOKEN)]
+    
+    def decode(self, tokens: List[str]) -> str:
+        return "".join(tokens)
+
+@lru_cache(maxsize=None)
+def _encoding() -> tiktoken.Encoding:
+    # Loading an encoding takes a while (and a download on first use), so it is done once
+    try:
+        return tiktoken.get_encoding(TOKEN_ENCODING)
+    except Exception:
+        # e.g. no egress to the BPE download; pre-fetch it into TIKTOKEN_CACHE_DIR
+        logger.warning("Could not load the %s tokenizer; estimating token counts from text length",
+                       TOKEN_ENCODING, exc_info=True)
+        return _LengthEstimateEncoding()
+
+@lru_cache(maxsize=1024)
+def _count_text_tokens(text: str) -> int:
+    # Memoized: a request's messages are counted for the context check and again for the rate limiter
+    return len(_encoding().encode(text))
+
+def _count_tokens(messages: List[Dict[str, str]]) -> int:
+    """Prompt tokens of a chat request, including the per-message framing."""
+    return sum(_count_text_tokens(message["content"]) + 4 for message in messages) + 3
+
+def _estimate_tokens(task: str, messages: List[Dict[str, str]]) -> int:
+    """Tokens a chat request reserves against the TPM limit: the prompt plus the completion cap."""
+    return _count_tokens(messages) + MAX_COMPLETION_TOKENS[task]
+
+def _text_windows(text: str, window_tokens: int = EXTRACTION_WINDOW_TOKENS) -> List[str]:
+    """Split text into overlapping windows of at most window_tokens tokens."""
+    tokens = _encoding().encode(text)
+    if len(tokens) <= window_tokens:
+        return [text]
+    step = window_tokens - EXTRACTION_WINDOW_OVERLAP
+    return [
+        _encoding().decode(tokens[start:start + window_tokens])
+        for start in range(0, len(tokens) - EXTRACTION_WINDOW_OVERLAP, step)
+    ]
+
+def _halve_window(text: str) -> List[str]:
+    """
+    Two overlapping halves of a window whose extraction did not fit its
+    completion cap, or [] when the window is too short to split.
+    """
+    tokens = _count_text_tokens(text)
+    if tokens <= 2 * EXTRACTION_WINDOW_OVERLAP:
+        return []
+    return _text_windows(text, tokens // 2 + EXTRACTION_WINDOW_OVERLAP)
+
+def _merge_requirements(parts: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Concatenate per-window extractions, dropping requirements repeated by the window overlap."""
+    requirements = []
+    for part in parts:
+        # Only earlier windows can overlap this one
+        seen = {requirement.get('description') for requirement in requirements}
+        requirements.extend(requirement for requirement in part if requirement.get('description') not in seen)
+    return requirements
+
+def _check_finished(finish_reason: Optional[str], task: str):
+    """Raise CompletionTruncatedError for a response that stopped at its completion cap."""
+    if finish_reason == 'length':
+        raise CompletionTruncatedError(
+            f"Response to {task} cut off at {MAX_COMPLETION_TOKENS[task]} completion tokens"
+        )
+
+def _requirement_text(requirement: Dict[str, Any]) -> str:
+    return (
+        f"Requirement ID: {requirement.get('requirement_id', 'N/A')}\n"
+        f"Title: {requirement.get('title', 'N/A')}\n"
+        f"Description: {requirement.get('description', 'N/A')}\n"
+        f"Type: {requirement.get('type', 'N/A')}\n"
+        f"Priority: {requirement.get('priority', 'N/A')}\n"
+        f"Regulatory Standards: {', '.join(requirement.get('regulatory_standards', []))}"
+    )
+
+def _prompt_cache_key(messages: List[Dict[str, str]]) -> str:
+    """Stable per-prompt key so requests sharing a system prompt are routed to the same prompt cache."""
+    return hashlib.sha256(messages[0]["content"].encode()).hexdigest()[:32]
+
+def _cache_key(request: Dict[str, Any]) -> str:
+    """Content address of a chat request; prompt_cache_key is derived from the messages and left out."""
+    payload = {field: request[field] for field in ('model', 'messages', 'temperature', 'response_format')}
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def _semantic_namespace(request: Dict[str, Any]) -> str:
+    """Everything but the user input: only answers to the same prompt, model and settings are interchangeable."""
+    payload = {field: request[field] for field in ('model', 'temperature', 'response_format')}
+    payload['system'] = request['messages'][0]['content']
+    return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def _requirements_json(requirements: List[Dict[str, Any]]) -> str:
+    """Compact JSON listing of the requirement fields the batch prompts need."""
+    return orjson.dumps([
+        {field: requirement.get(field) for field in BATCH_REQUIREMENT_FIELDS}
+        for requirement in requirements
+    ]).decode()
+
+def _batches(task: str, requirements: List[Dict[str, Any]], batch_size: int):
+    """
+    Split requirements into sub-batches of at most batch_size, and no more
+    than the task's completion cap has room for, closing a batch early once
+    its size would exceed BATCH_PROMPT_TOKEN_BUDGET.
+    """
+    batch_size = max(1, min(batch_size, MAX_COMPLETION_TOKENS[task] // BATCH_ITEM_COMPLETION_TOKENS[task]))
+    batch, batch_tokens = [], 0
+    for requirement in requirements:
+        tokens = _count_text_tokens(_requirements_json([requirement]))
+        if batch and (len(batch) >= batch_size or batch_tokens + tokens > BATCH_PROMPT_TOKEN_BUDGET):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(requirement)
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
+class RateLimiter:
+    """
+    Token buckets for the OpenAI requests-per-minute and tokens-per-minute limits.
+    Shared by the sync and async paths, so the lock is a plain threading lock and
+    acquire() only reports how long the caller has to wait.
+    """
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.limits = (requests_per_minute, tokens_per_minute)
+        self.levels = [float(requests_per_minute), float(tokens_per_minute)]
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self, tokens: int) -> float:
+        """
+        Reserve one request and `tokens` tokens. Returns 0 when granted,
+        otherwise the number of seconds to wait before trying again.
+        """
+        with self.lock:
+            now = time.monotonic()
+            elapsed = now - self.updated
+            self.updated = now
+            for i, limit in enumerate(self.limits):
+                if limit:
+                    self.levels[i] = min(limit, self.levels[i] + elapsed * limit / 60)
+            
+            wanted = (1, min(tokens, self.limits[1]))
+            wait = 0.0
+            for i, limit in enumerate(self.limits):
+                if limit and self.levels[i] < wanted[i]:
+                    wait = max(wait, (wanted[i] - self.levels[i]) * 60 / limit)
+            if wait:
+                return wait
+            
+            for i, limit in enumerate(self.limits):
+                if limit:
+                    self.levels[i] -= wanted[i]
+            return 0.0
+    
+    def wait(self, tokens: int):
+        while (delay := self.acquire(tokens)):
+            time.sleep(delay)
+    
+    async def async_wait(self, tokens: int):
+        while (delay := self.acquire(tokens)):
+            await asyncio.sleep(delay)
 
 class AIProcessor:
     """
     AI-powered processor for interpreting healthcare software requirements
     and generating test cases using OpenAI's API.
+    
+    Every method has an `a`-prefixed async variant (agenerate_test_cases, ...)
+    for fanning out per-requirement calls with asyncio.gather(); concurrency is
+    capped by OPENAI_MAX_CONCURRENCY and both paths share the RPM/TPM throttle.
     """
     
     def __init__(self):
-        self.client = OpenAI()
-        self.healthcare_standards = [
-            "FDA 21 CFR Part 820",
-            "IEC 62304",
-            "ISO 13485",
-            "ISO 9001",
-            "ISO 27001",
-            "HIPAA",
-            "GDPR"
-        ]
+        self.client = _get_client()
+        self.model_fast = os.environ.get('OPENAI_MODEL_FAST', 'gpt-4o-mini')
+        self.model_strong = os.environ.get('OPENAI_MODEL', 'gpt-4o')
+        self.cache = Cache(RESPONSE_CACHE_DIR)
+        self.semantic_cache = SemanticCache(os.path.join(RESPONSE_CACHE_DIR, 'semantic.sqlite3'), SEMANTIC_CACHE_THRESHOLD)
+        self.rate_limiter = RateLimiter(OPENAI_REQUESTS_PER_MINUTE, OPENAI_TOKENS_PER_MINUTE)
+        self.healthcare_standards = HEALTHCARE_STANDARDS
+        self.standards_text = ', '.join(self.healthcare_standards)
+        # Rendered once: the system prompt is the stable, cacheable prefix of every call
+        self.system_prompts = {
+            task: template.format(standards=self.standards_text) for task, template in SYSTEM_PROMPTS.items()
+        }
+    
+    def _request(self, task: str, messages: List[Dict[str, str]], temperature: float) -> Dict[str, Any]:
+        prompt_tokens = _count_tokens(messages)
+        prompt_limit = MODEL_CONTEXT_TOKENS - MAX_COMPLETION_TOKENS[task]
+        if prompt_tokens > prompt_limit:
+            raise PromptTooLongError(f"Input too long: {prompt_tokens} prompt tokens, limit {prompt_limit}")
+        return {
+            "model": self.model_fast if task in FAST_TASKS else self.model_strong,
+            "messages": messages,
+            "temperature": temperature,
+            "max_completion_tokens": MAX_COMPLETION_TOKENS[task],
+            "response_format": RESPONSE_FORMATS[task],
+            "prompt_cache_key": _prompt_cache_key(messages)
+        }
+    
+    def _parse(self, task: str, content: str) -> Any:
+        result = orjson.loads(content)
+        if task in RESULT_KEYS:
+            return result[RESULT_KEYS[task]]
+        return result
+    
+    def _embed(self, text: str) -> List[float]:
+        self.rate_limiter.wait(_count_text_tokens(text))
+        return self.client.embeddings.create(model=EMBEDDING_MODEL, input=text).data[0].embedding
+    
+    async def _aembed(self, text: str) -> List[float]:
+        client, semaphore = _get_async_client()
+        async with semaphore:
+            await self.rate_limiter.async_wait(_count_text_tokens(text))
+            response = await client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+        return response.data[0].embedding
+    
+    def _complete(self, task: str, messages: List[Dict[str, str]], temperature: float,
+                  default_factory: Callable[[], Any], label: str) -> Any:
+        try:
+            request = self._request(task, messages, temperature)
+            key = _cache_key(request)
+            content = self.cache.get(key)
+            cached = content is not None
+            embedding = None
+            if not cached and task in SEMANTIC_CACHE_TASKS:
+                embedding = self._embed(messages[-1]["content"])
+                content = self.semantic_cache.lookup(_semantic_namespace(request), embedding)
+                if content is not None:
+                    embedding = None  # answered from a neighbour; nothing new to index
+            if content is None:
+                self.rate_limiter.wait(_estimate_tokens(task, messages))
+                response = self.client.chat.completions.create(**request)
+                _check_finished(response.choices[0].finish_reason, task)
+                content = response.choices[0].message.content
+            result = self._parse(task, content)
+            if not cached:
+                self.cache.set(key, content, expire=RESPONSE_CACHE_TTLS[task])
+                if embedding is not None:
+                    self.semantic_cache.add(_semantic_namespace(request), embedding, content, RESPONSE_CACHE_TTLS[task])
+            return result
         
-    def extract_requirements_from_text(self, text: str, source_document: str = None) -> List[Dict[str, Any]]:
+        except (APIError, PromptTooLongError, CompletionTruncatedError):
+            # Still failing after the client's retries, rejected up front or cut off: let the caller handle it
+            raise
+        except Exception:
+            logger.exception("Error in %s", label)
+            return default_factory()
+    
+    async def _acomplete(self, task: str, messages: List[Dict[str, str]], temperature: float,
+                         default_factory: Callable[[], Any], label: str) -> Any:
+        try:
+            request = self._request(task, messages, temperature)
+            key = _cache_key(request)
+            content = self.cache.get(key)
+            cached = content is not None
+            embedding = None
+            if not cached and task in SEMANTIC_CACHE_TASKS:
+                embedding = await self._aembed(messages[-1]["content"])
+                content = self.semantic_cache.lookup(_semantic_namespace(request), embedding)
+                if content is not None:
+                    embedding = None  # answered from a neighbour; nothing new to index
+            if content is None:
+                client, semaphore = _get_async_client()
+                async with semaphore:
+                    await self.rate_limiter.async_wait(_estimate_tokens(task, messages))
+                    response = await client.chat.completions.create(**request)
+                _check_finished(response.choices[0].finish_reason, task)
+                content = response.choices[0].message.content
+            result = self._parse(task, content)
+            if not cached:
+                self.cache.set(key, content, expire=RESPONSE_CACHE_TTLS[task])
+                if embedding is not None:
+                    self.semantic_cache.add(_semantic_namespace(request), embedding, content, RESPONSE_CACHE_TTLS[task])
+            return result
+        
+        except (APIError, PromptTooLongError, CompletionTruncatedError):
+            # Still failing after the client's retries, rejected up front or cut off: let the caller handle it
+            raise
+        except Exception:
+            logger.exception("Error in %s", label)
+            return default_factory()
+    
+    def _stream_items(self, task: str, messages: List[Dict[str, str]], temperature: float,
+                      label: str) -> Iterator[Dict[str, Any]]:
         """
-        Extract structured requirements from natural language text.
+        Stream a task whose result is an array (RESULT_KEYS), yielding each element
+        as soon as its JSON object is complete in the model output.
         """
-        prompt = f"""
-        You are an expert in healthcare software requirements analysis. 
-        Extract individual requirements from the following text and structure them as JSON.
-        
-        For each requirement, identify:
-        1. A unique requirement ID (generate if not present)
-        2. Title (brief summary)
-        3. Description (detailed requirement text)
-        4. Type (functional, non-functional, regulatory, security, performance, usability)
-        5. Priority (high, medium, low)
-        6. Applicable regulatory standards from: {', '.join(self.healthcare_standards)}
+        try:
+            request = self._request(task, messages, temperature)
+            key = _cache_key(request)
+            content = self.cache.get(key)
+            if content is not None:
+                yield from self._parse(task, content)
+                return
+            
+            self.rate_limiter.wait(_estimate_tokens(task, messages))
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, f'{RESULT_KEYS[task]}.item', use_float=True)
+            chunks = []
+            for chunk in self.client.chat.completions.create(**request, stream=True):
+                if chunk.choices:
+                    _check_finished(chunk.choices[0].finish_reason, task)
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                chunks.append(delta)
+                parser.send(delta.encode())
+                yield from items
+                del items[:]
+            parser.close()
+            yield from items
+            
+            self.cache.set(key, "".join(chunks), expire=RESPONSE_CACHE_TTLS[task])
         
-        Text to analyze:
-        {text}
+        except (APIError, PromptTooLongError, CompletionTruncatedError):
+            # Still failing after the client's retries, rejected up front or cut off: let the caller handle it
+            raise
+        except Exception:
+            logger.exception("Error in %s", label)
+    
+    async def _astream_items(self, task: str, messages: List[Dict[str, str]], temperature: float,
+                             label: str) -> AsyncIterator[Dict[str, Any]]:
+        """Async variant of _stream_items()."""
+        try:
+            request = self._request(task, messages, temperature)
+            key = _cache_key(request)
+            content = self.cache.get(key)
+            if content is not None:
+                for item in self._parse(task, content):
+                    yield item
+                return
+            
+            client, semaphore = _get_async_client()
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, f'{RESULT_KEYS[task]}.item', use_float=True)
+            chunks = []
+            async with semaphore:
+                await self.rate_limiter.async_wait(_estimate_tokens(task, messages))
+                async for chunk in await client.chat.completions.create(**request, stream=True):
+                    if chunk.choices:
+                        _check_finished(chunk.choices[0].finish_reason, task)
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    chunks.append(delta)
+                    parser.send(delta.encode())
+                    for item in items:
+                        yield item
+                    del items[:]
+            parser.close()
+            for item in items:
+                yield item
+            
+            self.cache.set(key, "".join(chunks), expire=RESPONSE_CACHE_TTLS[task])
         
-        Return a JSON array of requirements. Each requirement should have the structure:
-        {{
-            "requirement_id": "REQ-001",
-            "title": "Brief title",
-            "description": "Detailed description",
-            "type": "functional|non-functional|regulatory|security|performance|usability",
-            "priority": "high|medium|low",
-            "regulatory_standards": ["FDA 21 CFR Part 820", "IEC 62304"]
-        }}
+        except (APIError, PromptTooLongError, CompletionTruncatedError):
+            raise
+        except Exception:
+            logger.exception("Error in %s", label)
+    
+    def _complete_batched(self, task: str, build_messages: Callable[[List[Dict[str, Any]]], List[Dict[str, str]]],
+                          requirements: List[Dict[str, Any]], batch_size: int, temperature: float, label: str) -> Dict[str, Any]:
+        results = {}
+        for batch in _batches(task, requirements, batch_size):
+            results.update(self._complete_batch(task, build_messages, batch, temperature, label))
+        return results
+    
+    def _complete_batch(self, task: str, build_messages: Callable[[List[Dict[str, Any]]], List[Dict[str, str]]],
+                        batch: List[Dict[str, Any]], temperature: float, label: str) -> Dict[str, Any]:
+        """One batched call; a batch whose response is cut off is retried as two halves."""
+        try:
+            return self._complete(task, build_messages(batch), temperature, dict, label)
+        except CompletionTruncatedError:
+            if len(batch) == 1:
+                raise
+            middle = len(batch) // 2
+            results = self._complete_batch(task, build_messages, batch[:middle], temperature, label)
+            results.update(self._complete_batch(task, build_messages, batch[middle:], temperature, label))
+            return results
+    
+    async def _acomplete_batched(self, task: str, build_messages: Callable[[List[Dict[str, Any]]], List[Dict[str, str]]],
+                                 requirements: List[Dict[str, Any]], batch_size: int, temperature: float, label: str) -> Dict[str, Any]:
+        parts = await asyncio.gather(*[
+            self._acomplete_batch(task, build_messages, batch, temperature, label)
+            for batch in _batches(task, requirements, batch_size)
+        ])
+        results = {}
+        for part in parts:
+            results.update(part)
+        return results
+    
+    async def _acomplete_batch(self, task: str, build_messages: Callable[[List[Dict[str, Any]]], List[Dict[str, str]]],
+                               batch: List[Dict[str, Any]], temperature: float, label: str) -> Dict[str, Any]:
+        """Async variant of _complete_batch(); the halves run concurrently."""
+        try:
+            return await self._acomplete(task, build_messages(batch), temperature, dict, label)
+        except CompletionTruncatedError:
+            if len(batch) == 1:
+                raise
+            middle = len(batch) // 2
+            first, second = await asyncio.gather(
+                self._acomplete_batch(task, build_messages, batch[:middle], temperature, label),
+                self._acomplete_batch(task, build_messages, batch[middle:], temperature, label)
+            )
+            first.update(second)
+            return first
+    
+    def _extract_requirements_from_text_messages(self, text: str, source_document: str = None) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system_prompts['extract_requirements']},
+            {"role": "user", "content": f"Text to analyze:\n{text}"}
+        ]
+    
+    def extract_requirements_from_text(self, text: str, source_document: str = None) -> List[Dict[str, Any]]:
         """
-        
+        Extract structured requirements from natural language text.
+        Long documents are processed in overlapping windows.
+        """
+        return _merge_requirements([self._extract_window(window, source_document) for window in _text_windows(text)])
+    
+    def _extract_window(self, window: str, source_document: str = None) -> List[Dict[str, Any]]:
+        """Requirements of one window; a window whose response is cut off is extracted as two halves."""
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert healthcare software requirements analyst."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3
+            return self._complete(
+                'extract_requirements', self._extract_requirements_from_text_messages(window, source_document), 0.3, list, "requirement extraction"
             )
-            
-            content = response.choices[0].message.content
-            # Extract JSON from the response
-            json_match = re.search(r'\[.*\]', content, re.DOTALL)
-            if json_match:
-                requirements_data = json.loads(json_match.group())
-                return requirements_data
-            else:
-                return []
-                
-        except Exception as e:
-            print(f"Error in requirement extraction: {str(e)}")
-            return []
+        except CompletionTruncatedError:
+            halves = _halve_window(window)
+            if not halves:
+                raise
+            return _merge_requirements([self._extract_window(half, source_document) for half in halves])
+    
+    async def aextract_requirements_from_text(self, text: str, source_document: str = None) -> List[Dict[str, Any]]:
+        """Async variant of extract_requirements_from_text(); the windows run concurrently."""
+        return _merge_requirements(await asyncio.gather(*[
+            self._aextract_window(window, source_document) for window in _text_windows(text)
+        ]))
+    
+    async def _aextract_window(self, window: str, source_document: str = None) -> List[Dict[str, Any]]:
+        """Async variant of _extract_window(); the halves run concurrently."""
+        try:
+            return await self._acomplete(
+                'extract_requirements', self._extract_requirements_from_text_messages(window, source_document), 0.3, list, "requirement extraction"
+            )
+        except CompletionTruncatedError:
+            halves = _halve_window(window)
+            if not halves:
+                raise
+            return _merge_requirements(await asyncio.gather(*[
+                self._aextract_window(half, source_document) for half in halves
+            ]))
+    
+    async def aextract_requirements_iter(self, text: str, source_document: str = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the extracted requirements, yielding each one as soon as it is complete.
+        Requirements already yielded (from the window overlap, or before a window's
+        response was cut off and it was redone in halves) are not repeated.
+        """
+        seen = set()
+        async for requirement in self._astream_windows(_text_windows(text), source_document):
+            if requirement.get('description') not in seen:
+                seen.add(requirement.get('description'))
+                yield requirement
+    
+    async def _astream_windows(self, windows: List[str], source_document: str = None) -> AsyncIterator[Dict[str, Any]]:
+        for window in windows:
+            try:
+                async for requirement in self._astream_items(
+                    'extract_requirements', self._extract_requirements_from_text_messages(window, source_document), 0.3, "requirement extraction"
+                ):
+                    yield requirement
+            except CompletionTruncatedError:
+                halves = _halve_window(window)
+                if not halves:
+                    raise
+                async for requirement in self._astream_windows(halves, source_document):
+                    yield requirement
+    
+    async def process_document(self, text: str, source_document: str = None) -> List[Dict[str, Any]]:
+        """
+        Run the whole chain for a document: extract the requirements, then per
+        requirement analyze compliance, generate test cases and validate their
+        coverage. Each requirement starts as soon as the streaming extraction
+        yields it; analysis runs alongside generation, and validation waits
+        only on generation.
+        """
+        tasks = [
+            asyncio.create_task(self._process_requirement(requirement))
+            async for requirement in self.aextract_requirements_iter(text, source_document)
+        ]
+        return list(await asyncio.gather(*tasks))
+    
+    async def _process_requirement(self, requirement: Dict[str, Any]) -> Dict[str, Any]:
+        analysis = asyncio.create_task(self.aanalyze_requirement_compliance(requirement.get('description', '')))
+        test_cases = await self.agenerate_test_cases(requirement)
+        coverage = await self.avalidate_test_case_coverage(requirement, test_cases)
+        return {
+            'requirement': requirement,
+            'compliance_analysis': await analysis,
+            'test_cases': test_cases,
+            'coverage_analysis': coverage
+        }
+    
+    def _analyze_requirement_compliance_messages(self, requirement_text: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system_prompts['analyze_compliance']},
+            {"role": "user", "content": f"Requirement: {requirement_text}"}
+        ]
     
     def analyze_requirement_compliance(self, requirement_text: str) -> Dict[str, Any]:
         """
         Analyze a requirement for regulatory compliance and identify applicable standards.
         """
-        prompt = f"""
-        Analyze the following healthcare software requirement for regulatory compliance.
-        
-        Requirement: {requirement_text}
-        
-        Identify:
-        1. Which regulatory standards apply: {', '.join(self.healthcare_standards)}
-        2. Specific compliance considerations
-        3. Risk level (high, medium, low)
-        4. Required documentation
-        5. Testing implications
-        
-        Return as JSON:
-        {{
-            "applicable_standards": ["standard1", "standard2"],
-            "compliance_considerations": ["consideration1", "consideration2"],
-            "risk_level": "high|medium|low",
-            "required_documentation": ["doc1", "doc2"],
-            "testing_implications": ["implication1", "implication2"]
-        }}
+        return self._complete(
+            'analyze_compliance', self._analyze_requirement_compliance_messages(requirement_text), 0.2, dict, "compliance analysis"
+        )
+    
+    async def aanalyze_requirement_compliance(self, requirement_text: str) -> Dict[str, Any]:
+        """Async variant of analyze_requirement_compliance(), for fanning out calls with asyncio.gather()."""
+        return await self._acomplete(
+            'analyze_compliance', self._analyze_requirement_compliance_messages(requirement_text), 0.2, dict, "compliance analysis"
+        )
+    
+    def _analyze_requirement_compliance_batch_messages(self, requirements: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system_prompts['analyze_compliance_batch']},
+            {"role": "user", "content": _requirements_json(requirements)}
+        ]
+    
+    def analyze_requirement_compliance_batch(self, requirements: List[Dict[str, Any]],
+                                             batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, Dict[str, Any]]:
         """
-        
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a healthcare regulatory compliance expert."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2
-            )
-            
-            content = response.choices[0].message.content
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return {}
-                
-        except Exception as e:
-            print(f"Error in compliance analysis: {str(e)}")
-            return {}
+        Compliance analysis for several requirements, batch_size requirements per model call.
+        Returns analyses keyed by requirement_id.
+        """
+        return self._complete_batched(
+            'analyze_compliance_batch', self._analyze_requirement_compliance_batch_messages, requirements, batch_size, 0.2, "batch compliance analysis"
+        )
+    
+    async def aanalyze_requirement_compliance_batch(self, requirements: List[Dict[str, Any]],
+                                                    batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, Dict[str, Any]]:
+        """Async variant of analyze_requirement_compliance_batch(); the sub-batches run concurrently."""
+        return await self._acomplete_batched(
+            'analyze_compliance_batch', self._analyze_requirement_compliance_batch_messages, requirements, batch_size, 0.2, "batch compliance analysis"
+        )
+    
+    def _generate_test_cases_messages(self, requirement: Dict[str, Any],
+                                      task: str = 'generate_test_cases') -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system_prompts[task]},
+            {"role": "user", "content": _requirement_text(requirement)}
+        ]
     
     def generate_test_cases(self, requirement: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Generate comprehensive test cases for a given requirement.
         """
-        prompt = f"""
-        Generate comprehensive test cases for the following healthcare software requirement:
-        
-        Requirement ID: {requirement.get('requirement_id', 'N/A')}
-        Title: {requirement.get('title', 'N/A')}
-        Description: {requirement.get('description', 'N/A')}
-        Type: {requirement.get('type', 'N/A')}
-        Priority: {requirement.get('priority', 'N/A')}
-        Regulatory Standards: {', '.join(requirement.get('regulatory_standards', []))}
-        
-        Generate test cases that cover:
-        1. Positive test scenarios
-        2. Negative test scenarios
-        3. Edge cases
-        4. Regulatory compliance verification
-        5. Data validation (considering healthcare data formats like HL7, FHIR)
-        6. Security testing (if applicable)
-        7. Performance testing (if applicable)
-        
-        For each test case, provide:
-        - Test case ID
-        - Title
-        - Description
-        - Preconditions
-        - Test steps (as an array)
-        - Expected results
-        - Postconditions
-        - Priority
-        - Test data requirements
-        - Compliance tags
-        
-        Return as JSON array:
-        [{{
-            "test_case_id": "TC-001",
-            "title": "Test case title",
-            "description": "Detailed description",
-            "preconditions": "Prerequisites",
-            "test_steps": ["Step 1", "Step 2", "Step 3"],
-            "expected_results": "Expected outcome",
-            "postconditions": "Post-test state",
-            "priority": "high|medium|low",
-            "test_data": {{"data_type": "HL7", "sample_data": "example"}},
-            "compliance_tags": ["FDA", "IEC 62304"]
-        }}]
+        return list(self.generate_test_cases_iter(requirement))
+    
+    def generate_test_cases_iter(self, requirement: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the test cases for a requirement, yielding each one as soon as its
+        JSON object is complete in the model output. The functional half is
+        streamed while the regulatory half is generated alongside it.
+        """
+        regulatory = _generation_executor.submit(
+            self._complete, 'generate_regulatory_test_cases',
+            self._generate_test_cases_messages(requirement, 'generate_regulatory_test_cases'), 0.4, list, "test case generation"
+        )
+        yield from self._stream_items(
+            'generate_functional_test_cases',
+            self._generate_test_cases_messages(requirement, 'generate_functional_test_cases'), 0.4, "test case generation"
+        )
+        yield from regulatory.result()
+    
+    async def agenerate_test_cases(self, requirement: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Async variant of generate_test_cases(), for fanning out calls with asyncio.gather().
+        The functional and regulatory halves are generated concurrently.
+        """
+        functional, regulatory = await asyncio.gather(*[
+            self._acomplete(task, self._generate_test_cases_messages(requirement, task), 0.4, list, "test case generation")
+            for task in ('generate_functional_test_cases', 'generate_regulatory_test_cases')
+        ])
+        return functional + regulatory
+    
+    def submit_test_case_batch(self, requirements: List[Dict[str, Any]], key: str = 'requirement_id') -> str:
+        """
+        Queue test case generation for many requirements on the OpenAI Batch API:
+        half the price and a separate rate-limit pool, with results within 24 hours.
+        One request per requirement, identified by str(requirement[key]).
+        Returns the batch ID to pass to poll_test_case_batch().
+        """
+        lines = [
+            orjson.dumps({
+                "custom_id": str(requirement[key]),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._request('generate_test_cases', self._generate_test_cases_messages(requirement), 0.4)
+            })
+            for requirement in requirements
+        ]
+        input_file = self.client.files.create(
+            file=("test_cases.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+    
+    def poll_test_case_batch(self, batch_id: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
         """
+        Test cases of a submitted batch keyed by custom_id, or None while it is still running.
+        An expired batch yields whatever requests finished in time. Raises RuntimeError if
+        the batch failed or was cancelled, and LookupError once discard_test_case_batch()
+        has removed its results.
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status in BATCH_PENDING_STATUSES:
+            return None
+        if batch.status not in ('completed', 'expired'):
+            raise RuntimeError(f"Batch {batch_id} {batch.status}")
+        if batch.output_file_id is None:
+            return {}
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert healthcare software test engineer with deep knowledge of medical device testing and regulatory compliance."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.4
-            )
-            
-            content = response.choices[0].message.content
-            json_match = re.search(r'\[.*\]', content, re.DOTALL)
-            if json_match:
-                test_cases_data = json.loads(json_match.group())
-                return test_cases_data
-            else:
-                return []
-                
-        except Exception as e:
-            print(f"Error in test case generation: {str(e)}")
-            return []
+            output = self.client.files.content(batch.output_file_id).text
+        except NotFoundError:
+            raise LookupError(f"Results of batch {batch_id} have already been collected")
+        
+        results = {}
+        for line in output.splitlines():
+            item = orjson.loads(line)
+            response = item.get('response') or {}
+            try:
+                if response.get('status_code') != 200:
+                    raise RuntimeError(item.get('error') or response.get('body'))
+                choice = response['body']['choices'][0]
+                _check_finished(choice.get('finish_reason'), 'generate_test_cases')
+                results[item['custom_id']] = self._parse('generate_test_cases', choice['message']['content'])
+            except Exception:
+                logger.exception("Error in batch API test case generation for %s", item['custom_id'])
+        return results
+    
+    def discard_test_case_batch(self, batch_id: str):
+        """Delete the input and result files of a finished batch once its results are stored."""
+        batch = self.client.batches.retrieve(batch_id)
+        for file_id in (batch.input_file_id, batch.output_file_id, batch.error_file_id):
+            if file_id:
+                self.client.files.delete(file_id)
+    
+    def _generate_test_cases_batch_messages(self, requirements: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system_prompts['generate_test_cases_batch']},
+            {"role": "user", "content": _requirements_json(requirements)}
+        ]
+    
+    def generate_test_cases_batch(self, requirements: List[Dict[str, Any]],
+                                  batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Generate test cases for several requirements, batch_size requirements per model call.
+        Returns test cases keyed by requirement_id.
+        """
+        return self._complete_batched(
+            'generate_test_cases_batch', self._generate_test_cases_batch_messages, requirements, batch_size, 0.4, "batch test case generation"
+        )
+    
+    async def agenerate_test_cases_batch(self, requirements: List[Dict[str, Any]],
+                                         batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, List[Dict[str, Any]]]:
+        """Async variant of generate_test_cases_batch(); the sub-batches run concurrently."""
+        return await self._acomplete_batched(
+            'generate_test_cases_batch', self._generate_test_cases_batch_messages, requirements, batch_size, 0.4, "batch test case generation"
+        )
+    
+    def _validate_test_case_coverage_messages(self, requirement: Dict[str, Any], test_cases: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        test_cases_text = orjson.dumps(test_cases).decode()
+        return [
+            {"role": "system", "content": self.system_prompts['validate_coverage']},
+            {"role": "user", "content": f"{_requirement_text(requirement)}\n\nTest Cases:\n{test_cases_text}"}
+        ]
     
     def validate_test_case_coverage(self, requirement: Dict[str, Any], test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Validate that generated test cases provide adequate coverage for the requirement.
         """
-        prompt = f"""
-        Analyze the test coverage for the following requirement and test cases:
-        
-        Requirement: {requirement.get('description', 'N/A')}
-        Type: {requirement.get('type', 'N/A')}
-        Regulatory Standards: {', '.join(requirement.get('regulatory_standards', []))}
-        
-        Test Cases:
-        {json.dumps(test_cases, indent=2)}
-        
-        Evaluate:
-        1. Coverage completeness (0-100%)
-        2. Missing test scenarios
-        3. Regulatory compliance coverage
-        4. Risk coverage assessment
-        5. Recommendations for improvement
-        
-        Return as JSON:
-        {{
-            "coverage_percentage": 85,
-            "missing_scenarios": ["scenario1", "scenario2"],
-            "compliance_coverage": {{"FDA": true, "IEC 62304": false}},
-            "risk_coverage": "adequate|insufficient|comprehensive",
-            "recommendations": ["recommendation1", "recommendation2"]
-        }}
-        """
-        
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a healthcare software quality assurance expert specializing in test coverage analysis."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2
-            )
-            
-            content = response.choices[0].message.content
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return {}
-                
-        except Exception as e:
-            print(f"Error in coverage validation: {str(e)}")
-            return {}
+        return self._complete(
+            'validate_coverage', self._validate_test_case_coverage_messages(requirement, test_cases), 0.2, dict, "coverage validation"
+        )
+    
+    async def avalidate_test_case_coverage(self, requirement: Dict[str, Any], test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Async variant of validate_test_case_coverage(), for fanning out calls with asyncio.gather()."""
+        return await self._acomplete(
+            'validate_coverage', self._validate_test_case_coverage_messages(requirement, test_cases), 0.2, dict, "coverage validation"
+        )
+    
+    def _identify_healthcare_entities_messages(self, text: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system_prompts['identify_entities']},
+            {"role": "user", "content": f"Text: {text}"}
+        ]
     
     def identify_healthcare_entities(self, text: str) -> Dict[str, List[str]]:
         """
         Identify healthcare-specific entities in the requirement text.
         """
-        prompt = f"""
-        Identify healthcare-specific entities in the following text:
-        
-        Text: {text}
-        
-        Extract:
-        1. Medical procedures
-        2. Patient data types
-        3. Medical devices
-        4. Healthcare standards/protocols
-        5. Clinical workflows
-        6. Data formats (HL7, FHIR, DICOM, etc.)
-        7. Regulatory terms
-        
-        Return as JSON:
-        {{
-            "medical_procedures": ["procedure1", "procedure2"],
-            "patient_data_types": ["data_type1", "data_type2"],
-            "medical_devices": ["device1", "device2"],
-            "healthcare_standards": ["standard1", "standard2"],
-            "clinical_workflows": ["workflow1", "workflow2"],
-            "data_formats": ["format1", "format2"],
-            "regulatory_terms": ["term1", "term2"]
-        }}
+        return self._complete(
+            'identify_entities', self._identify_healthcare_entities_messages(text), 0.3, dict, "entity identification"
+        )
+    
+    async def aidentify_healthcare_entities(self, text: str) -> Dict[str, List[str]]:
+        """Async variant of identify_healthcare_entities(), for fanning out calls with asyncio.gather()."""
+        return await self._acomplete(
+            'identify_entities', self._identify_healthcare_entities_messages(text), 0.3, dict, "entity identification"
+        )
+    
+    
+    def _identify_healthcare_entities_batch_messages(self, requirements: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": self.system_prompts['identify_entities_batch']},
+            {"role": "user", "content": _requirements_json(requirements)}
+        ]
+    
+    def identify_healthcare_entities_batch(self, requirements: List[Dict[str, Any]],
+                                           batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, Dict[str, List[str]]]:
         """
-        
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a healthcare informatics expert with deep knowledge of medical terminology and healthcare data standards."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3
-            )
-            
-            content = response.choices[0].message.content
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            else:
-                return {}
-                
-        except Exception as e:
-            print(f"Error in entity identification: {str(e)}")
-            return {}
-
+        Entity identification for several requirements, batch_size requirements per model call.
+        Returns entities keyed by requirement_id.
+        """
+        return self._complete_batched(
+            'identify_entities_batch', self._identify_healthcare_entities_batch_messages, requirements, batch_size, 0.3, "batch entity identification"
+        )
+    
+    async def aidentify_healthcare_entities_batch(self, requirements: List[Dict[str, Any]],
+                                                  batch_size: int = DEFAULT_BATCH_SIZE) -> Dict[str, Dict[str, List[str]]]:
+        """Async variant of identify_healthcare_entities_batch(); the sub-batches run concurrently."""
+        return await self._acomplete_batched(
+            'identify_entities_batch', self._identify_healthcare_entities_batch_messages, requirements, batch_size, 0.3, "batch entity identification"
+        )
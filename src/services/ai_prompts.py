@@ -0,0 +1,336 @@
+"""
+System prompts and response formats for AIProcessor.
+
+Each prompt holds everything that is constant for its task: the role, the
+instructions and the healthcare standards list. Tasks answered with a strict
+JSON Schema (RESPONSE_FORMATS) only refer to it; the plain JSON mode tasks
+spell out the expected shape as an example. Requirement extraction, whose
+input is free-form document text, also carries a worked input/output example.
+
+The user message carries only the requirement or text being processed, so
+consecutive calls share the whole system prompt as a cacheable prefix.
+
+Templates are rendered once with str.format(standards=...); literal JSON
+braces are therefore doubled.
+"""
+
+EXTRACT_REQUIREMENTS = """You are an expert healthcare software requirements analyst.
+Extract individual requirements from the text in the user message and structure them as JSON.
+
+For each requirement, identify:
+1. A unique requirement ID (generate if not present)
+2. Title (brief summary)
+3. Description (detailed requirement text)
+4. Type (functional, non-functional, regulatory, security, performance, usability)
+5. Priority (high, medium, low)
+6. Applicable regulatory standards from: {standards}
+
+Return JSON matching the provided schema.
+
+Example input:
+Text to analyze:
+REQ-017: The pump shall stop the infusion and raise an audible alarm within 2 seconds of detecting air in the line.
+All dose changes must be recorded in an audit trail with the user ID and a timestamp, and users must log in with individual credentials.
+
+Example output:
+{{
+    "requirements": [
+        {{
+            "requirement_id": "REQ-017",
+            "title": "Air-in-line alarm",
+            "description": "The pump shall stop the infusion and raise an audible alarm within 2 seconds of detecting air in the line.",
+            "type": "functional",
+            "priority": "high",
+            "regulatory_standards": ["IEC 62304", "FDA 21 CFR Part 820"]
+        }},
+        {{
+            "requirement_id": "REQ-018",
+            "title": "Dose change audit trail",
+            "description": "All dose changes must be recorded in an audit trail with the user ID and a timestamp.",
+            "type": "regulatory",
+            "priority": "high",
+            "regulatory_standards": ["FDA 21 CFR Part 820", "ISO 13485"]
+        }},
+        {{
+            "requirement_id": "REQ-019",
+            "title": "Individual user login",
+            "description": "Users must log in with individual credentials.",
+            "type": "security",
+            "priority": "medium",
+            "regulatory_standards": ["HIPAA", "ISO 27001"]
+        }}
+    ]
+}}"""
+
+_COMPLIANCE_CHECKLIST = """1. Which regulatory standards apply: {standards}
+2. Specific compliance considerations
+3. Risk level (high, medium, low)
+4. Required documentation
+5. Testing implications"""
+
+ANALYZE_COMPLIANCE = """You are a healthcare regulatory compliance expert.
+Analyze the healthcare software requirement in the user message for regulatory compliance.
+
+Identify:
+""" + _COMPLIANCE_CHECKLIST + """
+
+Return JSON matching the provided schema."""
+
+ANALYZE_COMPLIANCE_BATCH = """You are a healthcare regulatory compliance expert.
+Analyze each healthcare software requirement in the user message (a JSON array) for regulatory compliance.
+
+For every requirement, identify:
+""" + _COMPLIANCE_CHECKLIST + """
+
+Return a JSON object keyed by requirement ID:
+{{
+    "REQ-001": {{
+        "applicable_standards": ["standard1", "standard2"],
+        "compliance_considerations": ["consideration1", "consideration2"],
+        "risk_level": "high|medium|low",
+        "required_documentation": ["doc1", "doc2"],
+        "testing_implications": ["implication1", "implication2"]
+    }}
+}}"""
+
+_TEST_CASE_SKELETON = """{{
+    "test_case_id": "TC-001",
+    "title": "Test case title",
+    "description": "Detailed description",
+    "preconditions": "Prerequisites",
+    "test_steps": ["Step 1", "Step 2", "Step 3"],
+    "expected_results": "Expected outcome",
+    "postconditions": "Post-test state",
+    "priority": "high|medium|low",
+    "test_data": {{"data_type": "HL7", "sample_data": "example"}},
+    "compliance_tags": ["FDA", "IEC 62304"]
+}}"""
+
+_TEST_CASE_FIELDS = """For each test case, provide:
+- Test case ID
+- Title
+- Description
+- Preconditions
+- Test steps (as an array)
+- Expected results
+- Postconditions
+- Priority
+- Test data requirements
+- Compliance tags"""
+
+GENERATE_TEST_CASES = """You are an expert healthcare software test engineer with deep knowledge of medical device testing and regulatory compliance.
+Generate comprehensive test cases for the healthcare software requirement in the user message.
+
+Generate test cases that cover:
+1. Positive test scenarios
+2. Negative test scenarios
+3. Edge cases
+4. Regulatory compliance verification
+5. Data validation (considering healthcare data formats like HL7, FHIR)
+6. Security testing (if applicable)
+7. Performance testing (if applicable)
+
+""" + _TEST_CASE_FIELDS + """
+
+Return JSON matching the provided schema."""
+
+# generate_test_cases split in two halves that run in parallel, each with half the output
+GENERATE_FUNCTIONAL_TEST_CASES = """You are an expert healthcare software test engineer with deep knowledge of medical device testing.
+Generate functional test cases for the healthcare software requirement in the user message.
+
+Generate test cases that cover:
+1. Positive test scenarios
+2. Negative test scenarios
+3. Edge cases
+4. Data validation (considering healthcare data formats like HL7, FHIR)
+
+Number the test case IDs TC-F-001, TC-F-002, ...
+
+""" + _TEST_CASE_FIELDS + """
+
+Return JSON matching the provided schema."""
+
+GENERATE_REGULATORY_TEST_CASES = """You are an expert healthcare software test engineer with deep knowledge of medical device testing and regulatory compliance.
+Generate regulatory and non-functional test cases for the healthcare software requirement in the user message.
+
+Generate test cases that cover:
+1. Regulatory compliance verification
+2. Security testing (if applicable)
+3. Performance testing (if applicable)
+
+Number the test case IDs TC-R-001, TC-R-002, ...
+
+""" + _TEST_CASE_FIELDS + """
+
+Return JSON matching the provided schema."""
+
+GENERATE_TEST_CASES_BATCH = """You are an expert healthcare software test engineer with deep knowledge of medical device testing and regulatory compliance.
+Generate comprehensive test cases for each healthcare software requirement in the user message (a JSON array).
+
+For every requirement, generate test cases that cover positive and negative scenarios,
+edge cases, regulatory compliance verification, data validation (HL7, FHIR) and,
+where applicable, security and performance testing.
+
+Return a JSON object keyed by requirement ID, each value being an array of test cases:
+{{
+    "REQ-001": [""" + _TEST_CASE_SKELETON + """]
+}}"""
+
+VALIDATE_COVERAGE = """You are a healthcare software quality assurance expert specializing in test coverage analysis.
+Analyze the test coverage of the test cases for the requirement in the user message.
+
+Evaluate:
+1. Coverage completeness (0-100%)
+2. Missing test scenarios
+3. Regulatory compliance coverage
+4. Risk coverage assessment
+5. Recommendations for improvement
+
+Return as JSON:
+{{
+    "coverage_percentage": 85,
+    "missing_scenarios": ["scenario1", "scenario2"],
+    "compliance_coverage": {{"FDA": true, "IEC 62304": false}},
+    "risk_coverage": "adequate|insufficient|comprehensive",
+    "recommendations": ["recommendation1", "recommendation2"]
+}}"""
+
+_ENTITY_CHECKLIST = """1. Medical procedures
+2. Patient data types
+3. Medical devices
+4. Healthcare standards/protocols
+5. Clinical workflows
+6. Data formats (HL7, FHIR, DICOM, etc.)
+7. Regulatory terms"""
+
+_ENTITY_SKELETON = """{{
+    "medical_procedures": ["procedure1", "procedure2"],
+    "patient_data_types": ["data_type1", "data_type2"],
+    "medical_devices": ["device1", "device2"],
+    "healthcare_standards": ["standard1", "standard2"],
+    "clinical_workflows": ["workflow1", "workflow2"],
+    "data_formats": ["format1", "format2"],
+    "regulatory_terms": ["term1", "term2"]
+}}"""
+
+IDENTIFY_ENTITIES = """You are a healthcare informatics expert with deep knowledge of medical terminology and healthcare data standards.
+Identify healthcare-specific entities in the text in the user message.
+
+Extract:
+""" + _ENTITY_CHECKLIST + """
+
+Return JSON matching the provided schema."""
+
+IDENTIFY_ENTITIES_BATCH = """You are a healthcare informatics expert with deep knowledge of medical terminology and healthcare data standards.
+Identify healthcare-specific entities in each requirement in the user message (a JSON array).
+
+For every requirement, extract:
+""" + _ENTITY_CHECKLIST + """
+
+Return a JSON object keyed by requirement ID:
+{{
+    "REQ-001": """ + _ENTITY_SKELETON.replace('\n', '\n    ') + """
+}}"""
+
+SYSTEM_PROMPTS = {
+    'extract_requirements': EXTRACT_REQUIREMENTS,
+    'analyze_compliance': ANALYZE_COMPLIANCE,
+    'analyze_compliance_batch': ANALYZE_COMPLIANCE_BATCH,
+    'generate_test_cases': GENERATE_TEST_CASES,
+    'generate_functional_test_cases': GENERATE_FUNCTIONAL_TEST_CASES,
+    'generate_regulatory_test_cases': GENERATE_REGULATORY_TEST_CASES,
+    'generate_test_cases_batch': GENERATE_TEST_CASES_BATCH,
+    'validate_coverage': VALIDATE_COVERAGE,
+    'identify_entities': IDENTIFY_ENTITIES,
+    'identify_entities_batch': IDENTIFY_ENTITIES_BATCH,
+}
+
+
+# Response formats. Fixed-shape results use strict JSON Schema structured outputs;
+# results keyed by requirement ID or by standard have dynamic keys, which strict
+# schemas cannot express, so those tasks use plain JSON mode.
+
+def _string_array():
+    return {"type": "array", "items": {"type": "string"}}
+
+def _object(properties):
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False
+    }
+
+def _json_schema(name, schema):
+    return {"type": "json_schema", "json_schema": {"name": name, "schema": schema, "strict": True}}
+
+PRIORITY = {"type": "string", "enum": ["high", "medium", "low"]}
+
+REQUIREMENT_SCHEMA = _object({
+    "requirement_id": {"type": "string"},
+    "title": {"type": "string"},
+    "description": {"type": "string"},
+    "type": {"type": "string", "enum": ["functional", "non-functional", "regulatory", "security", "performance", "usability"]},
+    "priority": PRIORITY,
+    "regulatory_standards": _string_array()
+})
+
+COMPLIANCE_SCHEMA = _object({
+    "applicable_standards": _string_array(),
+    "compliance_considerations": _string_array(),
+    "risk_level": PRIORITY,
+    "required_documentation": _string_array(),
+    "testing_implications": _string_array()
+})
+
+TEST_CASE_SCHEMA = _object({
+    "test_case_id": {"type": "string"},
+    "title": {"type": "string"},
+    "description": {"type": "string"},
+    "preconditions": {"type": "string"},
+    "test_steps": _string_array(),
+    "expected_results": {"type": "string"},
+    "postconditions": {"type": "string"},
+    "priority": PRIORITY,
+    "test_data": _object({"data_type": {"type": "string"}, "sample_data": {"type": "string"}}),
+    "compliance_tags": _string_array()
+})
+
+ENTITIES_SCHEMA = _object({
+    "medical_procedures": _string_array(),
+    "patient_data_types": _string_array(),
+    "medical_devices": _string_array(),
+    "healthcare_standards": _string_array(),
+    "clinical_workflows": _string_array(),
+    "data_formats": _string_array(),
+    "regulatory_terms": _string_array()
+})
+
+JSON_OBJECT = {"type": "json_object"}
+TEST_CASES_FORMAT = _json_schema('test_cases', _object({"test_cases": {"type": "array", "items": TEST_CASE_SCHEMA}}))
+
+RESPONSE_FORMATS = {
+    'extract_requirements': _json_schema(
+        'requirements', _object({"requirements": {"type": "array", "items": REQUIREMENT_SCHEMA}})
+    ),
+    'analyze_compliance': _json_schema('compliance_analysis', COMPLIANCE_SCHEMA),
+    'analyze_compliance_batch': JSON_OBJECT,
+    'generate_test_cases': TEST_CASES_FORMAT,
+    'generate_functional_test_cases': TEST_CASES_FORMAT,
+    'generate_regulatory_test_cases': TEST_CASES_FORMAT,
+    'generate_test_cases_batch': JSON_OBJECT,
+    'validate_coverage': JSON_OBJECT,
+    'identify_entities': _json_schema('healthcare_entities', ENTITIES_SCHEMA),
+    'identify_entities_batch': JSON_OBJECT,
+}
+
+# Array results are wrapped in an object (structured outputs need an object at the top level)
+RESULT_KEYS = {
+    'extract_requirements': 'requirements',
+    'generate_test_cases': 'test_cases',
+    'generate_functional_test_cases': 'test_cases',
+    'generate_regulatory_test_cases': 'test_cases',
+}
+
+# Cheaper, faster model for extraction-style tasks; the stronger one for test design and compliance
+FAST_TASKS = {'extract_requirements', 'identify_entities', 'identify_entities_batch'}
@@ -1,52 +1,325 @@
-import json
+import asyncio
+import logging
+import os
+import threading
+import httpx
+import ijson
+import orjson
 import requests
-from typing import Dict, List, Any, Optional
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Callable, Iterator, Optional, Tuple
 from abc import ABC, abstractmethod
-import base64
-from urllib.parse import urljoin
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Keep-alive connections each integration session keeps open to its ALM host
+HTTP_POOL_MAXSIZE = 32
+# Transient failures retried by the adapter with exponential backoff (honours Retry-After).
+# urllib3 only retries idempotent methods, so create_* POSTs are never sent twice.
+HTTP_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+# Concurrent create calls in bulk_create_*; within the pool so each reuses a keep-alive connection
+BULK_CREATE_MAX_WORKERS = min(16, HTTP_POOL_MAXSIZE)
+# Async calls go over HTTP/2, multiplexed on one connection per host per bulk call
+ASYNC_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=HTTP_POOL_MAXSIZE)
+ASYNC_HTTP_TIMEOUT = 30
+# ETag-revalidated list GETs kept per integration (least recently used dropped first);
+# responses with more items than ETAG_CACHE_MAX_ITEMS are not kept
+ETAG_CACHE_SIZE = int(os.environ.get('ALM_ETAG_CACHE_SIZE', '128'))
+ETAG_CACHE_MAX_ITEMS = 1000
+# Hop-by-hop or transport-specific session headers not forwarded to the async client
+_ASYNC_SKIPPED_HEADERS = ('Connection', 'Accept-Encoding', 'User-Agent')
+
+@dataclass
+class ALMItem:
+    """A requirement or test case read from an ALM platform."""
+    __slots__ = ('id', 'title', 'description', 'priority', 'status', 'created', 'updated', 'labels', 'tags')
+    
+    id: str
+    title: str
+    description: str
+    priority: str
+    status: str
+    created: str
+    updated: str
+    labels: Optional[List[str]]  # Jira labels
+    tags: Optional[List[str]]  # Azure DevOps tags
+
+
+def _response_json(response: requests.Response) -> Any:
+    """
+    response.json() decoded with orjson. Invalid bodies raise requests'
+    JSONDecodeError (a RequestException), as response.json() does.
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+def _http_error(status_code: int, body: str) -> str:
+    """Error text for a failed write call, formatted only once a call has failed."""
+    return f"HTTP {status_code}: {body[:200]}"
+
+
+def _record_top_level_scalars(events: Iterator[Tuple[str, str, Any]], meta: Dict[str, Any]) -> Iterator[Tuple[str, str, Any]]:
+    """Pass ijson parse events through, storing top-level scalar members in meta."""
+    for prefix, event, value in events:
+        if prefix and '.' not in prefix and event in ('number', 'boolean', 'string', 'null'):
+            meta[prefix] = value
+        yield prefix, event, value
+
+class OrjsonSession(requests.Session):
+    """
+    requests.Session that encodes json= request bodies with orjson instead of
+    the stdlib encoder requests uses by default. Responses are decoded with
+    _response_json().
+    """
+    
+    def request(self, method, url, **kwargs):
+        if kwargs.get('json') is not None and kwargs.get('data') is None:
+            kwargs['data'] = orjson.dumps(kwargs.pop('json'))
+            headers = kwargs.get('headers') or {}
+            if 'Content-Type' not in headers and 'Content-Type' not in self.headers:
+                kwargs['headers'] = {**headers, 'Content-Type': 'application/json'}
+        return super().request(method, url, **kwargs)
+
 
 class ALMIntegration(ABC):
     """
     Abstract base class for Application Lifecycle Management (ALM) platform integrations.
     """
     
+    PLATFORM_NAME = 'ALM'
+    # Extra headers for create calls, e.g. a platform-specific content type
+    CREATE_HEADERS = None
+    
     def __init__(self, base_url: str, username: str, password: str, project_key: str = None):
         self.base_url = base_url.rstrip('/')
         self.username = username
         self.password = password
         self.project_key = project_key
-        self.session = requests.Session()
-        self._setup_authentication()
+        self.session = OrjsonSession()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=HTTP_RETRY
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.auth = self._auth()
+        # No session-wide Content-Type: OrjsonSession sets it on requests with a JSON
+        # body, and Azure DevOps work item writes pass their JSON Patch type per request
+        self.session.headers['Accept'] = 'application/json'
+        # (url, params) -> (ETag, items, meta) of list GETs, see _stream_json_items
+        self._etag_cache = OrderedDict()
+        self._etag_cache_lock = threading.Lock()
+    
+    def _stream_json_items(self, method: str, url: str, prefix: str, meta: Optional[Dict[str, Any]] = None, **kwargs) -> Iterator[Any]:
+        """
+        Yield the elements of the JSON array at `prefix` (ijson path, e.g. 'issues.item')
+        while the response body is still arriving, instead of decoding it whole first.
+        Decoding and transport errors are raised as RequestException, like response.json().
+        If `meta` is given, the response's top-level scalar members (e.g. a page's
+        total) are stored in it as they are parsed.
+        
+        GET results that came with an ETag are kept (up to ETAG_CACHE_SIZE responses)
+        and revalidated with If-None-Match on the next identical request; a 304
+        replays them without a body to parse.
+        """
+        cache_key = (url, tuple(sorted((kwargs.get('params') or {}).items()))) if method == 'GET' else None
+        cached = None
+        if cache_key:
+            with self._etag_cache_lock:
+                cached = self._etag_cache.get(cache_key)
+                if cached:
+                    self._etag_cache.move_to_end(cache_key)
+        if cached:
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), 'If-None-Match': cached[0]}
+        
+        with self.session.request(method, url, stream=True, **kwargs) as response:
+            if cached and response.status_code == 304:
+                if meta is not None:
+                    meta.update(cached[2])
+                yield from cached[1]
+                return
+            response.raise_for_status()
+            response.raw.decode_content = True
+            etag = response.headers.get('ETag') if cache_key else None
+            items = []
+            events = ijson.parse(response.raw, use_float=True)
+            if meta is not None:
+                events = _record_top_level_scalars(events, meta)
+            try:
+                for item in ijson.items(events, prefix):
+                    if etag:
+                        if len(items) < ETAG_CACHE_MAX_ITEMS:
+                            items.append(item)
+                        else:
+                            etag = items = None
+                    yield item
+            except (ijson.JSONError, urllib3.exceptions.HTTPError) as e:
+                raise requests.exceptions.RequestException(str(e)) from e
+            if etag:
+                with self._etag_cache_lock:
+                    self._etag_cache[cache_key] = (etag, items, dict(meta or {}))
+                    self._etag_cache.move_to_end(cache_key)
+                    while len(self._etag_cache) > ETAG_CACHE_SIZE:
+                        self._etag_cache.popitem(last=False)
+    
+    def _auth(self) -> HTTPBasicAuth:
+        """HTTP Basic credentials for the ALM platform; requests builds the Authorization header."""
+        return HTTPBasicAuth(self.username, self.password)
     
     @abstractmethod
-    def _setup_authentication(self):
-        """Setup authentication for the ALM platform."""
+    def _requirement_request(self, requirement_data: Dict[str, Any]) -> Tuple[str, Any]:
+        """URL and JSON body of the call creating a requirement."""
         pass
     
     @abstractmethod
+    def _test_case_request(self, test_case_data: Dict[str, Any]) -> Tuple[str, Any]:
+        """URL and JSON body of the call creating a test case."""
+        pass
+    
     def create_requirement(self, requirement_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a requirement in the ALM platform."""
-        pass
+        return self._create('requirement', self._requirement_request, requirement_data)
     
-    @abstractmethod
     def create_test_case(self, test_case_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a test case in the ALM platform."""
-        pass
+        return self._create('test case', self._test_case_request, test_case_data)
+    
+    async def acreate_requirement(self, requirement_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a requirement in the ALM platform over HTTP/2."""
+        return (await self._abulk_create('requirement', self._requirement_request, [requirement_data]))[0]
+    
+    async def acreate_test_case(self, test_case_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a test case in the ALM platform over HTTP/2."""
+        return (await self._abulk_create('test case', self._test_case_request, [test_case_data]))[0]
+    
+    def _create(self, item_type: str, build_request: Callable[[Dict[str, Any]], Tuple[str, Any]],
+                data: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            url, body = build_request(data)
+            response = self.session.post(url, json=body, headers=self.CREATE_HEADERS)
+            if response.status_code >= 400:
+                return {"error": f"Failed to create {item_type} in {self.PLATFORM_NAME}: {_http_error(response.status_code, response.text)}"}
+            return _response_json(response)
+        except requests.exceptions.RequestException as e:
+            return {"error": f"Failed to create {item_type} in {self.PLATFORM_NAME}: {str(e)}"}
+    
+    def _async_headers(self) -> Dict[str, str]:
+        """Session default headers that carry over to httpx requests."""
+        return {name: value for name, value in self.session.headers.items() if name not in _ASYNC_SKIPPED_HEADERS}
+    
+    def _async_auth(self) -> Tuple[str, str]:
+        return self.session.auth.username, self.session.auth.password
+    
+    def _async_client(self) -> httpx.AsyncClient:
+        """HTTP/2 client carrying the session's headers and credentials; use it with async with."""
+        return httpx.AsyncClient(
+            http2=True, limits=ASYNC_HTTP_LIMITS, timeout=ASYNC_HTTP_TIMEOUT,
+            headers=self._async_headers(), auth=self._async_auth()
+        )
+    
+    def _prepare_create_requests(self) -> None:
+        """
+        Fetch any platform metadata the create request builders need, so that
+        building requests afterwards does no I/O. Raises RequestException.
+        """
+    
+    async def _acreate(self, client: httpx.AsyncClient, item_type: str,
+                       build_request: Callable[[Dict[str, Any]], Tuple[str, Any]],
+                       data: Dict[str, Any]) -> Dict[str, Any]:
+        headers = {'Content-Type': 'application/json', **(self.CREATE_HEADERS or {})}
+        try:
+            url, body = build_request(data)
+            response = await client.post(url, content=orjson.dumps(body), headers=headers)
+            if response.status_code >= 400:
+                return {"error": f"Failed to create {item_type} in {self.PLATFORM_NAME}: {_http_error(response.status_code, response.text)}"}
+            return orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            return {"error": f"Failed to create {item_type} in {self.PLATFORM_NAME}: {str(e)}"}
+    
+    async def _abulk_create(self, item_type: str, build_request: Callable[[Dict[str, Any]], Tuple[str, Any]],
+                            items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create items as concurrent HTTP/2 streams over one client, which is
+        closed before returning; results are in input order.
+        """
+        try:
+            # Metadata lookups use the blocking session, so they run off the event loop
+            await asyncio.to_thread(self._prepare_create_requests)
+        except requests.exceptions.RequestException as e:
+            return [{"error": f"Failed to create {item_type} in {self.PLATFORM_NAME}: {str(e)}"} for _ in items]
+        
+        semaphore = asyncio.Semaphore(BULK_CREATE_MAX_WORKERS)
+        async with self._async_client() as client:
+            async def bounded(item):
+                async with semaphore:
+                    return await self._acreate(client, item_type, build_request, item)
+            
+            return await asyncio.gather(*(bounded(item) for item in items))
     
     @abstractmethod
     def link_requirement_to_test_case(self, requirement_id: str, test_case_id: str) -> bool:
         """Create a traceability link between requirement and test case."""
         pass
     
+    def link_requirements_to_test_case(self, requirement_ids: List[str], test_case_id: str) -> bool:
+        """Link a test case to several requirements; True if every link was created."""
+        results = [self.link_requirement_to_test_case(requirement_id, test_case_id) for requirement_id in requirement_ids]
+        return all(results)
+    
     @abstractmethod
-    def get_requirements(self) -> List[Dict[str, Any]]:
+    def get_requirements(self) -> List[ALMItem]:
         """Get all requirements from the ALM platform."""
         pass
     
     @abstractmethod
-    def get_test_cases(self) -> List[Dict[str, Any]]:
+    def get_test_cases(self) -> List[ALMItem]:
         """Get all test cases from the ALM platform."""
         pass
+    
+    @abstractmethod
+    def ping(self) -> Dict[str, Any]:
+        """Check connectivity and credentials with a single lightweight request."""
+        pass
+    
+    def bulk_create_requirements(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create many requirements concurrently; results are in input order."""
+        with ThreadPoolExecutor(max_workers=BULK_CREATE_MAX_WORKERS) as executor:
+            return list(executor.map(self.create_requirement, items))
+    
+    def bulk_create_test_cases(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create many test cases concurrently; results are in input order."""
+        with ThreadPoolExecutor(max_workers=BULK_CREATE_MAX_WORKERS) as executor:
+            return list(executor.map(self.create_test_case, items))
+    
+    async def abulk_create_requirements(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create many requirements as concurrent HTTP/2 streams; results are in input order."""
+        return await self._abulk_create('requirement', self._requirement_request, items)
+    
+    async def abulk_create_test_cases(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create many test cases as concurrent HTTP/2 streams; results are in input order."""
+        return await self._abulk_create('test case', self._test_case_request, items)
+    
+    def get_item_counts(self) -> Dict[str, int]:
+        """Get the number of requirements and test cases in the ALM project."""
+        return {
+            'requirements_count': len(self.get_requirements()),
+            'test_cases_count': len(self.get_test_cases())
+        }
+
+
+# Issues per Jira search request; small pages keep each JQL query cheap for the server
+JIRA_PAGE_SIZE = 100
+JIRA_PRIORITIES = {'high': 'High', 'medium': 'Medium', 'low': 'Low'}
+# Name of the Jira custom field holding our requirement ID; its customfield_* id differs per instance
+JIRA_REQUIREMENT_ID_FIELD = os.environ.get('JIRA_REQUIREMENT_ID_FIELD', 'Requirement ID')
 
 
 class JiraIntegration(ALMIntegration):
@@ -54,21 +327,38 @@ class JiraIntegration(ALMIntegration):
     Integration with Atlassian Jira for requirements and test case management.
     """
     
-    def _setup_authentication(self):
-        """Setup basic authentication for Jira."""
-        auth_string = f"{self.username}:{self.password}"
-        auth_bytes = auth_string.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        self.session.headers.update({
-            'Authorization': f'Basic {auth_b64}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+    PLATFORM_NAME = 'Jira'
     
-    def create_requirement(self, requirement_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a requirement as a Jira issue."""
-        url = f"{self.base_url}/rest/api/2/issue"
+    def __init__(self, base_url: str, username: str, password: str, project_key: str = None):
+        super().__init__(base_url, username, password, project_key)
+        self._api_url = f"{self.base_url}/rest/api/2"
+        self._issue_url = f"{self._api_url}/issue"
+        self._search_url = f"{self._api_url}/search"
+        # JQL per issue type, built once for the project
+        self._jql = {
+            issue_type: f"project = {self.project_key} AND issuetype = {issue_type}" for issue_type in ('Story', 'Test')
+        }
+        # Field name -> id, fetched once on first use
+        self._custom_fields = None
+        self._custom_fields_lock = threading.Lock()
+    
+    def _get_custom_field_id(self, name: str) -> Optional[str]:
+        """Id (customfield_*) of a Jira field by name, from the instance's field list fetched once."""
+        if self._custom_fields is None:
+            with self._custom_fields_lock:
+                if self._custom_fields is None:
+                    response = self.session.get(f"{self._api_url}/field")
+                    response.raise_for_status()
+                    self._custom_fields = {field['name']: field['id'] for field in _response_json(response)}
+        return self._custom_fields.get(name)
+    
+    def _prepare_create_requests(self) -> None:
+        """Load the field list _requirement_request looks the requirement id field up in."""
+        self._get_custom_field_id(JIRA_REQUIREMENT_ID_FIELD)
+    
+    def _requirement_request(self, requirement_data: Dict[str, Any]) -> Tuple[str, Any]:
+        """URL and body for creating a requirement as a Jira issue."""
+        url = self._issue_url
         
         jira_issue = {
             "fields": {
@@ -83,19 +373,15 @@ class JiraIntegration(ALMIntegration):
         
         # Add custom fields if available
         if 'requirement_id' in requirement_data:
-            # Assuming a custom field for requirement ID exists
-            jira_issue["fields"]["customfield_10001"] = requirement_data['requirement_id']
+            field_id = self._get_custom_field_id(JIRA_REQUIREMENT_ID_FIELD)
+            if field_id:
+                jira_issue["fields"][field_id] = requirement_data['requirement_id']
         
-        try:
-            response = self.session.post(url, json=jira_issue)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Failed to create requirement in Jira: {str(e)}"}
+        return url, jira_issue
     
-    def create_test_case(self, test_case_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a test case as a Jira issue."""
-        url = f"{self.base_url}/rest/api/2/issue"
+    def _test_case_request(self, test_case_data: Dict[str, Any]) -> Tuple[str, Any]:
+        """URL and body for creating a test case as a Jira issue."""
+        url = self._issue_url
         
         # Format test steps for Jira description
         test_steps = test_case_data.get('test_steps', [])
@@ -128,16 +414,11 @@ class JiraIntegration(ALMIntegration):
             }
         }
         
-        try:
-            response = self.session.post(url, json=jira_issue)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Failed to create test case in Jira: {str(e)}"}
+        return url, jira_issue
     
     def link_requirement_to_test_case(self, requirement_id: str, test_case_id: str) -> bool:
         """Create an issue link between requirement and test case."""
-        url = f"{self.base_url}/rest/api/2/issueLink"
+        url = f"{self._api_url}/issueLink"
         
         link_data = {
             "type": {"name": "Tests"},  # Link type - may need to be configured in Jira
@@ -147,86 +428,113 @@ class JiraIntegration(ALMIntegration):
         
         try:
             response = self.session.post(url, json=link_data)
-            response.raise_for_status()
-            return True
         except requests.exceptions.RequestException as e:
-            print(f"Failed to link requirement to test case in Jira: {str(e)}")
+            logger.warning("Failed to link requirement to test case in Jira: %s", e)
+            return False
+        if response.status_code >= 400:
+            logger.warning("Failed to link requirement to test case in Jira: %s", _http_error(response.status_code, response.text))
             return False
+        return True
     
-    def get_requirements(self) -> List[Dict[str, Any]]:
+    def get_requirements(self) -> List[ALMItem]:
         """Get all requirements (stories) from Jira project."""
-        url = f"{self.base_url}/rest/api/2/search"
-        
-        jql = f"project = {self.project_key} AND issuetype = Story"
-        params = {
-            "jql": jql,
-            "maxResults": 1000,
-            "fields": "summary,description,priority,labels,status,created,updated"
-        }
-        
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            requirements = []
-            for issue in data.get('issues', []):
-                requirements.append({
-                    'id': issue['key'],
-                    'title': issue['fields']['summary'],
-                    'description': issue['fields']['description'] or '',
-                    'priority': issue['fields']['priority']['name'].lower(),
-                    'status': issue['fields']['status']['name'],
-                    'labels': issue['fields']['labels'],
-                    'created': issue['fields']['created'],
-                    'updated': issue['fields']['updated']
-                })
-            
-            return requirements
+            return list(self.iter_issues('Story'))
         except requests.exceptions.RequestException as e:
             return []
     
-    def get_test_cases(self) -> List[Dict[str, Any]]:
+    def get_test_cases(self) -> List[ALMItem]:
         """Get all test cases from Jira project."""
-        url = f"{self.base_url}/rest/api/2/search"
+        try:
+            return list(self.iter_issues('Test'))
+        except requests.exceptions.RequestException as e:
+            return []
+    
+    def iter_issues(self, issue_type: str) -> Iterator[ALMItem]:
+        """
+        Yield the project's issues of a type page by page (startAt/maxResults),
+        up to JIRA_PAGE_SIZE at a time. Raises RequestException on failure.
+        """
+        url = self._search_url
         
-        jql = f"project = {self.project_key} AND issuetype = Test"
         params = {
-            "jql": jql,
-            "maxResults": 1000,
+            "jql": self._jql[issue_type],
+            "startAt": 0,
+            "maxResults": JIRA_PAGE_SIZE,
             "fields": "summary,description,priority,labels,status,created,updated"
         }
         
+        while True:
+            page_count = 0
+            page = {}
+            for issue in self._stream_json_items('GET', url, 'issues.item', meta=page, params=params):
+                page_count += 1
+                fields = issue['fields']
+                # priority and status may be null or hidden by the project's field configuration
+                priority = fields.get('priority') or {}
+                status = fields.get('status') or {}
+                yield ALMItem(
+                    id=issue['key'],
+                    title=fields.get('summary', ''),
+                    description=fields.get('description') or '',
+                    priority=(priority.get('name') or 'medium').lower(),
+                    status=status.get('name', ''),
+                    created=fields.get('created', ''),
+                    updated=fields.get('updated', ''),
+                    labels=fields.get('labels') or [],
+                    tags=None
+                )
+            # Jira may return fewer than maxResults issues on any page, so stop
+            # only once the reported total is reached (or on an empty page)
+            params['startAt'] += page_count
+            total = page.get('total')
+            if page_count == 0 or page.get('isLast') or (total is not None and params['startAt'] >= total):
+                break
+    
+    def ping(self) -> Dict[str, Any]:
+        """Check the connection by fetching the authenticated Jira user."""
+        url = f"{self._api_url}/myself"
+        
         try:
-            response = self.session.get(url, params=params)
+            response = self.session.get(url)
             response.raise_for_status()
-            data = response.json()
-            
-            test_cases = []
-            for issue in data.get('issues', []):
-                test_cases.append({
-                    'id': issue['key'],
-                    'title': issue['fields']['summary'],
-                    'description': issue['fields']['description'] or '',
-                    'priority': issue['fields']['priority']['name'].lower(),
-                    'status': issue['fields']['status']['name'],
-                    'labels': issue['fields']['labels'],
-                    'created': issue['fields']['created'],
-                    'updated': issue['fields']['updated']
-                })
-            
-            return test_cases
+            return {"status": "ok"}
         except requests.exceptions.RequestException as e:
-            return []
+            return {"error": f"Failed to connect to Jira: {str(e)}"}
+    
+    def get_item_counts(self) -> Dict[str, int]:
+        """Get story and test counts from the search totals without fetching issues."""
+        url = self._search_url
+        
+        counts = {}
+        for key, issue_type in (('requirements_count', 'Story'), ('test_cases_count', 'Test')):
+            params = {
+                "jql": self._jql[issue_type],
+                "maxResults": 0
+            }
+            response = self.session.get(url, params=params)
+            response.raise_for_status()
+            counts[key] = _response_json(response).get('total', 0)
+        return counts
     
     def _map_priority(self, priority: str) -> str:
         """Map internal priority to Jira priority."""
-        priority_mapping = {
-            'high': 'High',
-            'medium': 'Medium',
-            'low': 'Low'
-        }
-        return priority_mapping.get(priority.lower(), 'Medium')
+        return JIRA_PRIORITIES.get(priority.lower(), 'Medium')
+
+
+# Work item create/update bodies are JSON Patch documents; passed per request so the
+# shared session headers are never mutated while other calls are in flight
+JSON_PATCH_HEADERS = {'Content-Type': 'application/json-patch+json'}
+# Azure DevOps workitemsbatch accepts at most 200 ids per call
+AZURE_WORK_ITEMS_BATCH_SIZE = 200
+# Concurrent per-item requests on servers without workitemsbatch
+AZURE_ITEM_FETCH_CONCURRENCY = 32
+AZURE_PRIORITY_NUMBERS = {'high': 1, 'medium': 2, 'low': 3}
+AZURE_NUMBER_PRIORITIES = {1: 'high', 2: 'medium', 3: 'low'}
+AZURE_WORK_ITEM_FIELDS = [
+    "System.Title", "System.Description", "Microsoft.VSTS.Common.Priority", "System.Tags",
+    "System.State", "System.CreatedDate", "System.ChangedDate"
+]
 
 
 class AzureDevOpsIntegration(ALMIntegration):
@@ -234,22 +542,29 @@ class AzureDevOpsIntegration(ALMIntegration):
     Integration with Microsoft Azure DevOps for requirements and test case management.
     """
     
-    def _setup_authentication(self):
-        """Setup authentication for Azure DevOps (using Personal Access Token)."""
-        # For Azure DevOps, password should be a Personal Access Token
-        auth_string = f":{self.password}"
-        auth_bytes = auth_string.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        self.session.headers.update({
-            'Authorization': f'Basic {auth_b64}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+    PLATFORM_NAME = 'Azure DevOps'
+    CREATE_HEADERS = JSON_PATCH_HEADERS
     
-    def create_requirement(self, requirement_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a requirement as a work item in Azure DevOps."""
-        url = f"{self.base_url}/{self.project_key}/_apis/wit/workitems/$User Story?api-version=6.0"
+    def __init__(self, base_url: str, username: str, password: str, project_key: str = None):
+        super().__init__(base_url, username, password, project_key)
+        self._wit_url = f"{self.base_url}/{self.project_key}/_apis/wit"
+        self._wiql_url = f"{self._wit_url}/wiql?api-version=6.0"
+        self._workitems_batch_url = f"{self._wit_url}/workitemsbatch?api-version=6.0"
+        # WIQL id query per work item type, built once for the project
+        self._wiql = {
+            work_item_type: {
+                "query": f"SELECT [System.Id] FROM WorkItems WHERE [System.TeamProject] = '{self.project_key}' AND [System.WorkItemType] = '{work_item_type}'"
+            }
+            for work_item_type in ('User Story', 'Test Case')
+        }
+    
+    def _auth(self) -> HTTPBasicAuth:
+        """Personal Access Token as the password of HTTP Basic auth with an empty user name."""
+        return HTTPBasicAuth('', self.password)
+    
+    def _requirement_request(self, requirement_data: Dict[str, Any]) -> Tuple[str, Any]:
+        """URL and body for creating a requirement as a work item in Azure DevOps."""
+        url = f"{self._wit_url}/workitems/$User Story?api-version=6.0"
         
         work_item = [
             {
@@ -278,26 +593,18 @@ class AzureDevOpsIntegration(ALMIntegration):
                 "value": tags
             })
         
-        try:
-            self.session.headers['Content-Type'] = 'application/json-patch+json'
-            response = self.session.post(url, json=work_item)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Failed to create requirement in Azure DevOps: {str(e)}"}
-        finally:
-            self.session.headers['Content-Type'] = 'application/json'
+        return url, work_item
     
-    def create_test_case(self, test_case_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a test case as a work item in Azure DevOps."""
-        url = f"{self.base_url}/{self.project_key}/_apis/wit/workitems/$Test Case?api-version=6.0"
+    def _test_case_request(self, test_case_data: Dict[str, Any]) -> Tuple[str, Any]:
+        """URL and body for creating a test case as a work item in Azure DevOps."""
+        url = f"{self._wit_url}/workitems/$Test Case?api-version=6.0"
         
         # Format test steps for Azure DevOps
         test_steps = test_case_data.get('test_steps', [])
-        formatted_steps = "<steps>"
-        for i, step in enumerate(test_steps):
-            formatted_steps += f"<step id='{i+1}' type='ActionStep'><parameterizedString isformatted='true'><DIV><P>{step}</P></DIV></parameterizedString><parameterizedString isformatted='true'><DIV><P>Expected result for step {i+1}</P></DIV></parameterizedString><description/></step>"
-        formatted_steps += "</steps>"
+        formatted_steps = "<steps>" + "".join(
+            f"<step id='{i+1}' type='ActionStep'><parameterizedString isformatted='true'><DIV><P>{step}</P></DIV></parameterizedString><parameterizedString isformatted='true'><DIV><P>Expected result for step {i+1}</P></DIV></parameterizedString><description/></step>"
+            for i, step in enumerate(test_steps)
+        ) + "</steps>"
         
         work_item = [
             {
@@ -331,19 +638,15 @@ class AzureDevOpsIntegration(ALMIntegration):
                 "value": tags
             })
         
-        try:
-            self.session.headers['Content-Type'] = 'application/json-patch+json'
-            response = self.session.post(url, json=work_item)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Failed to create test case in Azure DevOps: {str(e)}"}
-        finally:
-            self.session.headers['Content-Type'] = 'application/json'
+        return url, work_item
     
     def link_requirement_to_test_case(self, requirement_id: str, test_case_id: str) -> bool:
         """Create a work item link between requirement and test case."""
-        url = f"{self.base_url}/{self.project_key}/_apis/wit/workitems/{test_case_id}?api-version=6.0"
+        return self.link_requirements_to_test_case([requirement_id], test_case_id)
+    
+    def link_requirements_to_test_case(self, requirement_ids: List[str], test_case_id: str) -> bool:
+        """Link the test case to all requirements with a single JSON Patch of its relations."""
+        url = f"{self._wit_url}/workitems/{test_case_id}?api-version=6.0"
         
         link_data = [
             {
@@ -351,113 +654,131 @@ class AzureDevOpsIntegration(ALMIntegration):
                 "path": "/relations/-",
                 "value": {
                     "rel": "Microsoft.VSTS.Common.TestedBy-Reverse",
-                    "url": f"{self.base_url}/{self.project_key}/_apis/wit/workItems/{requirement_id}"
+                    "url": f"{self._wit_url}/workItems/{requirement_id}"
                 }
             }
+            for requirement_id in requirement_ids
         ]
         
         try:
-            self.session.headers['Content-Type'] = 'application/json-patch+json'
-            response = self.session.patch(url, json=link_data)
-            response.raise_for_status()
-            return True
+            response = self.session.patch(url, json=link_data, headers=JSON_PATCH_HEADERS)
         except requests.exceptions.RequestException as e:
-            print(f"Failed to link requirement to test case in Azure DevOps: {str(e)}")
+            logger.warning("Failed to link requirement to test case in Azure DevOps: %s", e)
             return False
-        finally:
-            self.session.headers['Content-Type'] = 'application/json'
+        if response.status_code >= 400:
+            logger.warning("Failed to link requirement to test case in Azure DevOps: %s", _http_error(response.status_code, response.text))
+            return False
+        return True
     
-    def get_requirements(self) -> List[Dict[str, Any]]:
+    def get_requirements(self) -> List[ALMItem]:
         """Get all requirements (user stories) from Azure DevOps project."""
-        url = f"{self.base_url}/{self.project_key}/_apis/wit/wiql?api-version=6.0"
-        
-        wiql_query = {
-            "query": f"SELECT [System.Id], [System.Title], [System.Description], [Microsoft.VSTS.Common.Priority], [System.Tags], [System.State], [System.CreatedDate], [System.ChangedDate] FROM WorkItems WHERE [System.TeamProject] = '{self.project_key}' AND [System.WorkItemType] = 'User Story'"
-        }
+        return self._get_work_items('User Story')
+    
+    def get_test_cases(self) -> List[ALMItem]:
+        """Get all test cases from Azure DevOps project."""
+        return self._get_work_items('Test Case')
+    
+    def _get_work_items(self, work_item_type: str) -> List[ALMItem]:
+        """
+        Get all work items of a type: one WIQL query for the ids, then their fields
+        through the workitemsbatch endpoint, AZURE_WORK_ITEMS_BATCH_SIZE ids per call.
+        Servers without workitemsbatch get concurrent per-item requests instead.
+        """
+        url = self._wiql_url
         
         try:
-            response = self.session.post(url, json=wiql_query)
-            response.raise_for_status()
-            query_result = response.json()
-            
-            requirements = []
-            for work_item in query_result.get('workItems', []):
-                # Get detailed work item information
-                item_url = f"{self.base_url}/{self.project_key}/_apis/wit/workitems/{work_item['id']}?api-version=6.0"
-                item_response = self.session.get(item_url)
-                if item_response.status_code == 200:
-                    item_data = item_response.json()
-                    fields = item_data.get('fields', {})
-                    
-                    requirements.append({
-                        'id': str(work_item['id']),
-                        'title': fields.get('System.Title', ''),
-                        'description': fields.get('System.Description', ''),
-                        'priority': self._map_number_to_priority(fields.get('Microsoft.VSTS.Common.Priority', 2)),
-                        'status': fields.get('System.State', ''),
-                        'tags': fields.get('System.Tags', '').split('; ') if fields.get('System.Tags') else [],
-                        'created': fields.get('System.CreatedDate', ''),
-                        'updated': fields.get('System.ChangedDate', '')
-                    })
+            ids = [
+                work_item['id']
+                for work_item in self._stream_json_items('POST', url, 'workItems.item', json=self._wiql[work_item_type])
+            ]
             
-            return requirements
-        except requests.exceptions.RequestException as e:
+            try:
+                return self._fetch_work_items_batched(ids)
+            except requests.exceptions.HTTPError as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+                return asyncio.run(self._afetch_work_items(ids))
+        except (requests.exceptions.RequestException, httpx.HTTPError, orjson.JSONDecodeError) as e:
             return []
     
-    def get_test_cases(self) -> List[Dict[str, Any]]:
-        """Get all test cases from Azure DevOps project."""
-        url = f"{self.base_url}/{self.project_key}/_apis/wit/wiql?api-version=6.0"
+    def _fetch_work_items_batched(self, ids: List[int]) -> List[ALMItem]:
+        items = []
+        for start in range(0, len(ids), AZURE_WORK_ITEMS_BATCH_SIZE):
+            # errorPolicy "omit": items deleted since the query are skipped instead of failing the batch
+            batch = {
+                "ids": ids[start:start + AZURE_WORK_ITEMS_BATCH_SIZE],
+                "fields": AZURE_WORK_ITEM_FIELDS,
+                "errorPolicy": "omit"
+            }
+            for item_data in self._stream_json_items('POST', self._workitems_batch_url, 'value.item', json=batch):
+                if item_data:
+                    items.append(self._work_item_to_item(item_data))
+        return items
+    
+    async def _afetch_work_items(self, ids: List[int]) -> List[ALMItem]:
+        """One GET per work item, AZURE_ITEM_FETCH_CONCURRENCY in flight over a single HTTP/2 client."""
+        semaphore = asyncio.Semaphore(AZURE_ITEM_FETCH_CONCURRENCY)
+        fields = ",".join(AZURE_WORK_ITEM_FIELDS)
         
-        wiql_query = {
-            "query": f"SELECT [System.Id], [System.Title], [System.Description], [Microsoft.VSTS.Common.Priority], [System.Tags], [System.State], [System.CreatedDate], [System.ChangedDate] FROM WorkItems WHERE [System.TeamProject] = '{self.project_key}' AND [System.WorkItemType] = 'Test Case'"
-        }
+        async with self._async_client() as client:
+            async def fetch(work_item_id):
+                async with semaphore:
+                    response = await client.get(
+                        f"{self._wit_url}/workitems/{work_item_id}",
+                        params={"fields": fields, "api-version": "6.0"}
+                    )
+                # Items deleted since the query are skipped
+                return orjson.loads(response.content) if response.status_code == 200 else None
+            
+            results = await asyncio.gather(*(fetch(work_item_id) for work_item_id in ids))
+        return [self._work_item_to_item(item_data) for item_data in results if item_data]
+    
+    def _work_item_to_item(self, item_data: Dict[str, Any]) -> ALMItem:
+        fields = item_data.get('fields', {})
+        return ALMItem(
+            id=str(item_data['id']),
+            title=fields.get('System.Title', ''),
+            description=fields.get('System.Description', ''),
+            priority=self._map_number_to_priority(fields.get('Microsoft.VSTS.Common.Priority', 2)),
+            status=fields.get('System.State', ''),
+            created=fields.get('System.CreatedDate', ''),
+            updated=fields.get('System.ChangedDate', ''),
+            labels=None,
+            tags=fields.get('System.Tags', '').split('; ') if fields.get('System.Tags') else []
+        )
+    
+    def ping(self) -> Dict[str, Any]:
+        """Check the connection by fetching the organization's connection data."""
+        url = f"{self.base_url}/_apis/connectionData"
         
         try:
-            response = self.session.post(url, json=wiql_query)
+            response = self.session.get(url)
             response.raise_for_status()
-            query_result = response.json()
-            
-            test_cases = []
-            for work_item in query_result.get('workItems', []):
-                # Get detailed work item information
-                item_url = f"{self.base_url}/{self.project_key}/_apis/wit/workitems/{work_item['id']}?api-version=6.0"
-                item_response = self.session.get(item_url)
-                if item_response.status_code == 200:
-                    item_data = item_response.json()
-                    fields = item_data.get('fields', {})
-                    
-                    test_cases.append({
-                        'id': str(work_item['id']),
-                        'title': fields.get('System.Title', ''),
-                        'description': fields.get('System.Description', ''),
-                        'priority': self._map_number_to_priority(fields.get('Microsoft.VSTS.Common.Priority', 2)),
-                        'status': fields.get('System.State', ''),
-                        'tags': fields.get('System.Tags', '').split('; ') if fields.get('System.Tags') else [],
-                        'created': fields.get('System.CreatedDate', ''),
-                        'updated': fields.get('System.ChangedDate', '')
-                    })
-            
-            return test_cases
+            return {"status": "ok"}
         except requests.exceptions.RequestException as e:
-            return []
+            return {"error": f"Failed to connect to Azure DevOps: {str(e)}"}
+    
+    def get_item_counts(self) -> Dict[str, int]:
+        """Count user stories and test cases from WIQL id lists, without per-item fetches."""
+        url = self._wiql_url
+        
+        counts = {}
+        for key, work_item_type in (('requirements_count', 'User Story'), ('test_cases_count', 'Test Case')):
+            counts[key] = sum(
+                1 for _ in self._stream_json_items('POST', url, 'workItems.item', json=self._wiql[work_item_type])
+            )
+        return counts
     
     def _map_priority_to_number(self, priority: str) -> int:
         """Map internal priority to Azure DevOps priority number."""
-        priority_mapping = {
-            'high': 1,
-            'medium': 2,
-            'low': 3
-        }
-        return priority_mapping.get(priority.lower(), 2)
+        return AZURE_PRIORITY_NUMBERS.get(priority.lower(), 2)
     
     def _map_number_to_priority(self, priority_number: int) -> str:
         """Map Azure DevOps priority number to internal priority."""
-        number_mapping = {
-            1: 'high',
-            2: 'medium',
-            3: 'low'
-        }
-        return number_mapping.get(priority_number, 'medium')
+        return AZURE_NUMBER_PRIORITIES.get(priority_number, 'medium')
+
+
+POLARION_PRIORITIES = {'high': 'high', 'medium': 'normal', 'low': 'low'}
 
 
 class PolarionIntegration(ALMIntegration):
@@ -465,24 +786,18 @@ class PolarionIntegration(ALMIntegration):
     Integration with Siemens Polarion ALM for requirements and test case management.
     """
     
-    def _setup_authentication(self):
-        """Setup authentication for Polarion."""
-        # Polarion typically uses basic authentication
-        auth_string = f"{self.username}:{self.password}"
-        auth_bytes = auth_string.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
-        self.session.headers.update({
-            'Authorization': f'Basic {auth_b64}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+    PLATFORM_NAME = 'Polarion'
     
-    def create_requirement(self, requirement_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a requirement in Polarion."""
+    def __init__(self, base_url: str, username: str, password: str, project_key: str = None):
+        super().__init__(base_url, username, password, project_key)
+        self._project_url = f"{self.base_url}/polarion/rest/v1/projects/{self.project_key}"
+        self._workitems_url = f"{self._project_url}/workitems"
+    
+    def _requirement_request(self, requirement_data: Dict[str, Any]) -> Tuple[str, Any]:
+        """URL and body for creating a requirement in Polarion."""
         # Note: This is a simplified implementation
         # Actual Polarion integration would require specific API endpoints and data structures
-        url = f"{self.base_url}/polarion/rest/v1/projects/{self.project_key}/workitems"
+        url = self._workitems_url
         
         polarion_workitem = {
             "type": "requirement",
@@ -497,23 +812,15 @@ class PolarionIntegration(ALMIntegration):
             }
         }
         
-        try:
-            response = self.session.post(url, json=polarion_workitem)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Failed to create requirement in Polarion: {str(e)}"}
+        return url, polarion_workitem
     
-    def create_test_case(self, test_case_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a test case in Polarion."""
-        url = f"{self.base_url}/polarion/rest/v1/projects/{self.project_key}/workitems"
+    def _test_case_request(self, test_case_data: Dict[str, Any]) -> Tuple[str, Any]:
+        """URL and body for creating a test case in Polarion."""
+        url = self._workitems_url
         
         # Format test steps for Polarion
         test_steps = test_case_data.get('test_steps', [])
-        formatted_steps = "<ol>"
-        for step in test_steps:
-            formatted_steps += f"<li>{step}</li>"
-        formatted_steps += "</ol>"
+        formatted_steps = "<ol>" + "".join(f"<li>{step}</li>" for step in test_steps) + "</ol>"
         
         polarion_workitem = {
             "type": "testcase",
@@ -536,16 +843,11 @@ class PolarionIntegration(ALMIntegration):
             }
         }
         
-        try:
-            response = self.session.post(url, json=polarion_workitem)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {"error": f"Failed to create test case in Polarion: {str(e)}"}
+        return url, polarion_workitem
     
     def link_requirement_to_test_case(self, requirement_id: str, test_case_id: str) -> bool:
         """Create a link between requirement and test case in Polarion."""
-        url = f"{self.base_url}/polarion/rest/v1/projects/{self.project_key}/workitems/{test_case_id}/links"
+        url = f"{self._workitems_url}/{test_case_id}/links"
         
         link_data = {
             "role": "verifies",
@@ -556,72 +858,88 @@ class PolarionIntegration(ALMIntegration):
         
         try:
             response = self.session.post(url, json=link_data)
-            response.raise_for_status()
-            return True
         except requests.exceptions.RequestException as e:
-            print(f"Failed to link requirement to test case in Polarion: {str(e)}")
+            logger.warning("Failed to link requirement to test case in Polarion: %s", e)
             return False
+        if response.status_code >= 400:
+            logger.warning("Failed to link requirement to test case in Polarion: %s", _http_error(response.status_code, response.text))
+            return False
+        return True
     
-    def get_requirements(self) -> List[Dict[str, Any]]:
+    def get_requirements(self) -> List[ALMItem]:
         """Get all requirements from Polarion project."""
-        url = f"{self.base_url}/polarion/rest/v1/projects/{self.project_key}/workitems"
+        url = self._workitems_url
         params = {"query": "type:requirement"}
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
             requirements = []
-            for item in data.get('data', []):
-                requirements.append({
-                    'id': item.get('id', ''),
-                    'title': item.get('title', ''),
-                    'description': item.get('description', {}).get('content', ''),
-                    'priority': item.get('priority', 'medium').lower(),
-                    'status': item.get('status', ''),
-                    'created': item.get('created', ''),
-                    'updated': item.get('updated', '')
-                })
+            for item in self._stream_json_items('GET', url, 'data.item', params=params):
+                requirements.append(ALMItem(
+                    id=item.get('id', ''),
+                    title=item.get('title', ''),
+                    description=item.get('description', {}).get('content', ''),
+                    priority=item.get('priority', 'medium').lower(),
+                    status=item.get('status', ''),
+                    created=item.get('created', ''),
+                    updated=item.get('updated', ''),
+                    labels=None,
+                    tags=None
+                ))
             
             return requirements
         except requests.exceptions.RequestException as e:
             return []
     
-    def get_test_cases(self) -> List[Dict[str, Any]]:
+    def get_test_cases(self) -> List[ALMItem]:
         """Get all test cases from Polarion project."""
-        url = f"{self.base_url}/polarion/rest/v1/projects/{self.project_key}/workitems"
+        url = self._workitems_url
         params = {"query": "type:testcase"}
         
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
             test_cases = []
-            for item in data.get('data', []):
-                test_cases.append({
-                    'id': item.get('id', ''),
-                    'title': item.get('title', ''),
-                    'description': item.get('description', {}).get('content', ''),
-                    'priority': item.get('priority', 'medium').lower(),
-                    'status': item.get('status', ''),
-                    'created': item.get('created', ''),
-                    'updated': item.get('updated', '')
-                })
+            for item in self._stream_json_items('GET', url, 'data.item', params=params):
+                test_cases.append(ALMItem(
+                    id=item.get('id', ''),
+                    title=item.get('title', ''),
+                    description=item.get('description', {}).get('content', ''),
+                    priority=item.get('priority', 'medium').lower(),
+                    status=item.get('status', ''),
+                    created=item.get('created', ''),
+                    updated=item.get('updated', ''),
+                    labels=None,
+                    tags=None
+                ))
             
             return test_cases
         except requests.exceptions.RequestException as e:
             return []
     
+    def ping(self) -> Dict[str, Any]:
+        """Check the connection by fetching the Polarion project."""
+        url = self._project_url
+        
+        try:
+            response = self.session.get(url)
+            response.raise_for_status()
+            return {"status": "ok"}
+        except requests.exceptions.RequestException as e:
+            return {"error": f"Failed to connect to Polarion: {str(e)}"}
+    
+    def get_item_counts(self) -> Dict[str, int]:
+        """Get requirement and test case counts from the page metadata of one-item pages."""
+        url = self._workitems_url
+        
+        counts = {}
+        for key, item_type in (('requirements_count', 'requirement'), ('test_cases_count', 'testcase')):
+            params = {"query": f"type:{item_type}", "page[size]": 1}
+            response = self.session.get(url, params=params)
+            response.raise_for_status()
+            counts[key] = _response_json(response).get('meta', {}).get('totalCount', 0)
+        return counts
+    
     def _map_priority(self, priority: str) -> str:
         """Map internal priority to Polarion priority."""
-        priority_mapping = {
-            'high': 'high',
-            'medium': 'normal',
-            'low': 'low'
-        }
-        return priority_mapping.get(priority.lower(), 'normal')
+        return POLARION_PRIORITIES.get(priority.lower(), 'normal')
 
 
 class ALMIntegrationFactory:
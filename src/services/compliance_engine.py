@@ -1,19 +1,28 @@
+import itertools
 import json
+import multiprocessing
+import os
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, Iterator, List, Any, Optional, Set, Tuple
 from datetime import datetime
-from dataclasses import dataclass
+from functools import lru_cache
+from dataclasses import dataclass, replace
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+import ahocorasick
+from src.services.worker_processes import WORKER_CONTEXT
 
-class ComplianceLevel(Enum):
-    """Compliance assessment levels."""
+class ComplianceLevel(str, Enum):
+    """Compliance assessment levels (members are their own string values)."""
     COMPLIANT = "compliant"
     PARTIALLY_COMPLIANT = "partially_compliant"
     NON_COMPLIANT = "non_compliant"
     UNKNOWN = "unknown"
 
-class RiskLevel(Enum):
-    """Risk assessment levels."""
+class RiskLevel(str, Enum):
+    """Risk assessment levels (members are their own string values)."""
     HIGH = "high"
     MEDIUM = "medium"
     LOW = "low"
@@ -22,12 +31,17 @@ class RiskLevel(Enum):
 @dataclass
 class ComplianceRule:
     """Represents a compliance rule for a specific standard."""
+    __slots__ = (
+        'rule_id', 'standard', 'title', 'description', 'requirement_patterns',
+        'test_case_patterns', 'mandatory', 'risk_level', 'validation_criteria'
+    )
+    
     rule_id: str
     standard: str
     title: str
     description: str
-    requirement_patterns: List[str]
-    test_case_patterns: List[str]
+    requirement_patterns: Tuple[str, ...]
+    test_case_patterns: Tuple[str, ...]
     mandatory: bool
     risk_level: RiskLevel
     validation_criteria: Dict[str, Any]
@@ -35,6 +49,11 @@ class ComplianceRule:
 @dataclass
 class ComplianceResult:
     """Result of compliance assessment."""
+    __slots__ = (
+        'rule_id', 'standard', 'compliance_level', 'score',
+        'findings', 'recommendations', 'evidence', 'risk_assessment'
+    )
+    
     rule_id: str
     standard: str
     compliance_level: ComplianceLevel
@@ -44,13 +63,95 @@ class ComplianceResult:
     evidence: List[str]
     risk_assessment: RiskLevel
 
+# Report sections holding one entry per assessed item
+REPORT_LIST_SECTIONS = ("requirement_compliance", "test_case_compliance")
+# Number of distinct requirement texts whose assessment is kept for reuse
+REQUIREMENT_CACHE_SIZE = 4096
+
+# Rule pattern pieces: a whitespace run or a character class of letters
+PATTERN_TOKEN_RE = re.compile(r"(\\s\+|\[[a-z]+\])")
+
+def _pattern_phrases(pattern: str) -> List[str]:
+    """
+    Expand a rule pattern into the lowercase phrases it matches in
+    whitespace-normalized text: \\s+ becomes a single space and a character
+    class such as [abc] one phrase per letter. Anything else must be literal.
+    """
+    choices = []
+    for i, token in enumerate(PATTERN_TOKEN_RE.split(pattern)):
+        if i % 2:
+            choices.append([" "] if token == r"\s+" else list(token[1:-1]))
+        elif re.escape(token) != token:
+            raise ValueError(f"Unsupported compliance pattern: {pattern}")
+        else:
+            choices.append([token.lower()])
+    return ["".join(parts) for parts in itertools.product(*choices)]
+
+# Words any of which satisfies a validation criterion when present in an item's text
+CRITERIA_SIGNALS = {
+    "requires_traceability": ("traceability", "trace"),
+    "requires_verification": ("verify", "verification"),
+    "requires_validation": ("validate", "validation"),
+    "requires_risk_analysis": ("risk", "hazard"),
+    "requires_security_testing": ("security", "secure"),
+    "requires_documentation": ("document", "record"),
+}
+# Every word the rule evaluators look for in an item's text
+SIGNAL_WORDS = tuple(dict.fromkeys(word for words in CRITERIA_SIGNALS.values() for word in words))
+
+def _extract_signals(text: str) -> FrozenSet[str]:
+    """The SIGNAL_WORDS present in lowercase text, found once per item rather than per rule."""
+    return frozenset(word for word in SIGNAL_WORDS if word in text)
+
+def _build_automaton(rules: Dict[str, ComplianceRule], patterns_attr: str) -> ahocorasick.Automaton:
+    """
+    Aho-Corasick automaton over the phrases of one pattern list of every rule.
+    Each phrase maps to the (rule_id, pattern index) pairs it satisfies.
+    """
+    phrases = {}
+    for rule in rules.values():
+        for index, pattern in enumerate(getattr(rule, patterns_attr)):
+            for phrase in _pattern_phrases(pattern):
+                phrases.setdefault(phrase, set()).add((rule.rule_id, index))
+    automaton = ahocorasick.Automaton()
+    for phrase, targets in phrases.items():
+        automaton.add_word(phrase, tuple(targets))
+    automaton.make_automaton()
+    return automaton
+
+def _scan(automaton: ahocorasick.Automaton, text: str) -> Dict[str, Set[int]]:
+    """Indices of the patterns found in lowercase text, by rule_id, in one pass."""
+    hits = {}
+    for _, targets in automaton.iter(" ".join(text.split())):
+        for rule_id, index in targets:
+            hits.setdefault(rule_id, set()).add(index)
+    return hits
+
+# Default cap on report worker processes per engine. Each gunicorn worker has
+# its own engine, so this is multiplied by the number of web workers
+REPORT_MAX_WORKERS = int(os.environ.get('COMPLIANCE_REPORT_WORKERS', '2'))
+
 class ComplianceEngine:
     """
     Engine for validating compliance with healthcare regulatory standards.
     """
     
-    def __init__(self):
+    # Minimum number of items before report assessment is spread over worker processes
+    PARALLEL_THRESHOLD = 64
+    # Number of items assessed per step when building a report incrementally
+    REPORT_CHUNK_SIZE = 256
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or max(1, min(REPORT_MAX_WORKERS, os.cpu_count() or 1))
+        # Process pool for large reports, started by start_report_workers() or on first use
+        self._executor = None
+        self._executor_lock = threading.Lock()
         self.compliance_rules = self._initialize_compliance_rules()
+        # Per-engine cache of requirement assessments, keyed by (text, standards)
+        self._assess_requirement_text = lru_cache(maxsize=REQUIREMENT_CACHE_SIZE)(self._assess_requirement_uncached)
+        # Every rule's patterns are matched in a single pass over an item's text
+        self.requirement_automaton = _build_automaton(self.compliance_rules, "requirement_patterns")
+        self.test_case_automaton = _build_automaton(self.compliance_rules, "test_case_patterns")
         self.standards = [
             "FDA 21 CFR Part 820",
             "IEC 62304",
@@ -71,20 +172,20 @@ class ComplianceEngine:
             standard="FDA 21 CFR Part 820",
             title="Design Controls",
             description="Software development must follow design control procedures",
-            requirement_patterns=[
+            requirement_patterns=(
                 r"design\s+control",
                 r"design\s+input",
                 r"design\s+output",
                 r"design\s+review",
                 r"design\s+verification",
                 r"design\s+validation"
-            ],
-            test_case_patterns=[
+            ),
+            test_case_patterns=(
                 r"verify\s+design",
                 r"validate\s+design",
                 r"design\s+review",
                 r"traceability"
-            ],
+            ),
             mandatory=True,
             risk_level=RiskLevel.HIGH,
             validation_criteria={
@@ -99,18 +200,18 @@ class ComplianceEngine:
             standard="FDA 21 CFR Part 820",
             title="Risk Management",
             description="Risk analysis and management throughout development",
-            requirement_patterns=[
+            requirement_patterns=(
                 r"risk\s+analysis",
                 r"risk\s+management",
                 r"hazard\s+analysis",
                 r"failure\s+mode"
-            ],
-            test_case_patterns=[
+            ),
+            test_case_patterns=(
                 r"risk\s+test",
                 r"safety\s+test",
                 r"hazard\s+test",
                 r"failure\s+test"
-            ],
+            ),
             mandatory=True,
             risk_level=RiskLevel.HIGH,
             validation_criteria={
@@ -125,17 +226,17 @@ class ComplianceEngine:
             standard="IEC 62304",
             title="Software Safety Classification",
             description="Software must be classified according to safety requirements",
-            requirement_patterns=[
+            requirement_patterns=(
                 r"safety\s+class",
                 r"class\s+[abc]",
                 r"safety\s+classification",
                 r"medical\s+device\s+software"
-            ],
-            test_case_patterns=[
+            ),
+            test_case_patterns=(
                 r"safety\s+test",
                 r"class\s+[abc]\s+test",
                 r"safety\s+verification"
-            ],
+            ),
             mandatory=True,
             risk_level=RiskLevel.HIGH,
             validation_criteria={
@@ -149,18 +250,18 @@ class ComplianceEngine:
             standard="IEC 62304",
             title="Software Development Lifecycle",
             description="Structured software development process",
-            requirement_patterns=[
+            requirement_patterns=(
                 r"software\s+development\s+plan",
                 r"development\s+lifecycle",
                 r"software\s+architecture",
                 r"software\s+design"
-            ],
-            test_case_patterns=[
+            ),
+            test_case_patterns=(
                 r"integration\s+test",
                 r"system\s+test",
                 r"software\s+test",
                 r"unit\s+test"
-            ],
+            ),
             mandatory=True,
             risk_level=RiskLevel.MEDIUM,
             validation_criteria={
@@ -175,17 +276,17 @@ class ComplianceEngine:
             standard="ISO 13485",
             title="Quality Management System",
             description="Quality management system for medical devices",
-            requirement_patterns=[
+            requirement_patterns=(
                 r"quality\s+management",
                 r"qms",
                 r"quality\s+system",
                 r"quality\s+control"
-            ],
-            test_case_patterns=[
+            ),
+            test_case_patterns=(
                 r"quality\s+test",
                 r"qms\s+test",
                 r"quality\s+verification"
-            ],
+            ),
             mandatory=True,
             risk_level=RiskLevel.MEDIUM,
             validation_criteria={
@@ -200,21 +301,21 @@ class ComplianceEngine:
             standard="ISO 27001",
             title="Information Security Management",
             description="Information security controls and management",
-            requirement_patterns=[
+            requirement_patterns=(
                 r"information\s+security",
                 r"data\s+security",
                 r"security\s+control",
                 r"access\s+control",
                 r"encryption",
                 r"authentication"
-            ],
-            test_case_patterns=[
+            ),
+            test_case_patterns=(
                 r"security\s+test",
                 r"access\s+control\s+test",
                 r"authentication\s+test",
                 r"encryption\s+test",
                 r"penetration\s+test"
-            ],
+            ),
             mandatory=True,
             risk_level=RiskLevel.HIGH,
             validation_criteria={
@@ -229,20 +330,20 @@ class ComplianceEngine:
             standard="HIPAA",
             title="Protected Health Information",
             description="Protection of patient health information",
-            requirement_patterns=[
+            requirement_patterns=(
                 r"protected\s+health\s+information",
                 r"phi",
                 r"patient\s+data",
                 r"health\s+information",
                 r"privacy",
                 r"confidentiality"
-            ],
-            test_case_patterns=[
+            ),
+            test_case_patterns=(
                 r"privacy\s+test",
                 r"phi\s+test",
                 r"data\s+protection\s+test",
                 r"confidentiality\s+test"
-            ],
+            ),
             mandatory=True,
             risk_level=RiskLevel.HIGH,
             validation_criteria={
@@ -257,21 +358,21 @@ class ComplianceEngine:
             standard="GDPR",
             title="Data Protection and Privacy",
             description="General Data Protection Regulation compliance",
-            requirement_patterns=[
+            requirement_patterns=(
                 r"data\s+protection",
                 r"gdpr",
                 r"personal\s+data",
                 r"data\s+subject\s+rights",
                 r"consent",
                 r"data\s+processing"
-            ],
-            test_case_patterns=[
+            ),
+            test_case_patterns=(
                 r"gdpr\s+test",
                 r"data\s+protection\s+test",
                 r"consent\s+test",
                 r"data\s+subject\s+test",
                 r"privacy\s+test"
-            ],
+            ),
             mandatory=True,
             risk_level=RiskLevel.HIGH,
             validation_criteria={
@@ -282,39 +383,84 @@ class ComplianceEngine:
         
         return rules
     
-    def assess_requirement_compliance(self, requirement: Dict[str, Any]) -> List[ComplianceResult]:
+    def _rules_for_standards(self, standards: List[str] = None) -> List[ComplianceRule]:
+        """Get the compliance rules, optionally restricted to the given standards."""
+        if not standards:
+            return list(self.compliance_rules.values())
+        return [rule for rule in self.compliance_rules.values() if rule.standard in standards]
+    
+    def assess_requirement_compliance(self, requirement: Dict[str, Any], standards: List[str] = None) -> List[ComplianceResult]:
         """
         Assess compliance of a requirement against all applicable standards.
+        If standards is given, only rules for those standards are evaluated.
         """
-        results = []
         requirement_text = f"{requirement.get('title', '')} {requirement.get('description', '')}".lower()
+        cached = self._assess_requirement_text(requirement_text, tuple(standards) if standards else None)
+        # Hand out copies so callers never mutate the cached results
+        return [
+            replace(result, findings=list(result.findings), recommendations=list(result.recommendations),
+                    evidence=list(result.evidence))
+            for result in cached
+        ]
+    
+    def _assess_requirement_uncached(self, requirement_text: str, standards: Optional[Tuple[str, ...]]) -> Tuple[ComplianceResult, ...]:
+        """
+        Assess a requirement's lowercased title and description. The results
+        depend on nothing else, so __init__ wraps this in a per-engine cache
+        as _assess_requirement_text.
+        """
+        hits = _scan(self.requirement_automaton, requirement_text)
+        if not hits:
+            # Rules none of whose patterns occur in the text assess as UNKNOWN
+            return ()
+        signals = _extract_signals(requirement_text)
+        results = []
         
-        for rule in self.compliance_rules.values():
-            compliance_result = self._evaluate_requirement_against_rule(requirement_text, requirement, rule)
+        for rule in self._rules_for_standards(standards):
+            if rule.rule_id not in hits:
+                continue
+            compliance_result = self._evaluate_requirement_against_rule(signals, rule, hits[rule.rule_id])
             if compliance_result.compliance_level != ComplianceLevel.UNKNOWN:
                 results.append(compliance_result)
         
-        return results
+        return tuple(results)
     
-    def assess_test_case_compliance(self, test_case: Dict[str, Any], requirement: Dict[str, Any] = None) -> List[ComplianceResult]:
+    def assess_test_case_compliance(self, test_case: Dict[str, Any], requirement: Dict[str, Any] = None, standards: List[str] = None) -> List[ComplianceResult]:
         """
         Assess compliance of a test case against all applicable standards.
+        If standards is given, only rules for those standards are evaluated.
         """
         results = []
         test_case_text = f"{test_case.get('title', '')} {test_case.get('description', '')}".lower()
         test_steps_text = " ".join(test_case.get('test_steps', [])).lower()
         full_text = f"{test_case_text} {test_steps_text}"
+        hits = _scan(self.test_case_automaton, full_text)
+        requirement_hits = {}
+        if requirement:
+            requirement_text = f"{requirement.get('title', '')} {requirement.get('description', '')}".lower()
+            requirement_hits = _scan(self.requirement_automaton, requirement_text)
+        if not hits and not requirement_hits:
+            # Rules matched by neither text assess as UNKNOWN
+            return results
+        signals = _extract_signals(full_text)
+        completeness_score = self._assess_test_case_completeness(test_case)
         
-        for rule in self.compliance_rules.values():
-            compliance_result = self._evaluate_test_case_against_rule(full_text, test_case, rule, requirement)
+        for rule in self._rules_for_standards(standards):
+            if rule.rule_id not in hits and rule.rule_id not in requirement_hits:
+                continue
+            compliance_result = self._evaluate_test_case_against_rule(
+                signals, completeness_score, rule, hits.get(rule.rule_id, ()), rule.rule_id in requirement_hits
+            )
             if compliance_result.compliance_level != ComplianceLevel.UNKNOWN:
                 results.append(compliance_result)
         
         return results
     
-    def _evaluate_requirement_against_rule(self, requirement_text: str, requirement: Dict[str, Any], rule: ComplianceRule) -> ComplianceResult:
+    def _evaluate_requirement_against_rule(self, signals: FrozenSet[str], rule: ComplianceRule, matched: Set[int]) -> ComplianceResult:
         """
-        Evaluate a requirement against a specific compliance rule.
+        Evaluate a requirement against a specific compliance rule, given the
+        signal words in its text and the indices of the rule's requirement
+        patterns found there.
         """
         findings = []
         recommendations = []
@@ -322,11 +468,9 @@ class ComplianceEngine:
         score = 0.0
         
         # Check if requirement patterns match
-        pattern_matches = 0
-        for pattern in rule.requirement_patterns:
-            if re.search(pattern, requirement_text, re.IGNORECASE):
-                pattern_matches += 1
-                evidence.append(f"Found pattern: {pattern}")
+        pattern_matches = len(matched)
+        for index in sorted(matched):
+            evidence.append(f"Found pattern: {rule.requirement_patterns[index]}")
         
         if pattern_matches == 0:
             return ComplianceResult(
@@ -345,7 +489,7 @@ class ComplianceEngine:
         score += pattern_score * 0.6
         
         # Check validation criteria
-        criteria_score = self._check_validation_criteria(requirement, rule.validation_criteria)
+        criteria_score = self._check_validation_criteria(signals, rule.validation_criteria)
         score += criteria_score * 0.4
         
         # Determine compliance level
@@ -361,10 +505,10 @@ class ComplianceEngine:
             recommendations.append(f"Revise requirement to comply with {rule.standard}")
         
         # Add specific recommendations based on rule
-        if rule.validation_criteria.get("requires_traceability") and "traceability" not in requirement_text:
+        if rule.validation_criteria.get("requires_traceability") and "traceability" not in signals:
             recommendations.append("Add traceability requirements")
         
-        if rule.validation_criteria.get("requires_risk_analysis") and "risk" not in requirement_text:
+        if rule.validation_criteria.get("requires_risk_analysis") and "risk" not in signals:
             recommendations.append("Include risk analysis requirements")
         
         return ComplianceResult(
@@ -378,9 +522,12 @@ class ComplianceEngine:
             risk_assessment=rule.risk_level
         )
     
-    def _evaluate_test_case_against_rule(self, test_case_text: str, test_case: Dict[str, Any], rule: ComplianceRule, requirement: Dict[str, Any] = None) -> ComplianceResult:
+    def _evaluate_test_case_against_rule(self, signals: FrozenSet[str], completeness_score: float, rule: ComplianceRule, matched: Set[int], addresses_requirement: bool) -> ComplianceResult:
         """
-        Evaluate a test case against a specific compliance rule.
+        Evaluate a test case against a specific compliance rule, given the
+        signal words in its text, its completeness score, the indices of the
+        rule's test case patterns found in the text and whether the related
+        requirement matches any of the rule's requirement patterns.
         """
         findings = []
         recommendations = []
@@ -388,21 +535,11 @@ class ComplianceEngine:
         score = 0.0
         
         # Check if test case patterns match
-        pattern_matches = 0
-        for pattern in rule.test_case_patterns:
-            if re.search(pattern, test_case_text, re.IGNORECASE):
-                pattern_matches += 1
-                evidence.append(f"Found test pattern: {pattern}")
-        
-        # Also check if requirement patterns are addressed in test case
-        req_pattern_matches = 0
-        if requirement:
-            requirement_text = f"{requirement.get('title', '')} {requirement.get('description', '')}".lower()
-            for pattern in rule.requirement_patterns:
-                if re.search(pattern, requirement_text, re.IGNORECASE):
-                    req_pattern_matches += 1
+        pattern_matches = len(matched)
+        for index in sorted(matched):
+            evidence.append(f"Found test pattern: {rule.test_case_patterns[index]}")
         
-        if pattern_matches == 0 and req_pattern_matches == 0:
+        if pattern_matches == 0 and not addresses_requirement:
             return ComplianceResult(
                 rule_id=rule.rule_id,
                 standard=rule.standard,
@@ -423,12 +560,11 @@ class ComplianceEngine:
         score += pattern_score * 0.7
         
         # Check if test case covers requirement compliance aspects
-        if req_pattern_matches > 0:
+        if addresses_requirement:
             score += 0.3
             evidence.append("Test case addresses compliance-related requirements")
         
-        # Check test case completeness
-        completeness_score = self._assess_test_case_completeness(test_case)
+        # Factor in test case completeness
         score = (score + completeness_score) / 2
         
         # Determine compliance level
@@ -444,10 +580,10 @@ class ComplianceEngine:
             recommendations.append(f"Add test steps to verify {rule.standard} compliance")
         
         # Add specific recommendations
-        if rule.validation_criteria.get("requires_security_testing") and "security" not in test_case_text:
+        if rule.validation_criteria.get("requires_security_testing") and "security" not in signals:
             recommendations.append("Add security testing steps")
         
-        if rule.validation_criteria.get("requires_verification") and "verify" not in test_case_text:
+        if rule.validation_criteria.get("requires_verification") and "verify" not in signals:
             recommendations.append("Add verification steps")
         
         return ComplianceResult(
@@ -461,9 +597,10 @@ class ComplianceEngine:
             risk_assessment=rule.risk_level
         )
     
-    def _check_validation_criteria(self, item: Dict[str, Any], criteria: Dict[str, Any]) -> float:
+    def _check_validation_criteria(self, signals: FrozenSet[str], criteria: Dict[str, Any]) -> float:
         """
-        Check validation criteria against an item (requirement or test case).
+        Check validation criteria against the signal words of an item's text.
+        Criteria without an entry in CRITERIA_SIGNALS are never satisfied.
         """
         score = 0.0
         total_criteria = len(criteria)
@@ -471,31 +608,9 @@ class ComplianceEngine:
         if total_criteria == 0:
             return 1.0
         
-        item_text = f"{item.get('title', '')} {item.get('description', '')}".lower()
-        
         for criterion, required in criteria.items():
-            if not required:
-                continue
-                
-            if criterion == "requires_traceability":
-                if "traceability" in item_text or "trace" in item_text:
-                    score += 1.0
-            elif criterion == "requires_verification":
-                if "verify" in item_text or "verification" in item_text:
-                    score += 1.0
-            elif criterion == "requires_validation":
-                if "validate" in item_text or "validation" in item_text:
-                    score += 1.0
-            elif criterion == "requires_risk_analysis":
-                if "risk" in item_text or "hazard" in item_text:
-                    score += 1.0
-            elif criterion == "requires_security_testing":
-                if "security" in item_text or "secure" in item_text:
-                    score += 1.0
-            elif criterion == "requires_documentation":
-                if "document" in item_text or "record" in item_text:
-                    score += 1.0
-            # Add more criteria as needed
+            if required and not signals.isdisjoint(CRITERIA_SIGNALS.get(criterion, ())):
+                score += 1.0
         
         return score / total_criteria
     
@@ -504,105 +619,175 @@ class ComplianceEngine:
         Assess the completeness of a test case.
         """
         score = 0.0
+        get = test_case.get
         
-        # Check for required fields
-        if test_case.get('title'):
+        # Check for required fields (a non-empty step list is truthy)
+        if get('title'):
             score += 0.1
-        if test_case.get('description'):
+        if get('description'):
             score += 0.1
-        if test_case.get('preconditions'):
+        if get('preconditions'):
             score += 0.1
-        if test_case.get('test_steps') and len(test_case['test_steps']) > 0:
+        if get('test_steps'):
             score += 0.3
-        if test_case.get('expected_results'):
+        if get('expected_results'):
             score += 0.2
-        if test_case.get('postconditions'):
+        if get('postconditions'):
             score += 0.1
-        if test_case.get('priority'):
+        if get('priority'):
             score += 0.1
         
         return score
     
-    def generate_compliance_report(self, requirements: List[Dict[str, Any]], test_cases: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate_compliance_report(self, requirements: List[Dict[str, Any]], test_cases: List[Dict[str, Any]], standards: List[str] = None) -> Dict[str, Any]:
         """
         Generate a comprehensive compliance report.
+        If standards is given, only those standards are assessed and items
+        without any result for them are left out of the report.
+        """
+        report = {}
+        for section, value in self.iter_compliance_report(requirements, test_cases, standards):
+            report[section] = list(value) if section in REPORT_LIST_SECTIONS else value
+        
+        return report
+    
+    def iter_compliance_report(self, requirements: List[Dict[str, Any]], test_cases: List[Dict[str, Any]], standards: List[str] = None) -> Iterator[Tuple[str, Any]]:
         """
-        report = {
-            "generated_at": datetime.now().isoformat(),
-            "summary": {
-                "total_requirements": len(requirements),
-                "total_test_cases": len(test_cases),
-                "standards_assessed": self.standards
-            },
-            "requirement_compliance": [],
-            "test_case_compliance": [],
-            "overall_compliance": {},
-            "recommendations": []
+        Generate the compliance report section by section, in report order.
+        
+        Yields (section, value) pairs. For the sections in REPORT_LIST_SECTIONS
+        the value is an iterator over the entries, assessed lazily; it must be
+        fully consumed before advancing to the next section.
+        """
+        yield "generated_at", datetime.now().isoformat()
+        yield "summary", {
+            "total_requirements": len(requirements),
+            "total_test_cases": len(test_cases),
+            "standards_assessed": self.standards
         }
         
-        # Assess requirements
-        all_req_results = []
-        for req in requirements:
-            req_results = self.assess_requirement_compliance(req)
-            all_req_results.extend(req_results)
-            report["requirement_compliance"].append({
-                "requirement_id": req.get('requirement_id', 'Unknown'),
-                "compliance_results": [self._compliance_result_to_dict(r) for r in req_results]
-            })
+        # Requirements by id, the first one winning when ids repeat
+        requirements_by_id = {r.get('id'): r for r in reversed(requirements) if r.get('id') is not None}
         
-        # Assess test cases
-        all_tc_results = []
-        for tc in test_cases:
-            # Find related requirement
-            related_req = None
+        def related_requirement(tc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             req_id = tc.get('requirement_id')
-            if req_id:
-                related_req = next((r for r in requirements if r.get('id') == req_id), None)
-            
-            tc_results = self.assess_test_case_compliance(tc, related_req)
-            all_tc_results.extend(tc_results)
-            report["test_case_compliance"].append({
-                "test_case_id": tc.get('test_case_id', 'Unknown'),
-                "compliance_results": [self._compliance_result_to_dict(r) for r in tc_results]
-            })
+            return requirements_by_id.get(req_id) if req_id else None
+        
+        all_req_results = []
+        all_tc_results = []
+        
+        def requirement_entries():
+            assessed = self._iter_assessed(
+                "assess_requirement_compliance", [(req,) for req in requirements], standards
+            )
+            for (req,), req_results in assessed:
+                if standards and not req_results:
+                    continue
+                all_req_results.extend(req_results)
+                yield {
+                    "requirement_id": req.get('requirement_id', 'Unknown'),
+                    "compliance_results": [self._compliance_result_to_dict(r) for r in req_results]
+                }
+        
+        def test_case_entries():
+            assessed = self._iter_assessed(
+                "assess_test_case_compliance", [(tc, related_requirement(tc)) for tc in test_cases], standards
+            )
+            for (tc, _), tc_results in assessed:
+                if standards and not tc_results:
+                    continue
+                all_tc_results.extend(tc_results)
+                yield {
+                    "test_case_id": tc.get('test_case_id', 'Unknown'),
+                    "compliance_results": [self._compliance_result_to_dict(r) for r in tc_results]
+                }
+        
+        yield "requirement_compliance", requirement_entries()
+        yield "test_case_compliance", test_case_entries()
         
         # Calculate overall compliance
-        report["overall_compliance"] = self._calculate_overall_compliance(all_req_results, all_tc_results)
+        yield "overall_compliance", self._calculate_overall_compliance(all_req_results, all_tc_results)
         
         # Generate recommendations
-        report["recommendations"] = self._generate_overall_recommendations(all_req_results, all_tc_results)
-        
-        return report
+        yield "recommendations", self._generate_overall_recommendations(all_req_results, all_tc_results)
+    
+    def _iter_assessed(self, method: str, tasks: List[tuple], standards: List[str] = None) -> Iterator[Tuple[tuple, List[ComplianceResult]]]:
+        """Yield (args, results) pairs, assessing REPORT_CHUNK_SIZE tasks at a time."""
+        for start in range(0, len(tasks), self.REPORT_CHUNK_SIZE):
+            chunk = tasks[start:start + self.REPORT_CHUNK_SIZE]
+            yield from zip(chunk, self._map_items(method, chunk, standards))
+    
+    def _map_items(self, method: str, tasks: List[tuple], standards: List[str] = None) -> List[List[ComplianceResult]]:
+        """
+        Call the named assess_* method with each task's positional arguments,
+        preserving order. Batches of PARALLEL_THRESHOLD tasks or more are split
+        evenly over the worker processes.
+        """
+        if self.max_workers == 1 or len(tasks) < self.PARALLEL_THRESHOLD:
+            assess = getattr(self, method)
+            return [assess(*args, standards=standards) for args in tasks]
+        
+        size = -(-len(tasks) // self.max_workers)
+        batches = [tasks[start:start + size] for start in range(0, len(tasks), size)]
+        results = self._report_executor().map(
+            _assess_in_worker, itertools.repeat(method), batches, itertools.repeat(standards)
+        )
+        return [item_results for batch_results in results for item_results in batch_results]
+    
+    def _report_executor(self) -> ProcessPoolExecutor:
+        """The engine's worker process pool, started on first use and kept for later reports."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=WORKER_CONTEXT, initializer=_init_report_worker
+                )
+            return self._executor
+    
+    def start_report_workers(self):
+        """
+        Start the report worker processes ahead of the first large report, so
+        no request pays for starting them. Does nothing for a single worker, or
+        in a worker process, which re-imports the app's main module.
+        """
+        if self.max_workers == 1 or multiprocessing.parent_process() is not None:
+            return
+        executor = self._report_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_report_worker_ready)
     
     def _compliance_result_to_dict(self, result: ComplianceResult) -> Dict[str, Any]:
         """Convert ComplianceResult to dictionary."""
         return {
             "rule_id": result.rule_id,
             "standard": result.standard,
-            "compliance_level": result.compliance_level.value,
+            "compliance_level": result.compliance_level,
             "score": result.score,
             "findings": result.findings,
             "recommendations": result.recommendations,
             "evidence": result.evidence,
-            "risk_assessment": result.risk_assessment.value
+            "risk_assessment": result.risk_assessment
         }
     
     def _calculate_overall_compliance(self, req_results: List[ComplianceResult], tc_results: List[ComplianceResult]) -> Dict[str, Any]:
         """Calculate overall compliance metrics."""
         overall = {}
         
-        # Group by standard
+        # Group scores by standard in a single pass over each result list
+        req_scores_by_standard = defaultdict(list)
+        for r in req_results:
+            req_scores_by_standard[r.standard].append(r.score)
+        tc_scores_by_standard = defaultdict(list)
+        for r in tc_results:
+            tc_scores_by_standard[r.standard].append(r.score)
+        
         for standard in self.standards:
-            standard_req_results = [r for r in req_results if r.standard == standard]
-            standard_tc_results = [r for r in tc_results if r.standard == standard]
+            req_scores = req_scores_by_standard.get(standard, [])
+            tc_scores = tc_scores_by_standard.get(standard, [])
             
-            if not standard_req_results and not standard_tc_results:
+            if not req_scores and not tc_scores:
                 continue
             
             # Calculate average scores
-            req_scores = [r.score for r in standard_req_results]
-            tc_scores = [r.score for r in standard_tc_results]
-            
             avg_req_score = sum(req_scores) / len(req_scores) if req_scores else 0
             avg_tc_score = sum(tc_scores) / len(tc_scores) if tc_scores else 0
             
@@ -618,34 +803,22 @@ class ComplianceEngine:
             
             overall[standard] = {
                 "score": overall_score,
-                "compliance_level": compliance_level.value,
-                "requirement_count": len(standard_req_results),
-                "test_case_count": len(standard_tc_results)
+                "compliance_level": compliance_level,
+                "requirement_count": len(req_scores),
+                "test_case_count": len(tc_scores)
             }
         
         return overall
     
     def _generate_overall_recommendations(self, req_results: List[ComplianceResult], tc_results: List[ComplianceResult]) -> List[str]:
         """Generate overall recommendations based on compliance results."""
-        recommendations = []
-        
-        # Collect all recommendations
-        all_recommendations = []
-        for result in req_results + tc_results:
-            all_recommendations.extend(result.recommendations)
-        
-        # Count frequency and prioritize
-        recommendation_counts = {}
-        for rec in all_recommendations:
-            recommendation_counts[rec] = recommendation_counts.get(rec, 0) + 1
-        
-        # Sort by frequency and take top recommendations
-        sorted_recommendations = sorted(recommendation_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        for rec, count in sorted_recommendations[:10]:  # Top 10 recommendations
-            recommendations.append(f"{rec} (mentioned {count} times)")
+        # Count frequency across all results
+        recommendation_counts = Counter(
+            rec for result in itertools.chain(req_results, tc_results) for rec in result.recommendations
+        )
         
-        return recommendations
+        # Top 10 recommendations by frequency (ties keep first-seen order)
+        return [f"{rec} (mentioned {count} times)" for rec, count in recommendation_counts.most_common(10)]
     
     def get_compliance_standards(self) -> List[Dict[str, Any]]:
         """Get information about supported compliance standards."""
@@ -662,3 +835,17 @@ class ComplianceEngine:
         
         return standards_info
 
+# Engine of a report worker process, built once by _init_report_worker
+_worker_engine = None
+
+def _init_report_worker():
+    global _worker_engine
+    _worker_engine = ComplianceEngine(max_workers=1)
+
+def _report_worker_ready():
+    """No-op task that makes the pool start a worker (and run its initializer)."""
+
+def _assess_in_worker(method: str, tasks: List[tuple], standards: Optional[List[str]]) -> List[List[ComplianceResult]]:
+    """Run one of the engine's assess_* methods over a batch of tasks in a report worker."""
+    assess = getattr(_worker_engine, method)
+    return [assess(*args, standards=standards) for args in tasks]
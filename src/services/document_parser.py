@@ -1,25 +1,398 @@
+import asyncio
+import copy
+import hashlib
+import importlib
+import io
+import itertools
+import mmap
 import os
 import tempfile
+import threading
 import zipfile
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import BinaryIO, Callable, Dict, Hashable, Iterable, List, Any, Literal, Optional, Tuple, Union
 import xml.etree.ElementTree as ET
 from pathlib import Path
 import re
+from src.services.worker_processes import WORKER_CONTEXT
 
-try:
-    import PyPDF2
-except ImportError:
-    PyPDF2 = None
+@lru_cache(maxsize=None)
+def _optional_module(name: str):
+    """
+    Import a parsing library on first use, or None when it is not installed.
+    PyMuPDF, PyPDF2, lxml and NumPy take hundreds of milliseconds to import
+    between them, which only the formats that need them should pay.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+# Bytes copied per read when spooling an uploaded stream to disk
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Common requirement section patterns, tried in order by extract_requirements_sections
+REQUIREMENT_SECTION_PATTERNS = [
+    re.compile(pattern, re.DOTALL | re.MULTILINE) for pattern in (
+        r'(?i)(?:^|\n)(\d+\.?\d*\.?\d*)\s+(.*?)(?=\n\d+\.|\n[A-Z][A-Z\s]+:|\Z)',
+        r'(?i)(?:^|\n)(REQ-?\d+)\s+(.*?)(?=\nREQ-?\d+|\n[A-Z][A-Z\s]+:|\Z)',
+        r'(?i)(?:^|\n)([A-Z]{2,}-\d+)\s+(.*?)(?=\n[A-Z]{2,}-\d+|\n[A-Z][A-Z\s]+:|\Z)',
+        r'(?i)(?:^|\n)(requirement\s+\d+)\s*:?\s*(.*?)(?=\nrequirement\s+\d+|\n[A-Z][A-Z\s]+:|\Z)'
+    )
+]
+
+# Characters of text kept per extracted requirement section
+SECTION_TEXT_LIMIT = 1000
+
+# First non-whitespace character, to locate section text without slicing it
+NON_SPACE_RE = re.compile(r'\S')
+
+def _clip_section_text(content: str, start: int, end: int) -> str:
+    """
+    content[start:end].strip()[:SECTION_TEXT_LIMIT], copying at most
+    SECTION_TEXT_LIMIT characters however long the matched section is.
+    """
+    first = NON_SPACE_RE.search(content, start, end)
+    if first is None:
+        return ''
+    start = first.start()
+    stop = min(end, start + SECTION_TEXT_LIMIT)
+    text = content[start:stop]
+    # Trailing whitespace is only dropped when nothing else follows it in the section
+    if stop == end or NON_SPACE_RE.search(content, stop, end) is None:
+        text = text.rstrip()
+    return text
+
+# Distinct filenames whose extension is remembered by _file_extension
+EXTENSION_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=EXTENSION_CACHE_SIZE)
+def _file_extension(filename: str) -> str:
+    return Path(filename).suffix.lower()
+
+# Byte translation marking the ASCII characters str.split() separates words on with 1
+ASCII_WHITESPACE = bytes(byte < 128 and chr(byte).isspace() for byte in range(256))
+
+def _count_words(content: str) -> int:
+    """
+    len(content.split()) without building the list of words. ASCII text is
+    counted with NumPy as the number of whitespace to non-whitespace steps.
+    """
+    np = _optional_module('numpy')
+    if np is None or not content.isascii():
+        return len(content.split())
+    if not content:
+        return 0
+    space = np.frombuffer(content.encode('ascii').translate(ASCII_WHITESPACE), dtype=bool)
+    return int(np.count_nonzero(space[:-1] > space[1:])) + (not space[0])
+
+def _markdown_headers(content: str) -> List[Dict[str, Any]]:
+    """
+    ATX headers: a line of up to six '#', whitespace, then the text. str.find
+    jumps straight from one line starting with '#' to the next, so no other
+    line is sliced or looked at.
+    """
+    headers = []
+    line_start = 0 if content.startswith('#') else None
+    search_from = 0
+    while True:
+        if line_start is None:
+            found = content.find('\n#', search_from)
+            if found == -1:
+                return headers
+            line_start = found + 1
+        line_end = content.find('\n', line_start)
+        if line_end == -1:
+            line_end = len(content)
+        line = content[line_start:line_end]
+        level = len(line) - len(line.lstrip('#'))
+        text = line[level:]
+        if level <= 6 and text[:1].isspace() and text.strip():
+            headers.append({'level': level, 'text': text.lstrip()})
+        search_from, line_start = line_end, None
+
+# A document to parse: a file path or a seekable binary stream
+Source = Union[str, BinaryIO]
+
+# 'full' parses content and metadata; 'text' only needs the text, which lets
+# PDFs skip page dividers and metadata
+ParseMode = Literal['full', 'text']
+
+# Documents aparse_many() parses at once, each in a worker thread
+PARSE_MAX_CONCURRENCY = int(os.environ.get('PARSE_MAX_CONCURRENCY', str(2 * (os.cpu_count() or 1))))
+
+# Parse results a DocumentParser keeps, keyed by content digest or file identity
+PARSE_CACHE_SIZE = 128
+
+def _stream_digest(stream: BinaryIO) -> str:
+    """SHA-256 of the rest of a seekable stream, leaving its position unchanged."""
+    start = stream.tell()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(STREAM_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    stream.seek(start)
+    return digest.hexdigest()
+
+def _read_text(source: Source) -> str:
+    """
+    Read a UTF-8 text document, translating newlines as open() does.
+    Files are memory-mapped and decoded straight from the page cache, so the
+    raw bytes are never copied into a separate buffer first.
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return ''
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, 'utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    wrapper = io.TextIOWrapper(source, encoding='utf-8')
+    try:
+        return wrapper.read()
+    finally:
+        # Leave the caller's stream open
+        wrapper.detach()
+
+def _is_seekable(stream: BinaryIO) -> bool:
+    seekable = getattr(stream, 'seekable', None)
+    return bool(seekable and seekable())
+
+# PDFs with at least twice this many pages are split into page ranges of at
+# least this size, extracted by worker processes
+PDF_PARALLEL_MIN_PAGES = 256
+# Worker processes in the pool shared by all PDF parses of this process. Each
+# gunicorn worker has its own pool, so this is multiplied by their number
+PDF_MAX_WORKERS = int(os.environ.get('PDF_PARSE_WORKERS', '2'))
+
+_pdf_executor = None
+_pdf_executor_lock = threading.Lock()
+
+def _pdf_pool() -> ProcessPoolExecutor:
+    """The PDF worker pool, started on first use and kept for later parses."""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is None:
+            _pdf_executor = ProcessPoolExecutor(max_workers=PDF_MAX_WORKERS, mp_context=WORKER_CONTEXT)
+        return _pdf_executor
+
+def _open_pdf(document: Union[str, bytes]):
+    """Open a PDF with PyMuPDF from a path or from its bytes."""
+    pymupdf = _optional_module('pymupdf')
+    if isinstance(document, str):
+        return pymupdf.open(document)
+    return pymupdf.open(stream=document, filetype="pdf")
 
-try:
-    from docx import Document
-except ImportError:
-    Document = None
+# Pages whose stored content streams reach this many bytes are checked for
+# text operators before running the text extractor over them
+PDF_TEXT_PROBE_MIN_BYTES = 1024 * 1024
 
-try:
-    import markdown
-except ImportError:
-    markdown = None
+# Content stream operators that can put text on a page: text objects, and
+# pattern fills, whose tiles may draw text
+PDF_TEXT_OPERATORS = (b'BT', b'scn', b'SCN')
+
+def _pdf_page_is_textless(doc, page) -> bool:
+    """
+    True when a page with large content streams can be shown to draw no text:
+    no text operators, no form XObjects, annotations or widgets. Scanning the
+    decompressed operators is much cheaper than interpreting them.
+    """
+    size = 0
+    for xref in page.get_contents():
+        kind, value = doc.xref_get_key(xref, 'Length')
+        size += int(value) if kind == 'int' else PDF_TEXT_PROBE_MIN_BYTES
+    if size < PDF_TEXT_PROBE_MIN_BYTES:
+        return False
+    if page.first_annot is not None or page.first_widget is not None or page.get_xobjects():
+        return False
+    contents = page.read_contents()
+    return not any(operator in contents for operator in PDF_TEXT_OPERATORS)
+
+def _pdf_page_entry(doc, page_num: int) -> str:
+    """The divider and text of one page, or the divider and the extraction error."""
+    try:
+        page = doc[page_num]
+        page_text = '' if _pdf_page_is_textless(doc, page) else page.get_text("text")
+        return f"\\n--- Page {page_num + 1} ---\\n{page_text}\\n"
+    except Exception as e:
+        return f"\\n--- Page {page_num + 1} (Error: {str(e)}) ---\\n"
+
+def _pdf_page_entries(document: Union[str, bytes], start: int, stop: int) -> List[str]:
+    """Page entries for pages [start, stop) of a PDF; runs in a worker process."""
+    with _open_pdf(document) as doc:
+        return [_pdf_page_entry(doc, page_num) for page_num in range(start, stop)]
+
+# WordprocessingML, package relationship and core property namespaces
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+CORE_NS = {
+    'cp': 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'dcterms': 'http://purl.org/dc/terms/',
+}
+
+W_BODY, W_P, W_R, W_HYPERLINK = W_NS + 'body', W_NS + 'p', W_NS + 'r', W_NS + 'hyperlink'
+W_TBL, W_TR, W_TC, W_T, W_BR = W_NS + 'tbl', W_NS + 'tr', W_NS + 'tc', W_NS + 't', W_NS + 'br'
+W_VAL, W_TYPE = W_NS + 'val', W_NS + 'type'
+
+# Text of the run children that stand for a single character, as python-docx renders them
+RUN_CHARACTERS = {
+    W_NS + 'tab': '\t',
+    W_NS + 'ptab': '\t',
+    W_NS + 'cr': '\n',
+    W_NS + 'noBreakHyphen': '-',
+}
+
+# W3CDTF layouts accepted for created/modified dates, applied to the first 19 characters
+W3CDTF_FORMATS = ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%d', '%Y-%m', '%Y')
+
+W3CDTF_OFFSET_RE = re.compile(r'([+-])(\d\d):(\d\d)')
+
+def _docx_run_text(run) -> str:
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == W_T:
+            parts.append(child.text or '')
+        elif tag == W_BR:
+            if child.get(W_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag in RUN_CHARACTERS:
+            parts.append(RUN_CHARACTERS[tag])
+    return ''.join(parts)
+
+def _docx_paragraph_text(paragraph) -> str:
+    """Text of the runs directly in a paragraph or in its hyperlinks."""
+    parts = []
+    for child in paragraph:
+        if child.tag == W_R:
+            parts.append(_docx_run_text(child))
+        elif child.tag == W_HYPERLINK:
+            parts.extend(_docx_run_text(run) for run in child if run.tag == W_R)
+    return ''.join(parts)
+
+def _docx_int_property(properties, name: str, default: int) -> int:
+    element = None if properties is None else properties.find(W_NS + name)
+    return default if element is None else int(element.get(W_VAL))
+
+def _docx_row_cells(row, cells_above: Dict[int, tuple]) -> Dict[int, tuple]:
+    """
+    Cell texts of a table row keyed by grid offset. Like python-docx, a cell
+    spanning several grid columns repeats its text once per column, and a
+    vertically merged continuation repeats the cell above it.
+    """
+    cells = {}
+    offset = _docx_int_property(row.find(W_NS + 'trPr'), 'gridBefore', 0)
+    for cell in row.iterchildren(W_TC):
+        properties = cell.find(W_NS + 'tcPr')
+        span = _docx_int_property(properties, 'gridSpan', 1)
+        merge = None if properties is None else properties.find(W_NS + 'vMerge')
+        if merge is not None and merge.get(W_VAL, 'continue') == 'continue' and offset in cells_above:
+            texts = cells_above[offset]
+        else:
+            text = "\n".join(_docx_paragraph_text(p) for p in cell.iterchildren(W_P))
+            texts = (text,) * span
+        cells[offset] = texts
+        offset += span
+    return cells
+
+def _w3cdtf_to_string(value: Optional[str]) -> str:
+    """str() of a core property date as python-docx parses it, '' if it does not parse."""
+    if not value:
+        return ''
+    for layout in W3CDTF_FORMATS:
+        try:
+            parsed = datetime.strptime(value[:19], layout)
+            break
+        except ValueError:
+            continue
+    else:
+        return ''
+    offset = value[19:]
+    if len(offset) == 6:
+        match = W3CDTF_OFFSET_RE.match(offset)
+        if match is None:
+            return ''
+        sign, hours, minutes = match.groups()
+        delta = timedelta(hours=int(hours), minutes=int(minutes))
+        parsed = parsed - delta if sign == '+' else parsed + delta
+    return str(parsed.replace(tzinfo=timezone.utc))
+
+def _docx_part_paths(package: zipfile.ZipFile) -> Dict[str, str]:
+    """Paths of the main document and core properties parts, keyed by relationship type."""
+    paths = {}
+    relationships = _optional_module('lxml.etree').fromstring(package.read('_rels/.rels'))
+    for relationship in relationships.iterchildren(REL_NS + 'Relationship'):
+        kind = relationship.get('Type', '').rsplit('/', 1)[-1]
+        paths.setdefault(kind, relationship.get('Target', '').lstrip('/'))
+    return paths
+
+def _docx_core_properties(package: zipfile.ZipFile, path: Optional[str]) -> Dict[str, str]:
+    if path is None or path not in package.NameToInfo:
+        core = None
+    else:
+        core = _optional_module('lxml.etree').fromstring(package.read(path))
+
+    def text(name: str) -> str:
+        element = None if core is None else core.find(name, CORE_NS)
+        return '' if element is None or element.text is None else element.text
+
+    return {
+        'title': text('dc:title'),
+        'author': text('dc:creator'),
+        'subject': text('dc:subject'),
+        'created': _w3cdtf_to_string(text('dcterms:created')),
+        'modified': _w3cdtf_to_string(text('dcterms:modified')),
+    }
+
+def _stream_docx(source: Source) -> Tuple[str, Dict[str, Any]]:
+    """
+    Text and metadata of a .docx, read with iterparse straight from
+    word/document.xml. Each top-level paragraph and table row is cleared
+    once its text is taken, so memory stays flat however long the document.
+    """
+    paragraphs = []
+    tables = []
+    paragraph_count = table_count = 0
+    with zipfile.ZipFile(source) as package:
+        paths = _docx_part_paths(package)
+        with package.open(paths['officeDocument']) as document:
+            table = None
+            cells_above = {}
+            elements = _optional_module('lxml.etree').iterparse(
+                document, events=('end',), tag=(W_P, W_TR, W_TBL), remove_blank_text=True, resolve_entities=False
+            )
+            for _, element in elements:
+                parent = element.getparent()
+                if element.tag == W_TR:
+                    if parent.tag != W_TBL or parent.getparent().tag != W_BODY:
+                        continue
+                    if parent is not table:
+                        table, cells_above = parent, {}
+                        tables.append("\\n--- Table ---\\n")
+                    cells_above = _docx_row_cells(element, cells_above)
+                    tables.append(" | ".join(itertools.chain.from_iterable(cells_above.values())) + "\\n")
+                elif parent.tag != W_BODY:
+                    continue
+                elif element.tag == W_P:
+                    paragraph_count += 1
+                    paragraphs.append(_docx_paragraph_text(element) + "\\n")
+                else:
+                    table_count += 1
+                    if element is not table:
+                        tables.append("\\n--- Table ---\\n")
+                    table = None
+                    tables.append("--- End Table ---\\n")
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+        metadata = _docx_core_properties(package, paths.get('core-properties'))
+    metadata['paragraphs'] = paragraph_count
+    metadata['tables'] = table_count
+    return "".join(paragraphs) + "".join(tables), metadata
 
 class DocumentParser:
     """
@@ -29,137 +402,259 @@ class DocumentParser:
     
     def __init__(self):
         self.supported_formats = ['.pdf', '.docx', '.doc', '.xml', '.md', '.txt']
+        self._supported_set = frozenset(self.supported_formats)
+        # Successful parse results, least recently used first
+        self._parse_cache = {}
+        self._parse_cache_lock = threading.Lock()
     
-    def parse_document(self, file_path: str, file_content: bytes = None) -> Dict[str, Any]:
+    def parse_document(self, file_path: str, file_content: bytes = None, mode: ParseMode = 'full') -> Dict[str, Any]:
         """
         Parse a document and extract structured content.
         
         Args:
             file_path: Path to the document file
             file_content: Raw file content (optional, for uploaded files)
+            mode: 'text' when only the content is needed; PDFs then come back
+                as the page texts joined by newlines, with empty metadata
         
         Returns:
             Dictionary containing extracted content and metadata
         """
         if file_content:
             # Handle uploaded file content
-            return self._parse_from_content(file_path, file_content)
+            return self._parse_from_content(file_path, file_content, mode)
         else:
             # Handle file path
-            return self._parse_from_path(file_path)
+            return self._parse_from_path(file_path, mode)
+    
+    async def aparse_document(self, file_path: str, file_content: bytes = None, mode: ParseMode = 'full') -> Dict[str, Any]:
+        """Async variant of parse_document(); the parse runs in a worker thread."""
+        return await asyncio.to_thread(self.parse_document, file_path, file_content, mode)
+    
+    async def aparse_many(self, file_paths: Iterable[str], mode: ParseMode = 'full') -> List[Dict[str, Any]]:
+        """
+        Parse many documents concurrently, at most PARSE_MAX_CONCURRENCY at a
+        time, so reading one file overlaps with parsing others. Results are in
+        the order of file_paths.
+        """
+        semaphore = asyncio.Semaphore(PARSE_MAX_CONCURRENCY)
+        
+        async def parse(file_path: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aparse_document(file_path, mode=mode)
+        
+        return list(await asyncio.gather(*[parse(file_path) for file_path in file_paths]))
     
-    def _parse_from_path(self, file_path: str) -> Dict[str, Any]:
+    def _parse_from_path(self, file_path: str, mode: ParseMode = 'full') -> Dict[str, Any]:
         """Parse document from file path."""
         if not os.path.exists(file_path):
             return {"error": "File not found", "content": "", "metadata": {}}
         
         file_extension = Path(file_path).suffix.lower()
+        # A file is reparsed once it is modified, without hashing its contents
+        stat = os.stat(file_path)
+        key = (mode, file_extension, os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        return self._cached_parse(key, lambda: self._parse_source(file_extension, file_path, mode))
+    
+    def _cached_parse(self, key: Hashable, parse: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the cached result for key, or run parse() and cache its result
+        unless it is an error. Callers get their own copy of the result.
+        """
+        with self._parse_cache_lock:
+            result = self._parse_cache.pop(key, None)
+            if result is not None:
+                self._parse_cache[key] = result
+        
+        if result is None:
+            result = parse()
+            if 'error' in result:
+                return result
+            with self._parse_cache_lock:
+                self._parse_cache[key] = result
+                if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                    del self._parse_cache[next(iter(self._parse_cache))]
         
+        return copy.deepcopy(result)
+    
+    def _parse_source(self, file_extension: str, source: Source, mode: ParseMode = 'full') -> Dict[str, Any]:
+        """Parse a document given as a path or seekable stream, by file extension."""
         try:
             if file_extension == '.pdf':
-                return self._parse_pdf(file_path)
+                return self._parse_pdf_text(source) if mode == 'text' else self._parse_pdf(source)
             elif file_extension in ['.docx', '.doc']:
-                return self._parse_word(file_path)
+                return self._parse_word(source)
             elif file_extension == '.xml':
-                return self._parse_xml(file_path)
+                return self._parse_xml(source)
             elif file_extension == '.md':
-                return self._parse_markdown(file_path)
+                return self._parse_markdown(source)
             elif file_extension == '.txt':
-                return self._parse_text(file_path)
+                return self._parse_text(source)
             else:
                 return {"error": f"Unsupported file format: {file_extension}", "content": "", "metadata": {}}
         except Exception as e:
             return {"error": f"Error parsing file: {str(e)}", "content": "", "metadata": {}}
     
-    def _parse_from_content(self, filename: str, content: bytes) -> Dict[str, Any]:
+    def _parse_from_content(self, filename: str, content: bytes, mode: ParseMode = 'full') -> Dict[str, Any]:
         """Parse document from raw content."""
         file_extension = Path(filename).suffix.lower()
+        key = (mode, file_extension, hashlib.sha256(content).hexdigest())
+        return self._cached_parse(key, lambda: self._parse_source(file_extension, io.BytesIO(content), mode))
+    
+    def parse_stream(self, filename: str, stream: BinaryIO, mode: ParseMode = 'full') -> Dict[str, Any]:
+        """
+        Parse a document from a binary file-like object (e.g. an uploaded file).
+        
+        Seekable streams (in-memory buffers, and uploads the server already
+        spooled) are parsed in place. Other streams are first copied to a
+        temporary file in fixed-size chunks, so the upload is never held in
+        memory as a whole.
+        
+        Results are cached on the SHA-256 of the document, so uploading the
+        same document again does not parse it again. mode is as for
+        parse_document().
+        """
+        file_extension = Path(filename).suffix.lower()
+        if _is_seekable(stream):
+            key = (mode, file_extension, _stream_digest(stream))
+            return self._cached_parse(key, lambda: self._parse_source(file_extension, stream, mode))
         
+        temp_path = None
         try:
-            # Create temporary file
+            # Create temporary file, hashing the upload as it is copied
+            digest = hashlib.sha256()
             with tempfile.NamedTemporaryFile(suffix=file_extension, delete=False) as temp_file:
-                temp_file.write(content)
                 temp_path = temp_file.name
+                for chunk in iter(lambda: stream.read(STREAM_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    temp_file.write(chunk)
             
             # Parse the temporary file
-            result = self._parse_from_path(temp_path)
-            
-            # Clean up
-            os.unlink(temp_path)
-            
-            return result
+            key = (mode, file_extension, digest.hexdigest())
+            return self._cached_parse(key, lambda: self._parse_source(file_extension, temp_path, mode))
         except Exception as e:
             return {"error": f"Error processing uploaded file: {str(e)}", "content": "", "metadata": {}}
+        finally:
+            # Clean up
+            if temp_path:
+                os.unlink(temp_path)
     
-    def _parse_pdf(self, file_path: str) -> Dict[str, Any]:
-        """Parse PDF document."""
+    def _parse_pdf(self, source: Source) -> Dict[str, Any]:
+        """Parse PDF document, with PyMuPDF when installed and PyPDF2 otherwise."""
+        if _optional_module('pymupdf') is not None:
+            return self._parse_pdf_pymupdf(source)
+        PyPDF2 = _optional_module('PyPDF2')
         if PyPDF2 is None:
-            return {"error": "PyPDF2 not available for PDF parsing", "content": "", "metadata": {}}
+            return {"error": "PyMuPDF or PyPDF2 not available for PDF parsing", "content": "", "metadata": {}}
         
         try:
-            content = ""
+            parts = []
             metadata = {}
             
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                # Extract metadata
-                if pdf_reader.metadata:
-                    metadata = {
-                        'title': pdf_reader.metadata.get('/Title', ''),
-                        'author': pdf_reader.metadata.get('/Author', ''),
-                        'subject': pdf_reader.metadata.get('/Subject', ''),
-                        'creator': pdf_reader.metadata.get('/Creator', ''),
-                        'pages': len(pdf_reader.pages)
-                    }
-                
-                # Extract text from all pages
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        content += f"\\n--- Page {page_num + 1} ---\\n{page_text}\\n"
-                    except Exception as e:
-                        content += f"\\n--- Page {page_num + 1} (Error: {str(e)}) ---\\n"
+            pdf_reader = PyPDF2.PdfReader(source)
+            
+            # Extract metadata
+            if pdf_reader.metadata:
+                metadata = {
+                    'title': pdf_reader.metadata.get('/Title', ''),
+                    'author': pdf_reader.metadata.get('/Author', ''),
+                    'subject': pdf_reader.metadata.get('/Subject', ''),
+                    'creator': pdf_reader.metadata.get('/Creator', ''),
+                    'pages': len(pdf_reader.pages)
+                }
+            
+            # Extract text from all pages
+            for page_num, page in enumerate(pdf_reader.pages):
+                try:
+                    page_text = page.extract_text()
+                    parts.append(f"\\n--- Page {page_num + 1} ---\\n{page_text}\\n")
+                except Exception as e:
+                    parts.append(f"\\n--- Page {page_num + 1} (Error: {str(e)}) ---\\n")
             
             return {
-                "content": content.strip(),
+                "content": "".join(parts).strip(),
                 "metadata": metadata,
                 "format": "pdf"
             }
         except Exception as e:
             return {"error": f"Error parsing PDF: {str(e)}", "content": "", "metadata": {}}
     
-    def _parse_word(self, file_path: str) -> Dict[str, Any]:
-        """Parse Word document (.docx)."""
-        if Document is None:
-            return {"error": "python-docx not available for Word document parsing", "content": "", "metadata": {}}
+    def _parse_pdf_text(self, source: Source) -> Dict[str, Any]:
+        """
+        Text-only PDF parse: the page texts joined by newlines, without page
+        dividers or metadata, in a single pass on this thread.
+        """
+        pymupdf = _optional_module('pymupdf')
+        PyPDF2 = _optional_module('PyPDF2')
+        if pymupdf is None and PyPDF2 is None:
+            return {"error": "PyMuPDF or PyPDF2 not available for PDF parsing", "content": "", "metadata": {}}
         
         try:
-            doc = Document(file_path)
+            if pymupdf is not None:
+                document = source if isinstance(source, str) else source.read()
+                with _open_pdf(document) as doc:
+                    content = "\n".join(
+                        '' if _pdf_page_is_textless(doc, page) else page.get_text("text") for page in doc
+                    )
+            else:
+                content = "\n".join(page.extract_text() for page in PyPDF2.PdfReader(source).pages)
             
-            # Extract text content
-            content = ""
-            for paragraph in doc.paragraphs:
-                content += paragraph.text + "\\n"
+            return {
+                "content": content.strip(),
+                "metadata": {},
+                "format": "pdf"
+            }
+        except Exception as e:
+            return {"error": f"Error parsing PDF: {str(e)}", "content": "", "metadata": {}}
+    
+    def _parse_pdf_pymupdf(self, source: Source) -> Dict[str, Any]:
+        """
+        Parse PDF document with PyMuPDF, which extracts text in native code.
+        Long documents are split into page ranges extracted by worker
+        processes, since PyMuPDF documents cannot be shared across threads.
+        """
+        try:
+            document = source if isinstance(source, str) else source.read()
             
-            # Extract tables
-            for table in doc.tables:
-                content += "\\n--- Table ---\\n"
-                for row in table.rows:
-                    row_text = " | ".join([cell.text for cell in row.cells])
-                    content += row_text + "\\n"
-                content += "--- End Table ---\\n"
+            with _open_pdf(document) as doc:
+                # Extract metadata
+                info = doc.metadata or {}
+                page_count = doc.page_count
+                metadata = {
+                    'title': info.get('title', ''),
+                    'author': info.get('author', ''),
+                    'subject': info.get('subject', ''),
+                    'creator': info.get('creator', ''),
+                    'pages': page_count
+                }
+                
+                workers = min(PDF_MAX_WORKERS, os.cpu_count() or 1, page_count // PDF_PARALLEL_MIN_PAGES)
+                if workers <= 1:
+                    # Extract text from all pages
+                    content = "".join(_pdf_page_entry(doc, page_num) for page_num in range(page_count))
             
-            # Extract metadata
-            metadata = {
-                'title': doc.core_properties.title or '',
-                'author': doc.core_properties.author or '',
-                'subject': doc.core_properties.subject or '',
-                'created': str(doc.core_properties.created) if doc.core_properties.created else '',
-                'modified': str(doc.core_properties.modified) if doc.core_properties.modified else '',
-                'paragraphs': len(doc.paragraphs),
-                'tables': len(doc.tables)
+            if workers > 1:
+                size = -(-page_count // workers)
+                starts = range(0, page_count, size)
+                stops = [min(start + size, page_count) for start in starts]
+                ranges = _pdf_pool().map(_pdf_page_entries, itertools.repeat(document), starts, stops)
+                content = "".join(itertools.chain.from_iterable(ranges))
+            
+            return {
+                "content": content.strip(),
+                "metadata": metadata,
+                "format": "pdf"
             }
+        except Exception as e:
+            return {"error": f"Error parsing PDF: {str(e)}", "content": "", "metadata": {}}
+    
+    def _parse_word(self, source: Source) -> Dict[str, Any]:
+        """Parse Word document (.docx)."""
+        if _optional_module('lxml.etree') is None:
+            return {"error": "lxml not available for Word document parsing", "content": "", "metadata": {}}
+        
+        try:
+            content, metadata = _stream_docx(source)
             
             return {
                 "content": content.strip(),
@@ -169,35 +664,53 @@ class DocumentParser:
         except Exception as e:
             return {"error": f"Error parsing Word document: {str(e)}", "content": "", "metadata": {}}
     
-    def _parse_xml(self, file_path: str) -> Dict[str, Any]:
-        """Parse XML document."""
+    def _parse_xml(self, source: Source) -> Dict[str, Any]:
+        """
+        Parse XML document in a single streaming pass. Each element's line
+        keeps its place in document order but is only written once the
+        element has ended (its text is complete then); the element is cleared
+        right after, so finished subtrees are not kept in memory.
+        """
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            parts = []
+            # Indices in parts of the lines of the elements currently open
+            open_lines = []
+            # Indentation per nesting depth, built once per depth
+            indents = [""]
+            root_tag = None
+            attributes = {}
+            elements_count = 0
             
-            # Extract text content recursively
-            def extract_text(element, level=0):
-                text = ""
-                indent = "  " * level
+            for event, element in ET.iterparse(source, events=("start", "end")):
+                if event == "start":
+                    if root_tag is None:
+                        root_tag = element.tag
+                        attributes = dict(element.attrib)
+                    elements_count += 1
+                    open_lines.append(len(parts))
+                    parts.append(None)
+                    continue
                 
-                if element.text and element.text.strip():
-                    text += f"{indent}{element.tag}: {element.text.strip()}\\n"
+                index = open_lines.pop()
+                depth = len(open_lines)
+                while depth >= len(indents):
+                    indents.append(indents[-1] + "  ")
+                indent = indents[depth]
+                text = element.text.strip() if element.text else ""
+                if text:
+                    parts[index] = f"{indent}{element.tag}: {text}\\n"
                 elif element.tag:
-                    text += f"{indent}{element.tag}:\\n"
-                
-                for child in element:
-                    text += extract_text(child, level + 1)
-                
-                return text
+                    parts[index] = f"{indent}{element.tag}:\\n"
+                element.clear()
             
-            content = extract_text(root)
+            content = "".join(parts)
             
             # Extract metadata
             metadata = {
-                'root_tag': root.tag,
-                'namespace': root.tag.split('}')[0][1:] if '}' in root.tag else '',
-                'attributes': dict(root.attrib),
-                'elements_count': len(list(root.iter()))
+                'root_tag': root_tag,
+                'namespace': root_tag.split('}')[0][1:] if '}' in root_tag else '',
+                'attributes': attributes,
+                'elements_count': elements_count
             }
             
             return {
@@ -208,28 +721,25 @@ class DocumentParser:
         except Exception as e:
             return {"error": f"Error parsing XML: {str(e)}", "content": "", "metadata": {}}
     
-    def _parse_markdown(self, file_path: str) -> Dict[str, Any]:
+    def _parse_markdown(self, source: Source) -> Dict[str, Any]:
         """Parse Markdown document."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            content = _read_text(source)
             
             # Extract metadata (if markdown has front matter)
             metadata = {}
             if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
+                end = content.find('---', 3)
+                if end != -1:
                     # Parse YAML front matter (basic parsing)
-                    front_matter = parts[1].strip()
-                    for line in front_matter.split('\\n'):
+                    for line in content[3:end].strip().split('\n'):
                         if ':' in line:
                             key, value = line.split(':', 1)
                             metadata[key.strip()] = value.strip()
-                    content = parts[2].strip()
+                    content = content[end + 3:].strip()
             
             # Extract headers for structure
-            headers = re.findall(r'^(#{1,6})\\s+(.+)$', content, re.MULTILINE)
-            metadata['headers'] = [{'level': len(h[0]), 'text': h[1]} for h in headers]
+            metadata['headers'] = _markdown_headers(content)
             metadata['format'] = 'markdown'
             
             return {
@@ -240,17 +750,16 @@ class DocumentParser:
         except Exception as e:
             return {"error": f"Error parsing Markdown: {str(e)}", "content": "", "metadata": {}}
     
-    def _parse_text(self, file_path: str) -> Dict[str, Any]:
+    def _parse_text(self, source: Source) -> Dict[str, Any]:
         """Parse plain text document."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            content = _read_text(source)
             
             # Basic metadata
             metadata = {
-                'lines': len(content.split('\\n')),
+                'lines': content.count('\\n') + 1,
                 'characters': len(content),
-                'words': len(content.split()),
+                'words': _count_words(content),
                 'format': 'text'
             }
             
@@ -268,24 +777,14 @@ class DocumentParser:
         """
         sections = []
         
-        # Common requirement section patterns
-        patterns = [
-            r'(?i)(?:^|\n)(\d+\.?\d*\.?\d*)\s+(.*?)(?=\n\d+\.|\n[A-Z][A-Z\s]+:|\Z)',
-            r'(?i)(?:^|\n)(REQ-?\d+)\s+(.*?)(?=\nREQ-?\d+|\n[A-Z][A-Z\s]+:|\Z)',
-            r'(?i)(?:^|\n)([A-Z]{2,}-\d+)\s+(.*?)(?=\n[A-Z]{2,}-\d+|\n[A-Z][A-Z\s]+:|\Z)',
-            r'(?i)(?:^|\n)(requirement\s+\d+)\s*:?\s*(.*?)(?=\nrequirement\s+\d+|\n[A-Z][A-Z\s]+:|\Z)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.DOTALL | re.MULTILINE)
-            for match in matches:
-                if len(match) == 2:
-                    req_id, req_text = match
-                    sections.append({
-                        'id': req_id.strip(),
-                        'text': req_text.strip()[:1000],  # Limit text length
-                        'type': 'requirement'
-                    })
+        for pattern in REQUIREMENT_SECTION_PATTERNS:
+            for match in pattern.finditer(content):
+                start, end = match.span(2)
+                sections.append({
+                    'id': match.group(1).strip(),
+                    'text': _clip_section_text(content, start, end),
+                    'type': 'requirement'
+                })
         
         # If no structured requirements found, split by paragraphs
         if not sections:
@@ -302,8 +801,7 @@ class DocumentParser:
     
     def is_supported_format(self, filename: str) -> bool:
         """Check if the file format is supported."""
-        file_extension = Path(filename).suffix.lower()
-        return file_extension in self.supported_formats
+        return _file_extension(filename) in self._supported_set
     
     def get_supported_formats(self) -> List[str]:
         """Get list of supported file formats."""
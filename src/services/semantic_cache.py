@@ -0,0 +1,76 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+import numpy as np
+
+
+def _normalize(embedding: List[float]) -> np.ndarray:
+    vector = np.asarray(embedding, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class SemanticCache:
+    """
+    Response cache keyed by meaning rather than exact text: a lookup returns the
+    stored response of the nearest previous input when its embedding's cosine
+    similarity reaches the threshold.
+
+    Entries are persisted in SQLite. Each namespace (one per task, model and
+    prompt) is loaded into memory once as a matrix of unit vectors, so a
+    lookup is a single matrix-vector product. Entries written by other
+    processes are picked up on their next start.
+    """
+
+    def __init__(self, path: str, threshold: float):
+        self.threshold = threshold
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'namespace TEXT NOT NULL, embedding BLOB NOT NULL, content TEXT NOT NULL, expires_at REAL NOT NULL)'
+        )
+        self.db.execute('CREATE INDEX IF NOT EXISTS ix_entries_namespace ON entries (namespace)')
+        self.db.execute('DELETE FROM entries WHERE expires_at <= ?', (time.time(),))
+        self.db.commit()
+        # namespace -> [matrix of unit embeddings, contents, expiry times]
+        self.indexes = {}
+
+    def _index(self, namespace: str) -> list:
+        index = self.indexes.get(namespace)
+        if index is None:
+            rows = self.db.execute(
+                'SELECT embedding, content, expires_at FROM entries WHERE namespace = ? AND expires_at > ?',
+                (namespace, time.time())
+            ).fetchall()
+            matrix = np.vstack([np.frombuffer(row[0], dtype=np.float32) for row in rows]) if rows else None
+            index = self.indexes[namespace] = [matrix, [row[1] for row in rows], [row[2] for row in rows]]
+        return index
+
+    def lookup(self, namespace: str, embedding: List[float]) -> Optional[str]:
+        vector = _normalize(embedding)
+        with self.lock:
+            matrix, contents, expires = self._index(namespace)
+            if matrix is None:
+                return None
+            scores = matrix @ vector
+            best = int(scores.argmax())
+            if scores[best] >= self.threshold and expires[best] > time.time():
+                return contents[best]
+        return None
+
+    def add(self, namespace: str, embedding: List[float], content: str, ttl: float):
+        vector = _normalize(embedding)
+        expires_at = time.time() + ttl
+        with self.lock:
+            index = self._index(namespace)
+            self.db.execute(
+                'INSERT INTO entries (namespace, embedding, content, expires_at) VALUES (?, ?, ?, ?)',
+                (namespace, vector.tobytes(), content, expires_at)
+            )
+            self.db.commit()
+            index[0] = vector[np.newaxis, :] if index[0] is None else np.vstack([index[0], vector])
+            index[1].append(content)
+            index[2].append(expires_at)
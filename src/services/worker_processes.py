@@ -0,0 +1,16 @@
+import multiprocessing
+
+# Modules whose functions run in worker processes (compliance report chunks,
+# PDF page ranges). The fork server imports them once, so every worker it
+# forks starts with them loaded, and it never imports the app's __main__
+WORKER_MODULES = ['src.services.compliance_engine', 'src.services.document_parser']
+
+# Worker processes are started by a fork server (or spawned), never forked
+# from the web process: by then it runs logging, AI and DB pool threads whose
+# locks a forked child could inherit held. The preload list is process-wide,
+# so it is set here once for every pool
+WORKER_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+if WORKER_CONTEXT.get_start_method() == 'forkserver':
+    WORKER_CONTEXT.set_forkserver_preload(WORKER_MODULES)
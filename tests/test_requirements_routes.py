@@ -0,0 +1,59 @@
+import unittest
+from unittest import mock
+from flask import Flask
+from src.models.requirement import db, Requirement, TestCase
+from src.routes import requirements as requirements_routes
+
+
+class FakeAIProcessor:
+    """Returns the same model-numbered cases (TC-001, TC-002) for every requirement."""
+
+    def generate_test_cases_batch(self, requirements):
+        return {
+            requirement['requirement_id']: [
+                {'test_case_id': 'TC-001', 'title': 'First'},
+                {'test_case_id': 'TC-002', 'title': 'Second'}
+            ]
+            for requirement in requirements
+        }
+
+
+class GenerateTestCasesBulkTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        db.init_app(self.app)
+        self.app.register_blueprint(requirements_routes.requirements_bp, url_prefix='/api')
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        for label in ('REQ-001', 'REQ-002'):
+            db.session.add(Requirement(
+                requirement_id=label, title=label, description='The system shall log access.',
+                type='functional', priority='high'
+            ))
+        db.session.commit()
+        patcher = mock.patch.object(requirements_routes, 'get_ai_processor', return_value=FakeAIProcessor())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_saves_cases_for_two_requirements_with_distinct_ids(self):
+        client = self.app.test_client()
+        for _ in range(2):
+            response = client.post('/api/requirements/generate-tests-bulk', json={'req_ids': [1, 2]})
+            self.assertEqual(response.status_code, 200, response.get_json())
+
+        test_case_ids = sorted(db.session.scalars(db.select(TestCase.test_case_id)))
+        self.assertEqual(test_case_ids, [
+            'TC-REQ-001-001', 'TC-REQ-001-002', 'TC-REQ-001-003', 'TC-REQ-001-004',
+            'TC-REQ-002-001', 'TC-REQ-002-002', 'TC-REQ-002-003', 'TC-REQ-002-004'
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()